@@ -23,6 +23,8 @@ class TokenBucketRateLimiter:
     - Each request consumes one token
     - If no tokens are available, the request waits
     - Bucket has a maximum capacity (burst_size) to allow short bursts
+    - A caller that backs off after a 429/5xx can pause() the bucket for its
+      retry delay, so concurrent threads don't each hit the limit meanwhile
 
     This is the base class for API-specific rate limiters. Subclasses can override
     `update_from_response()` to handle API-specific rate limit headers.
@@ -63,13 +65,16 @@ class TokenBucketRateLimiter:
         self._last_update = time.monotonic()
         self._lock = threading.Lock()
 
+        # Monotonic time before which no tokens are handed out (see pause())
+        self._paused_until = 0.0
+
         # Statistics
         self._total_requests = 0
         self._total_wait_time = 0.0
 
         self.logger = logging.getLogger(logger_name or self.__class__.__name__)
 
-    def acquire(self, timeout: float | None = None) -> bool:
+    def acquire(self, timeout: float | None = None, *, ignore_pause: bool = False) -> bool:
         """
         Acquire a token, waiting if necessary.
 
@@ -77,6 +82,8 @@ class TokenBucketRateLimiter:
 
         Args:
             timeout: Maximum time to wait in seconds. None means wait forever.
+            ignore_pause: Skip any pause() in effect. For the caller that set
+                the pause and has already slept through its own retry delay.
 
         Returns:
             True if token was acquired, False if timeout was reached.
@@ -86,15 +93,19 @@ class TokenBucketRateLimiter:
         while True:
             with self._lock:
                 self._refill_tokens()
+                paused_for = 0.0 if ignore_pause else self._paused_until - time.monotonic()
 
-                if self._tokens >= 1.0:
+                if paused_for > 0:
+                    # Another caller is backing off; wait it out instead of retrying
+                    wait_time = paused_for
+                elif self._tokens >= 1.0:
                     self._tokens -= 1.0
                     self._total_requests += 1
                     return True
-
-                # Calculate wait time until next token
-                tokens_needed = 1.0 - self._tokens
-                wait_time = tokens_needed / self.requests_per_second
+                else:
+                    # Calculate wait time until next token
+                    tokens_needed = 1.0 - self._tokens
+                    wait_time = tokens_needed / self.requests_per_second
 
             # Check timeout
             if timeout is not None:
@@ -133,13 +144,27 @@ class TokenBucketRateLimiter:
         with self._lock:
             self._refill_tokens()
 
-            if self._tokens >= 1.0:
+            if self._tokens >= 1.0 and time.monotonic() >= self._paused_until:
                 self._tokens -= 1.0
                 self._total_requests += 1
                 return True
 
             return False
 
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back acquire() and try_acquire() for every caller.
+
+        Called by a client that is about to sleep before retrying a rate
+        limited or failed request, with that same retry delay, so other
+        threads wait alongside it instead of hitting the limit themselves.
+
+        Args:
+            seconds: How long to pause, from now. An existing longer pause is kept.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
     @property
     def available_tokens(self) -> float:
         """Get the current number of available tokens."""
@@ -208,6 +233,7 @@ class TokenBucketRateLimiter:
         """Reset the rate limiter to initial state."""
         with self._lock:
             self._tokens = float(self.burst_size)
+            self._paused_until = 0.0
             self._last_update = time.monotonic()
             self._total_requests = 0
             self._total_wait_time = 0.0
@@ -275,7 +301,7 @@ class GitHubRateLimiter(TokenBucketRateLimiter):
         self._rate_limit_remaining: int | None = None
         self._rate_limit_reset: float | None = None
 
-    def acquire(self, timeout: float | None = None) -> bool:
+    def acquire(self, timeout: float | None = None, *, ignore_pause: bool = False) -> bool:
         """
         Acquire a token, waiting if necessary.
 
@@ -283,6 +309,8 @@ class GitHubRateLimiter(TokenBucketRateLimiter):
 
         Args:
             timeout: Maximum time to wait in seconds.
+            ignore_pause: Skip any pause() in effect. For the caller that set
+                the pause and has already slept through its own retry delay.
 
         Returns:
             True if token was acquired, False if timeout was reached.
@@ -309,14 +337,19 @@ class GitHubRateLimiter(TokenBucketRateLimiter):
                             self._lock.acquire()
                         continue
 
-                if self._tokens >= 1.0:
+                paused_for = 0.0 if ignore_pause else self._paused_until - time.monotonic()
+
+                if paused_for > 0:
+                    # Another caller is backing off; wait it out instead of retrying
+                    wait_time = paused_for
+                elif self._tokens >= 1.0:
                     self._tokens -= 1.0
                     self._total_requests += 1
                     return True
-
-                # Calculate wait time until next token
-                tokens_needed = 1.0 - self._tokens
-                wait_time = tokens_needed / self.requests_per_second
+                else:
+                    # Calculate wait time until next token
+                    tokens_needed = 1.0 - self._tokens
+                    wait_time = tokens_needed / self.requests_per_second
 
             # Check timeout
             if timeout is not None:
@@ -135,6 +135,8 @@ class FileConfigProvider(ConfigProviderPort):
             api_token=self._get_nested("jira.api_token", ""),
             project_key=self._get_nested("jira.project", None),
             story_points_field=self._get_nested("jira.story_points_field", "customfield_10014"),
+            max_concurrent_requests=int(self._get_nested("jira.max_concurrent_requests", 10)),
+            description_cache_dir=self._get_nested("jira.description_cache_dir", None),
         )
 
         sync = SyncConfig(
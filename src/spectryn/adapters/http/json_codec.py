@@ -0,0 +1,52 @@
+"""
+JSON Codec - Fast JSON (de)serialization for HTTP payloads.
+
+Uses orjson when it is installed and falls back to the standard library
+``json`` module otherwise. orjson works on bytes directly, which avoids
+decoding large response bodies to ``str`` before parsing them.
+"""
+
+import json
+from typing import Any
+
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        Compact JSON document as bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as bytes or str.
+
+    Returns:
+        The parsed Python object.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -8,6 +8,7 @@ import logging
 import re
 from typing import Any
 
+from spectryn.adapters.cache import FileCache
 from spectryn.adapters.formatters.adf import ADFFormatter
 from spectryn.core.constants import IssueType, JiraField
 from spectryn.core.domain.value_objects import CommitRef
@@ -34,6 +35,16 @@ class JiraAdapter(IssueTrackerPort):
     # Default Jira field IDs (can be overridden)
     STORY_POINTS_FIELD = "customfield_10014"
 
+    # Issue keys per "key in (...)" JQL query, keeps the query string bounded
+    BULK_FETCH_CHUNK_SIZE = 100
+
+    # Sync runs up to three phase groups at once, each with its own request fan-out
+    CONCURRENT_REQUEST_GROUPS = 3
+
+    # Seconds a persisted description is kept; entries are keyed by the
+    # issue's updated timestamp, so this only bounds the cache's size
+    DESCRIPTION_CACHE_TTL = 7 * 24 * 3600.0
+
     # Workflow transitions (varies by project)
     DEFAULT_TRANSITIONS = {
         "Analyze": {"to_open": "7"},
@@ -41,6 +52,23 @@ class JiraAdapter(IssueTrackerPort):
         "In Progress": {"to_resolved": "5", "to_open": "301"},
     }
 
+    # Transition paths as (from_status, transition_id, resolution) steps, keyed
+    # by the keyword matched against the target status (checked in order)
+    _RESOLVE_PATH: tuple[tuple[str, str, str | None], ...] = (
+        ("Analyze", "7", None),
+        ("Open", "4", None),
+        ("In Progress", "5", "Done"),
+    )
+    TRANSITION_PATHS: dict[str, tuple[tuple[str, str, str | None], ...]] = {
+        "resolved": _RESOLVE_PATH,
+        "done": _RESOLVE_PATH,
+        "progress": (
+            ("Analyze", "7", None),
+            ("Open", "4", None),
+        ),
+        "open": (("Analyze", "7", None),),
+    }
+
     def __init__(
         self,
         config: TrackerConfig,
@@ -60,16 +88,30 @@ class JiraAdapter(IssueTrackerPort):
         self.formatter = formatter or ADFFormatter()
         self.logger = logging.getLogger("JiraAdapter")
 
+        # ADF for blank text is always the same document, so build it once
+        self._empty_adf = self.formatter.format_text("")
+
+        # Keep enough keep-alive connections that concurrent requests reuse
+        # sockets instead of overflowing the pool and re-doing TLS handshakes
         self._client = JiraApiClient(
             base_url=config.url,
             email=config.email,
             api_token=config.api_token,
             dry_run=dry_run,
+            pool_maxsize=config.max_concurrent_requests * self.CONCURRENT_REQUEST_GROUPS,
         )
 
         # Initialize batch client for bulk operations
         self._batch_client = JiraBatchClient(self._client)
 
+        # Descriptions dominate epic child payloads; persist them across runs
+        self._description_cache: FileCache | None = None
+        if config.description_cache_dir:
+            self._description_cache = FileCache(
+                cache_dir=config.description_cache_dir,
+                default_ttl=self.DESCRIPTION_CACHE_TTL,
+            )
+
         if config.story_points_field:
             self.STORY_POINTS_FIELD = config.story_points_field
 
@@ -95,29 +137,122 @@ class JiraAdapter(IssueTrackerPort):
     def get_current_user(self) -> dict[str, Any]:
         return self._client.get_myself()
 
-    def get_issue(self, issue_key: str) -> IssueData:
-        fields = ",".join(JiraField.ISSUE_WITH_SUBTASKS)
-        data = self._client.get(f"issue/{issue_key}", params={JiraField.FIELDS: fields})
+    def get_issue(
+        self,
+        issue_key: str,
+        fields: tuple[str, ...] = JiraField.ISSUE_WITH_SUBTASKS,
+    ) -> IssueData:
+        data = self._client.get(f"issue/{issue_key}", params={JiraField.FIELDS: ",".join(fields)})
         return self._parse_issue(data)
 
+    def get_issue_light(self, issue_key: str) -> IssueData:
+        """Get an issue without its ADF description, which dominates response size."""
+        return self.get_issue(issue_key, fields=JiraField.LIGHT_FIELDS)
+
     def get_epic_children(self, epic_key: str) -> list[IssueData]:
         jql = f"{JiraField.PARENT} = {epic_key} ORDER BY {JiraField.KEY} ASC"
-        data = self._client.search_jql(jql, list(JiraField.ISSUE_WITH_SUBTASKS))
+        if self._description_cache is None:
+            issues = self._client.search_jql_all(jql, list(JiraField.ISSUE_WITH_SUBTASKS))
+        else:
+            # Everything but descriptions, which come from the cache when unchanged
+            fields = [f for f in JiraField.ISSUE_WITH_SUBTASKS if f != JiraField.DESCRIPTION]
+            issues = self._client.search_jql_all(jql, [*fields, JiraField.UPDATED])
+            self._fill_descriptions(issues, self._description_cache)
 
-        return [self._parse_issue(issue) for issue in data.get("issues", [])]
+        return [self._parse_issue(issue) for issue in issues]
+
+    def _fill_descriptions(self, issues: list[dict[str, Any]], cache: FileCache) -> None:
+        """
+        Set the description of issues fetched without one, in place.
+
+        Descriptions are cached under the issue's updated timestamp, which
+        changes with every edit. Only cache misses are fetched, with
+        "key in (...)" searches.
+        """
+        missing: dict[str, dict[str, Any]] = {}
+        for issue in issues:
+            fields = issue.setdefault(JiraField.FIELDS, {})
+            cached = None
+            if fields.get(JiraField.UPDATED):
+                cached = cache.get(self._description_cache_key(issue[JiraField.KEY], fields))
+            if cached is None:
+                missing[issue[JiraField.KEY]] = fields
+            else:
+                fields[JiraField.DESCRIPTION] = cached[JiraField.DESCRIPTION]
+
+        keys = list(missing)
+        for start in range(0, len(keys), self.BULK_FETCH_CHUNK_SIZE):
+            chunk = keys[start : start + self.BULK_FETCH_CHUNK_SIZE]
+            jql = f"{JiraField.KEY} in ({', '.join(chunk)})"
+            for issue in self._client.search_jql_all(jql, [JiraField.DESCRIPTION]):
+                fields = missing.get(issue[JiraField.KEY])
+                if fields is None:
+                    continue
+                description = issue.get(JiraField.FIELDS, {}).get(JiraField.DESCRIPTION)
+                fields[JiraField.DESCRIPTION] = description
+                if fields.get(JiraField.UPDATED):
+                    cache.set(
+                        self._description_cache_key(issue[JiraField.KEY], fields),
+                        {JiraField.DESCRIPTION: description},
+                    )
+
+    @staticmethod
+    def _description_cache_key(issue_key: str, fields: dict[str, Any]) -> str:
+        """Cache key of an issue's description at its current revision."""
+        return f"jira:description:{issue_key}:{fields.get(JiraField.UPDATED)}"
 
     def get_issue_comments(self, issue_key: str) -> list[dict]:
         data = self._client.get(f"issue/{issue_key}/comment")
         return data.get("comments", [])
 
     def get_issue_status(self, issue_key: str) -> str:
-        data = self._client.get(f"issue/{issue_key}", params={JiraField.FIELDS: JiraField.STATUS})
+        # Hot path (polled throughout transition_issue), so skip the requests layer
+        data = self._client.raw_get(
+            f"issue/{issue_key}", params={JiraField.FIELDS: JiraField.STATUS}
+        )
         return data[JiraField.FIELDS][JiraField.STATUS][JiraField.NAME]
 
     def search_issues(self, query: str, max_results: int = 50) -> list[IssueData]:
         data = self._client.search_jql(query, list(JiraField.BASIC_FIELDS), max_results=max_results)
         return [self._parse_issue(issue) for issue in data.get("issues", [])]
 
+    def get_issues_bulk(
+        self, issue_keys: list[str], *, light: bool = False
+    ) -> dict[str, IssueData]:
+        """
+        Fetch several issues with subtasks using "key in (...)" JQL searches.
+
+        Replaces one GET per issue with one search per BULK_FETCH_CHUNK_SIZE keys.
+        """
+        fields = list(JiraField.LIGHT_FIELDS if light else JiraField.ISSUE_WITH_SUBTASKS)
+        issues: dict[str, IssueData] = {}
+        for start in range(0, len(issue_keys), self.BULK_FETCH_CHUNK_SIZE):
+            chunk = issue_keys[start : start + self.BULK_FETCH_CHUNK_SIZE]
+            jql = f"{JiraField.KEY} in ({', '.join(chunk)})"
+            for data in self._client.search_jql_all(jql, fields):
+                issue = self._parse_issue(data)
+                issues[issue.key] = issue
+        return issues
+
+    def get_epic_updated(self, epic_key: str) -> str | None:
+        """Marker from the child count and latest child update, via a one-result search."""
+        jql = f"{JiraField.PARENT} = {epic_key} ORDER BY {JiraField.UPDATED} DESC"
+        data = self._client.search_jql(jql, [JiraField.UPDATED], max_results=1)
+        issues = data.get("issues", [])
+        latest = issues[0][JiraField.FIELDS].get(JiraField.UPDATED, "") if issues else ""
+        return f"{data.get('total', len(issues))}:{latest}"
+
+    def get_issue_comments_bulk(self, issue_keys: list[str]) -> dict[str, list[dict]]:
+        """Fetch comments for several issues via "key in (...)" JQL with fields=comment."""
+        comments: dict[str, list[dict]] = {}
+        for start in range(0, len(issue_keys), self.BULK_FETCH_CHUNK_SIZE):
+            chunk = issue_keys[start : start + self.BULK_FETCH_CHUNK_SIZE]
+            jql = f"{JiraField.KEY} in ({', '.join(chunk)})"
+            for data in self._client.search_jql_all(jql, [JiraField.COMMENT]):
+                comment_field = data.get(JiraField.FIELDS, {}).get(JiraField.COMMENT) or {}
+                comments[data[JiraField.KEY]] = comment_field.get("comments", [])
+        return comments
+
     # -------------------------------------------------------------------------
     # IssueTrackerPort Implementation - Write Operations
     # -------------------------------------------------------------------------
@@ -127,9 +262,7 @@ class JiraAdapter(IssueTrackerPort):
             self.logger.info(f"[DRY-RUN] Would update description for {issue_key}")
             return True
 
-        # Convert to ADF if string
-        if isinstance(description, str):
-            description = self.formatter.format_text(description)
+        description = self._to_adf(description)
 
         self._client.put(
             f"issue/{issue_key}", json={JiraField.FIELDS: {JiraField.DESCRIPTION: description}}
@@ -253,9 +386,7 @@ class JiraAdapter(IssueTrackerPort):
             with contextlib.suppress(Exception):
                 assignee = self._client.get_current_user_id()
 
-        # Convert description to ADF if string
-        if isinstance(description, str):
-            description = self.formatter.format_text(description)
+        description = self._to_adf(description)
 
         fields: dict[str, Any] = {
             JiraField.PROJECT: {JiraField.KEY: project_key},
@@ -306,15 +437,92 @@ class JiraAdapter(IssueTrackerPort):
         if assignee is None:
             assignee = self._client.get_current_user_id()
 
-        # Convert description to ADF if string
-        if isinstance(description, str):
-            description = self.formatter.format_text(description)
+        fields = self._subtask_fields(
+            parent_key,
+            summary=summary,
+            description=description,
+            project_key=project_key,
+            story_points=story_points,
+            assignee=assignee,
+            priority=priority,
+        )
+
+        result = self._client.post("issue", json={"fields": fields})
+        new_key = result.get("key")
 
+        if new_key:
+            self.logger.info(f"Created subtask {new_key} under {parent_key}")
+
+        return new_key
+
+    def create_subtasks_bulk(
+        self, subtasks: list[dict[str, Any]]
+    ) -> list[str | IssueTrackerError | None]:
+        """
+        Create subtasks through the bulk create API, 50 issues per request.
+        """
+        if self._dry_run:
+            for subtask in subtasks:
+                self.logger.info(
+                    f"[DRY-RUN] Would create subtask '{subtask['summary'][:50]}...' "
+                    f"under {subtask['parent_key']}"
+                )
+            return [None] * len(subtasks)
+
+        current_user: str | None = None
+        issues: list[dict[str, Any]] = []
+        for subtask in subtasks:
+            assignee = subtask.get("assignee")
+            if assignee is None:
+                # Look the current user up once for the whole batch
+                if current_user is None:
+                    current_user = self._client.get_current_user_id()
+                assignee = current_user
+
+            fields = self._subtask_fields(
+                subtask["parent_key"],
+                summary=subtask["summary"],
+                description=subtask.get("description"),
+                project_key=subtask["project_key"],
+                story_points=subtask.get("story_points"),
+                assignee=assignee,
+                priority=subtask.get("priority"),
+            )
+            issues.append({"fields": fields})
+
+        batch_result = self._batch_client.bulk_create_issues(issues)
+
+        keys: list[str | IssueTrackerError | None] = [None] * len(subtasks)
+        for op in batch_result.operations:
+            if op.success and op.key:
+                keys[op.index] = op.key
+            else:
+                parent_key = subtasks[op.index]["parent_key"]
+                error = IssueTrackerError(
+                    f"Failed to create subtask under {parent_key}: {op.error}",
+                    issue_key=parent_key,
+                )
+                self.logger.error(str(error))
+                keys[op.index] = error
+        return keys
+
+    def _subtask_fields(
+        self,
+        parent_key: str,
+        *,
+        summary: str,
+        description: Any,
+        project_key: str,
+        story_points: int | None,
+        assignee: str | None,
+        priority: str | None,
+    ) -> dict[str, Any]:
+        """Build the create fields of a subtask."""
         fields: dict[str, Any] = {
             JiraField.PROJECT: {JiraField.KEY: project_key},
             JiraField.PARENT: {JiraField.KEY: parent_key},
             JiraField.SUMMARY: summary[:255],
-            JiraField.DESCRIPTION: description,
+            JiraField.DESCRIPTION: self._to_adf(description),
             JiraField.ISSUETYPE: {JiraField.NAME: IssueType.JIRA_SUBTASK},
             JiraField.ASSIGNEE: {JiraField.ACCOUNT_ID: assignee},
         }
@@ -325,13 +533,7 @@ class JiraAdapter(IssueTrackerPort):
         if priority is not None:
             fields[JiraField.PRIORITY] = {JiraField.NAME: priority}
 
-        result = self._client.post("issue", json={"fields": fields})
-        new_key = result.get("key")
-
-        if new_key:
-            self.logger.info(f"Created subtask {new_key} under {parent_key}")
-
-        return new_key
+        return fields
 
     def update_subtask(
         self,
@@ -341,8 +543,9 @@ class JiraAdapter(IssueTrackerPort):
         assignee: str | None = None,
         priority_id: str | None = None,
     ) -> bool:
-        # Get current values to compare
-        current = self.get_subtask_details(issue_key)
+        # Get current values to compare (description is always overwritten,
+        # so don't pay for fetching it)
+        current = self.get_subtask_details(issue_key, include_description=False)
         current_points = current.get("story_points")
         current_priority = current.get("priority")
 
@@ -358,8 +561,7 @@ class JiraAdapter(IssueTrackerPort):
         fields: dict[str, Any] = {}
 
         if description is not None:
-            if isinstance(description, str):
-                description = self.formatter.format_text(description)
+            description = self._to_adf(description)
             # Always update description (hard to compare ADF)
             fields["description"] = description
             changes.append("description")
@@ -405,8 +607,7 @@ class JiraAdapter(IssueTrackerPort):
             self.logger.info(f"[DRY-RUN] Would add comment to {issue_key}")
             return True
 
-        if isinstance(body, str):
-            body = self.formatter.format_text(body)
+        body = self._to_adf(body)
 
         self._client.post(f"issue/{issue_key}/comment", json={"body": body})
         self.logger.info(f"Added comment to {issue_key}")
@@ -424,20 +625,11 @@ class JiraAdapter(IssueTrackerPort):
         # Get transition path
         target_lower = target_status.lower()
 
-        if "resolved" in target_lower or "done" in target_lower:
-            path = [
-                ("Analyze", "7", None),
-                ("Open", "4", None),
-                ("In Progress", "5", "Done"),
-            ]
-        elif "progress" in target_lower:
-            path = [
-                ("Analyze", "7", None),
-                ("Open", "4", None),
-            ]
-        elif "open" in target_lower:
-            path = [("Analyze", "7", None)]
-        else:
+        path = next(
+            (p for keyword, p in self.TRANSITION_PATHS.items() if keyword in target_lower),
+            None,
+        )
+        if path is None:
             self.logger.warning(f"Unknown target status: {target_status}")
             return False
 
@@ -483,6 +675,19 @@ class JiraAdapter(IssueTrackerPort):
     # Private Methods
     # -------------------------------------------------------------------------
 
+    def _to_adf(self, value: Any) -> Any:
+        """
+        Convert markdown text to ADF, passing through values that already are.
+
+        None and ADF dicts are returned unchanged, and blank text maps to the
+        prebuilt empty document without running the markdown parser.
+        """
+        if not isinstance(value, str):
+            return value
+        if not value or value.isspace():
+            return self._empty_adf
+        return self.formatter.format_text(value)
+
     def _parse_issue(self, data: dict) -> IssueData:
         """Parse Jira API response into IssueData."""
         fields = data.get(JiraField.FIELDS, {})
@@ -627,12 +832,22 @@ class JiraAdapter(IssueTrackerPort):
         adf = self.formatter.format_commits_table(commits)
         return self.add_comment(issue_key, adf)
 
-    def get_subtask_details(self, issue_key: str) -> dict[str, Any]:
-        """Get full details of a subtask."""
+    def get_subtask_details(
+        self, issue_key: str, include_description: bool = True
+    ) -> dict[str, Any]:
+        """
+        Get full details of a subtask.
+
+        Args:
+            issue_key: Subtask key.
+            include_description: If False, skip fetching the ADF description
+                (returned as None) to reduce response size.
+        """
+        description = "description," if include_description else ""
         data = self._client.get(
             f"issue/{issue_key}",
             params={
-                "fields": f"summary,description,assignee,status,priority,{self.STORY_POINTS_FIELD}"
+                "fields": f"summary,{description}assignee,status,priority,{self.STORY_POINTS_FIELD}"
             },
         )
 
@@ -970,6 +1185,7 @@ class JiraAdapter(IssueTrackerPort):
             config=self.config,
             dry_run=self._dry_run,
             formatter=self.formatter,
+            concurrency=self.config.max_concurrent_requests,
         )
 
     # -------------------------------------------------------------------------
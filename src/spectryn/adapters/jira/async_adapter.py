@@ -20,7 +20,7 @@ from typing import Any
 from spectryn.core.constants import IssueType, JiraField
 from spectryn.core.ports.async_tracker import AsyncIssueTrackerPort
 from spectryn.core.ports.config_provider import TrackerConfig
-from spectryn.core.ports.issue_tracker import IssueData
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerError
 
 
 try:
@@ -135,6 +135,35 @@ class AsyncJiraAdapter(AsyncIssueTrackerPort):
 
         return [self._parse_issue(issue) for issue in data.get("issues", [])]
 
+    async def get_epic_children_parallel(self, epic_key: str) -> list[IssueData]:
+        """
+        Fetch all children of an epic by fanning out per-issue GETs.
+
+        Lists child keys with a single lightweight JQL query, then fetches
+        each child concurrently (bounded by the adapter's concurrency).
+        Suited to very large epics where one paged search is slow.
+
+        Raises:
+            IssueTrackerError: If any child issue could not be fetched.
+        """
+        client = self._ensure_connected()
+
+        jql = f"{JiraField.PARENT} = {epic_key} ORDER BY {JiraField.KEY} ASC"
+        keys = [issue[JiraField.KEY] for issue in await client.search_all_jql(jql, [JiraField.KEY])]
+
+        result = await client.get_issues_parallel(
+            keys, fields=list(JiraField.ISSUE_WITH_SUBTASKS), concurrency=self._concurrency
+        )
+        if result.errors:
+            index, error = result.errors[0]
+            raise IssueTrackerError(
+                f"Failed to fetch {result.failed} of {result.total} children of {epic_key}",
+                issue_key=keys[index],
+                cause=error,
+            )
+
+        return [self._parse_issue(issue) for issue in result.results]
+
     async def search_issues_async(self, query: str, max_results: int = 50) -> list[IssueData]:
         """Search for issues asynchronously."""
         client = self._ensure_connected()
@@ -196,8 +196,7 @@ class CachedJiraApiClient(JiraApiClient):
 
         def fetch() -> list[dict[str, Any]]:
             jql = f"parent = {epic_key} ORDER BY key ASC"
-            result = self.search_jql(jql, fields)
-            return result.get("issues", [])
+            return self.search_jql_all(jql, fields)
 
         return self._cache.get_or_fetch_epic_children(
             epic_key=epic_key,
@@ -221,8 +220,12 @@ class CachedJiraApiClient(JiraApiClient):
         jql: str,
         fields: list[str],
         max_results: int = 100,
+        start_at: int = 0,
     ) -> dict[str, Any]:
-        """Execute JQL search (cached)."""
+        """Execute JQL search (cached; only the first page is cached)."""
+        if start_at:
+            return super().search_jql(jql, fields, max_results, start_at=start_at)
+
         cached = self._cache.get_search(jql, max_results)
         if cached is not None:
             return cached
@@ -5,11 +5,18 @@ This handles the raw HTTP communication with Jira.
 The JiraAdapter uses this to implement the IssueTrackerPort.
 """
 
+import hashlib
 import logging
+import threading
 import time
-from typing import Any
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, ClassVar
 
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
 
 from spectryn.adapters.async_base import (
@@ -18,6 +25,7 @@ from spectryn.adapters.async_base import (
     calculate_delay,
     get_retry_after,
 )
+from spectryn.adapters.http import json_codec
 from spectryn.core.constants import ContentType, HttpHeader
 from spectryn.core.ports.issue_tracker import (
     AuthenticationError,
@@ -62,6 +70,20 @@ class JiraApiClient:
     DEFAULT_POOL_BLOCK = False  # Don't block when pool is exhausted
     DEFAULT_TIMEOUT = 30.0  # Request timeout in seconds
 
+    # Default search pagination configuration
+    DEFAULT_SEARCH_PAGE_SIZE = 100  # Jira's maximum page size
+    DEFAULT_SEARCH_WORKERS = 5  # Pages fetched concurrently
+
+    # Max GET responses remembered for conditional requests (If-None-Match)
+    DEFAULT_ETAG_CACHE_SIZE = 256
+
+    # Sessions shared across client instances, keyed by site, a digest of the
+    # credentials and pool settings, so multiple adapters for the same Jira site
+    # reuse one connection pool instead of each paying for new TLS handshakes
+    _SESSIONS: ClassVar[dict[tuple[Any, ...], requests.Session]] = {}
+    _SESSION_REFS: ClassVar[dict[tuple[Any, ...], int]] = {}
+    _SESSIONS_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         base_url: str,
@@ -127,19 +149,16 @@ class JiraApiClient:
             HttpHeader.CONTENT_TYPE: ContentType.JSON,
         }
 
-        # Configure session with connection pooling
-        self._session = requests.Session()
-        self._session.auth = self.auth
-        self._session.headers.update(self.headers)
-
-        # Configure HTTP adapter with connection pooling
-        adapter = HTTPAdapter(
-            pool_connections=pool_connections,
-            pool_maxsize=pool_maxsize,
-            pool_block=pool_block,
+        # Reuse (or create) the shared session with connection pooling. The key
+        # holds a digest of the credentials, never the token itself
+        credentials = hashlib.sha256(f"{email}:{api_token}".encode()).hexdigest()
+        session_key = (self.base_url, credentials, pool_connections, pool_maxsize, pool_block)
+        self._session = self._acquire_session(session_key)
+        # Releases the shared session on close(), or when the client is garbage
+        # collected without being closed
+        self._release_session = weakref.finalize(
+            self, JiraApiClient._release_shared_session, session_key
         )
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
 
         # Store pool config for stats
         self._pool_connections = pool_connections
@@ -148,6 +167,71 @@ class JiraApiClient:
 
         self._current_user: dict | None = None
 
+        # Lightweight urllib3 pool for hot, small reads (see raw_get), created on first
+        # use unless a proxy or client certificate means only the session can send them
+        self._pool: urllib3.PoolManager | None = None
+        self._raw_get_enabled = True
+        self._raw_headers = {
+            **self.headers,
+            **urllib3.util.make_headers(basic_auth=f"{email}:{api_token}"),
+        }
+
+        # LRU of (etag, raw body) per GET endpoint+params, used to revalidate
+        # repeated reads (e.g. status polls) with a body-less 304 response
+        self._etag_cache: OrderedDict[tuple[str, str], tuple[str, bytes]] = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+    def _acquire_session(self, key: tuple[Any, ...]) -> requests.Session:
+        """
+        Get the shared session for a key, creating and configuring it if needed.
+
+        Args:
+            key: Session registry key (base_url, credentials digest, pool settings).
+
+        Returns:
+            The shared requests Session.
+        """
+        _, _, pool_connections, pool_maxsize, pool_block = key
+        with JiraApiClient._SESSIONS_LOCK:
+            session = JiraApiClient._SESSIONS.get(key)
+            if session is None:
+                session = requests.Session()
+                session.auth = self.auth
+                session.headers.update(self.headers)
+
+                # Configure HTTP adapter with connection pooling
+                adapter = HTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=pool_block,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+                JiraApiClient._SESSIONS[key] = session
+                JiraApiClient._SESSION_REFS[key] = 0
+            JiraApiClient._SESSION_REFS[key] += 1
+        return session
+
+    @staticmethod
+    def _release_shared_session(key: tuple[Any, ...]) -> None:
+        """
+        Drop one reference to a shared session, closing and evicting it at zero.
+
+        Args:
+            key: Session registry key the reference was taken with.
+        """
+        with JiraApiClient._SESSIONS_LOCK:
+            refs = JiraApiClient._SESSION_REFS.get(key, 0) - 1
+            if refs > 0:
+                JiraApiClient._SESSION_REFS[key] = refs
+                return
+            JiraApiClient._SESSION_REFS.pop(key, None)
+            session = JiraApiClient._SESSIONS.pop(key, None)
+
+        if session is not None:
+            session.close()
+
     # -------------------------------------------------------------------------
     # Core Request Methods
     # -------------------------------------------------------------------------
@@ -184,10 +268,31 @@ class JiraApiClient:
         url = f"{self.api_url}/{endpoint}"
         last_exception: Exception | None = None
 
+        # Serialize JSON bodies once up front (orjson when available) rather
+        # than letting requests re-encode them with stdlib json on every retry
+        if "json" in kwargs:
+            payload = kwargs.pop("json")
+            if payload is not None:
+                kwargs["data"] = json_codec.dumps(payload)
+
+        # Revalidate previously seen GET responses instead of re-downloading them
+        etag_key: tuple[str, str] | None = None
+        cached: tuple[str, bytes] | None = None
+        if method == "GET":
+            etag_key = (endpoint, repr(kwargs.get("params")))
+            with self._etag_lock:
+                cached = self._etag_cache.get(etag_key)
+            if cached is not None:
+                kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
+
+        # Set after this caller paused the rate limiter and slept out the pause itself
+        resuming = False
+
         for attempt in range(self.max_retries + 1):
             # Apply rate limiting before each request attempt
             if self._rate_limiter is not None:
-                self._rate_limiter.acquire()
+                self._rate_limiter.acquire(ignore_pause=resuming)
+            resuming = False
 
             try:
                 # Apply default timeout if not specified
@@ -217,6 +322,11 @@ class JiraApiClient:
                             f"attempt {attempt + 1}/{self.max_retries + 1}, "
                             f"retrying in {delay:.2f}s"
                         )
+                        # Hold other threads back for the same delay instead of
+                        # letting each of them hit the limit on its own
+                        if self._rate_limiter is not None:
+                            self._rate_limiter.pause(delay)
+                            resuming = True
                         time.sleep(delay)
                         continue
 
@@ -233,6 +343,8 @@ class JiraApiClient:
                         issue_key=endpoint,
                     )
 
+                if etag_key is not None:
+                    return self._handle_conditional_response(response, endpoint, etag_key, cached)
                 return self._handle_response(response, endpoint)
 
             except requests.exceptions.ConnectionError as e:
@@ -295,6 +407,123 @@ class JiraApiClient:
         """
         return self.request("GET", endpoint, **kwargs)
 
+    def raw_get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Perform a lightweight GET directly on a urllib3 connection pool.
+
+        Skips the per-call overhead of requests (request preparation, hooks,
+        proxy environment lookups) for small, hot reads such as status polls.
+        Rate limiting, ETag revalidation and error mapping still apply. A
+        retryable status is backed off and retried through get(), as are
+        connection failures.
+
+        Args:
+            endpoint: API endpoint (e.g., 'issue/PROJ-123').
+            params: Optional query parameters.
+
+        Returns:
+            JSON response as dictionary.
+        """
+        pool = self._raw_pool()
+        if pool is None:
+            return self.get(endpoint, params=params)
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+        etag_key = (endpoint, repr(params))
+        with self._etag_lock:
+            cached = self._etag_cache.get(etag_key)
+        headers = self._raw_headers
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        url = f"{self.api_url}/{endpoint}"
+        try:
+            response = pool.request(
+                "GET",
+                url,
+                fields=params,
+                headers=headers,
+                timeout=self.timeout,
+                retries=False,
+            )
+        except urllib3.exceptions.HTTPError as e:
+            self.logger.debug(f"Raw GET {endpoint} failed, retrying via session: {e}")
+            return self.get(endpoint, params=params)
+
+        if response.status == 304 and cached is not None:
+            return json_codec.loads(cached[1]) if cached[1] else {}
+
+        if 200 <= response.status < 300:
+            content = response.data
+            self._remember_etag(etag_key, response.headers.get("ETag"), content)
+            return json_codec.loads(content) if content else {}
+
+        error_response = requests.Response()
+        error_response.status_code = response.status
+        error_response.headers = requests.structures.CaseInsensitiveDict(response.headers)
+        error_response._content = response.data
+        error_response.url = url
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.update_from_response(error_response)
+
+        if error_response.status_code in RETRYABLE_STATUS_CODES:
+            delay = calculate_delay(
+                0,
+                initial_delay=self.initial_delay,
+                max_delay=self.max_delay,
+                backoff_factor=self.backoff_factor,
+                jitter=self.jitter,
+                retry_after=get_retry_after(error_response),
+            )
+            self.logger.warning(
+                f"Retryable error {response.status} on GET {endpoint}, retrying in {delay:.2f}s"
+            )
+            if self._rate_limiter is not None:
+                self._rate_limiter.pause(delay)
+            time.sleep(delay)
+            return self.get(endpoint, params=params)
+
+        return self._handle_response(error_response, endpoint)
+
+    def _raw_pool(self) -> urllib3.PoolManager | None:
+        """
+        Get the urllib3 pool used by raw_get(), creating it on first use.
+
+        The pool verifies TLS like the session would, including a
+        REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE override. Proxies and client
+        certificates are left to the session.
+
+        Returns:
+            The pool, or None if raw_get() must go through the session.
+        """
+        if self._pool is not None or not self._raw_get_enabled:
+            return self._pool
+
+        settings = self._session.merge_environment_settings(self.api_url, {}, None, None, None)
+        if requests.utils.select_proxy(self.api_url, settings["proxies"]) or settings["cert"]:
+            self.logger.debug("Proxy or client certificate configured, raw GETs use the session")
+            self._raw_get_enabled = False
+            return None
+
+        verify = settings["verify"]
+        if verify is False:
+            tls: dict[str, Any] = {"cert_reqs": "CERT_NONE"}
+        else:
+            ca_bundle = requests.utils.DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+            ca_option = "ca_cert_dir" if Path(ca_bundle).is_dir() else "ca_certs"
+            tls = {"cert_reqs": "CERT_REQUIRED", ca_option: ca_bundle}
+
+        self._pool = urllib3.PoolManager(
+            num_pools=self._pool_connections,
+            maxsize=self._pool_maxsize,
+            block=self._pool_block,
+            **tls,
+        )
+        return self._pool
+
     def post(
         self,
         endpoint: str,
@@ -383,14 +612,12 @@ class JiraApiClient:
             IssueTrackerError: On other error responses.
         """
         if response.ok:
-            if response.text:
-                return response.json()
+            if response.content:
+                return json_codec.loads(response.content)
             return {}
 
         # Handle specific error codes
         status = response.status_code
-        error_body = response.text[:500] if response.text else ""
-
         if status == 401:
             raise AuthenticationError("Authentication failed. Check JIRA_EMAIL and JIRA_API_TOKEN.")
 
@@ -400,9 +627,51 @@ class JiraApiClient:
         if status == 404:
             raise NotFoundError(f"Not found: {endpoint}", issue_key=endpoint)
 
-        # Generic error
+        # Generic error - slice the raw bytes before decoding so multi-MB HTML
+        # error pages (e.g. proxy 502s) aren't decoded in full to keep 500 chars
+        content = response.content
+        error_body = content[:500].decode("utf-8", errors="replace") if content else ""
         raise IssueTrackerError(f"API error {status}: {error_body}", issue_key=endpoint)
 
+    def _handle_conditional_response(
+        self,
+        response: requests.Response,
+        endpoint: str,
+        etag_key: tuple[str, str],
+        cached: tuple[str, bytes] | None,
+    ) -> dict[str, Any]:
+        """
+        Handle a GET response, serving 304s from and recording ETags in the cache.
+
+        Args:
+            response: The requests Response object.
+            endpoint: The endpoint that was called (for error messages).
+            etag_key: ETag cache key for this request.
+            cached: The cached (etag, body) sent as If-None-Match, if any.
+
+        Returns:
+            Parsed JSON response as dictionary.
+        """
+        if response.status_code == 304 and cached is not None:
+            with self._etag_lock:
+                if etag_key in self._etag_cache:
+                    self._etag_cache.move_to_end(etag_key)
+            return json_codec.loads(cached[1]) if cached[1] else {}
+
+        result = self._handle_response(response, endpoint)
+        self._remember_etag(etag_key, response.headers.get("ETag"), response.content)
+        return result
+
+    def _remember_etag(self, etag_key: tuple[str, str], etag: Any, content: bytes) -> None:
+        """Record a response body under its ETag, evicting least recently used entries."""
+        if not isinstance(etag, str) or not etag:
+            return
+        with self._etag_lock:
+            self._etag_cache[etag_key] = (etag, content)
+            self._etag_cache.move_to_end(etag_key)
+            while len(self._etag_cache) > self.DEFAULT_ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
     # -------------------------------------------------------------------------
     # Convenience Methods
     # -------------------------------------------------------------------------
@@ -429,7 +698,13 @@ class JiraApiClient:
         """
         return self.get_myself()["accountId"]
 
-    def search_jql(self, jql: str, fields: list[str], max_results: int = 100) -> dict[str, Any]:
+    def search_jql(
+        self,
+        jql: str,
+        fields: list[str],
+        max_results: int = 100,
+        start_at: int = 0,
+    ) -> dict[str, Any]:
         """
         Execute a JQL search query.
 
@@ -437,18 +712,66 @@ class JiraApiClient:
             jql: The JQL query string.
             fields: List of field names to include in results.
             max_results: Maximum number of results to return.
+            start_at: Offset of the first result (for pagination).
 
         Returns:
             Dictionary with 'issues' list and pagination info.
         """
-        return self.post(
-            "search/jql",
-            json={
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": fields,
-            },
-        )
+        payload: dict[str, Any] = {
+            "jql": jql,
+            "maxResults": max_results,
+            "fields": fields,
+        }
+        if start_at:
+            payload["startAt"] = start_at
+        return self.post("search/jql", json=payload)
+
+    def search_jql_all(
+        self,
+        jql: str,
+        fields: list[str],
+        page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+        max_workers: int = DEFAULT_SEARCH_WORKERS,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a JQL search and fetch every page of results.
+
+        The first page reports the total result count; the remaining
+        ``startAt`` windows are then fetched in parallel rather than one
+        after another. Windows are sized by the first page, since Jira may
+        return fewer results per page than requested for heavy field sets.
+        Requests still go through the shared rate limiter.
+
+        Args:
+            jql: The JQL query string.
+            fields: List of field names to include in results.
+            page_size: Results per page (Jira caps this at 100).
+            max_workers: Maximum number of pages fetched concurrently.
+
+        Returns:
+            All matching issues, in result order.
+        """
+        first = self.search_jql(jql, fields, max_results=page_size)
+        issues: list[dict[str, Any]] = list(first.get("issues", []))
+        total = first.get("total", len(issues))
+
+        if not issues or len(issues) >= total:
+            return issues
+
+        # Stride by what the server actually returned so no window is skipped
+        stride = min(page_size, len(issues))
+        offsets = range(stride, total, stride)
+
+        def fetch_page(start_at: int) -> list[dict[str, Any]]:
+            page = self.search_jql(jql, fields, max_results=stride, start_at=start_at)
+            return list(page.get("issues", []))
+
+        # executor.map yields pages in offset order
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+            for page_issues in executor.map(fetch_page, offsets):
+                issues.extend(page_issues)
+
+        return issues
 
     def test_connection(self) -> bool:
         """
@@ -526,10 +849,18 @@ class JiraApiClient:
         Close the client and release connection pool resources.
 
         Should be called when the client is no longer needed to free up
-        connections. After calling close(), the client should not be used.
+        connections. The underlying session is shared with other clients for
+        the same site and is only closed once the last of them is closed.
+        After calling close(), the client should not be used.
         """
-        self._session.close()
-        self.logger.debug("Closed HTTP session and released connection pool")
+        if self._pool is not None:
+            self._pool.clear()
+            self._pool = None
+
+        # A finalizer runs at most once, so closing twice releases only once
+        if self._release_session.alive:
+            self._release_session()
+            self.logger.debug("Released HTTP session and connection pool")
 
     def __enter__(self) -> "JiraApiClient":
         """Context manager entry."""
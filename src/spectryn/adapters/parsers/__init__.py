@@ -132,6 +132,7 @@ from .tolerant_markdown import (
     CodeBlockType,
     EmbeddedImage,
     InlineSubtaskInfo,
+    LineIndex,
     ParsedTable,
     ParseErrorCode,
     ParseErrorInfo,
@@ -157,6 +158,7 @@ from .tolerant_markdown import (
     get_line_content,
     get_line_number,
     location_from_match,
+    parse_checkbox_columns,
     parse_checkboxes_tolerant,
     parse_code_blocks,
     parse_description_tolerant,
@@ -208,6 +210,7 @@ __all__ = [
     # Inline subtask parsing
     "InlineSubtaskInfo",
     "JsonParser",
+    "LineIndex",
     "MarkdownParser",
     "MemoryMappedParser",
     "MergeStrategy",
@@ -290,6 +293,7 @@ __all__ = [
     "one_of",
     "parse_acceptance_criteria_from_frontmatter",
     "parse_blockquote_comments",
+    "parse_checkbox_columns",
     "parse_checkboxes_tolerant",
     "parse_code_blocks",
     "parse_datetime",
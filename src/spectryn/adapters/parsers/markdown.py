@@ -41,7 +41,7 @@ from .tolerant_markdown import (
     get_context_lines,
     get_line_number,
     location_from_match,
-    parse_checkboxes_tolerant,
+    parse_checkbox_columns,
     parse_description_tolerant,
     parse_inline_subtasks,
 )
@@ -170,6 +170,12 @@ class MarkdownParser(DocumentParserPort):
         if story_pattern:
             self.STORY_PATTERN = story_pattern
 
+        # Header patterns used on every parse, compiled once per parser
+        self._story_re = re.compile(self.STORY_PATTERN)
+        self._story_flexible_re = re.compile(self.STORY_PATTERN_FLEXIBLE)
+        self._story_h1_re = re.compile(self.STORY_PATTERN_H1, re.MULTILINE)
+        self._multi_epic_re = re.compile(self.MULTI_EPIC_PATTERN, re.MULTILINE)
+
     # -------------------------------------------------------------------------
     # DocumentParserPort Implementation
     # -------------------------------------------------------------------------
@@ -198,9 +204,7 @@ class MarkdownParser(DocumentParserPort):
             return source.suffix.lower() in self.supported_extensions
 
         # Check if content looks like markdown with either pattern
-        return bool(
-            re.search(self.STORY_PATTERN, source) or re.search(self.STORY_PATTERN_FLEXIBLE, source)
-        )
+        return bool(self._story_re.search(source) or self._story_flexible_re.search(source))
 
     def _detect_format(self, content: str) -> str:
         """
@@ -213,7 +217,7 @@ class MarkdownParser(DocumentParserPort):
             FORMAT_TABLE, FORMAT_INLINE, FORMAT_BLOCKQUOTE, or FORMAT_STANDALONE
         """
         # Check for standalone file format (h1 header with PREFIX-NUMBER story ID)
-        has_h1_story = bool(re.search(self.STORY_PATTERN_H1, content, re.MULTILINE))
+        has_h1_story = bool(self._story_h1_re.search(content))
 
         # Look for blockquote metadata (> **Field**: Value)
         has_blockquote_metadata = bool(
@@ -427,7 +431,8 @@ class MarkdownParser(DocumentParserPort):
         # Use tolerant field extractor
         field_extractor = TolerantFieldExtractor(content, source)
 
-        # Extract fields with tolerance
+        # Extract fields with tolerance, scanning the content once for all of them
+        field_extractor.extract_fields(("Story Points", "Priority", "Status"))
         story_points_str, _ = field_extractor.extract_field("Story Points", "0")
         priority_str, _ = field_extractor.extract_field("Priority", "Medium")
         status_str, _ = field_extractor.extract_field("Status", "Planned")
@@ -464,15 +469,12 @@ class MarkdownParser(DocumentParserPort):
         ac_content, _ = section_extractor.extract_section("Acceptance Criteria")
         warnings.extend(section_extractor.warnings)
 
-        ac_items, ac_warnings = (
-            parse_checkboxes_tolerant(ac_content, source) if ac_content else ([], [])
+        ac_texts, ac_checked, ac_warnings = (
+            parse_checkbox_columns(ac_content, source) if ac_content else ([], [], [])
         )
         warnings.extend(ac_warnings)
 
-        acceptance = AcceptanceCriteria.from_list(
-            [item[0] for item in ac_items],
-            [item[1] for item in ac_items],
-        )
+        acceptance = AcceptanceCriteria.from_list(ac_texts, ac_checked)
 
         # Extract subtasks (use existing method)
         subtasks = self._extract_subtasks(content)
@@ -682,7 +684,7 @@ class MarkdownParser(DocumentParserPort):
             True if multiple epics are found
         """
         content = self._get_content(source)
-        epic_matches = re.findall(self.MULTI_EPIC_PATTERN, content, re.MULTILINE)
+        epic_matches = self._multi_epic_re.findall(content)
         return len(epic_matches) >= 1
 
     def parse_epics(self, source: str | Path) -> list[Epic]:
@@ -708,7 +710,7 @@ class MarkdownParser(DocumentParserPort):
         epics = []
 
         # Find all epic headers
-        epic_matches = list(re.finditer(self.MULTI_EPIC_PATTERN, content, re.MULTILINE))
+        epic_matches = list(self._multi_epic_re.finditer(content))
 
         if not epic_matches:
             # Fall back to single epic parsing
@@ -751,7 +753,7 @@ class MarkdownParser(DocumentParserPort):
             List of epic keys (e.g., ["PROJ-100", "PROJ-200"])
         """
         content = self._get_content(source)
-        matches = re.findall(self.MULTI_EPIC_PATTERN, content, re.MULTILINE)
+        matches = self._multi_epic_re.findall(content)
         return [match[0] for match in matches]
 
     def parse_directory(self, directory: str | Path) -> list[UserStory]:
@@ -904,9 +906,9 @@ class MarkdownParser(DocumentParserPort):
         errors = []
 
         # Check for story pattern using flexible pattern
-        story_matches = list(re.finditer(self.STORY_PATTERN_FLEXIBLE, content))
+        story_matches = list(self._story_flexible_re.finditer(content))
         if not story_matches:
-            story_matches = list(re.finditer(self.STORY_PATTERN, content))
+            story_matches = list(self._story_re.finditer(content))
 
         if not story_matches:
             errors.append(
@@ -968,10 +970,10 @@ class MarkdownParser(DocumentParserPort):
         errors: list[ParseErrorInfo] = []
         warnings: list[ParseWarning] = []
 
-        # Check for story pattern using tolerant patterns
-        story_matches = list(TolerantPatterns.STORY_HEADER.finditer(content))
-        if not story_matches:
-            story_matches = list(TolerantPatterns.STORY_HEADER_H1.finditer(content))
+        # Check for story pattern using tolerant patterns: h2-h4 stories, or
+        # h1 stories when there are none (one scan finds both)
+        header_matches = list(TolerantPatterns.STORY_HEADER_ANY.finditer(content))
+        story_matches = [m for m in header_matches if m.group(1)] or header_matches
 
         if not story_matches:
             errors.append(
@@ -990,7 +992,7 @@ class MarkdownParser(DocumentParserPort):
 
         # Validate each story
         for i, match in enumerate(story_matches):
-            story_id = match.group(1)
+            story_id = match.group(2) or match.group(4)
             story_line = get_line_number(content, match.start())
             start = match.end()
             end = story_matches[i + 1].start() if i + 1 < len(story_matches) else len(content)
@@ -1102,7 +1104,7 @@ class MarkdownParser(DocumentParserPort):
 
         # For standalone files with h1 headers, try h1 pattern first
         if detected_format == self.FORMAT_STANDALONE:
-            story_matches = list(re.finditer(self.STORY_PATTERN_H1, content, re.MULTILINE))
+            story_matches = list(self._story_h1_re.finditer(content))
             if story_matches:
                 self.logger.debug(f"Found {len(story_matches)} stories using h1 pattern")
                 for match in story_matches:
@@ -1126,9 +1128,9 @@ class MarkdownParser(DocumentParserPort):
                 return stories
 
         # Try flexible h3 pattern first, then fall back to strict pattern
-        story_matches = list(re.finditer(self.STORY_PATTERN_FLEXIBLE, content))
+        story_matches = list(self._story_flexible_re.finditer(content))
         if not story_matches:
-            story_matches = list(re.finditer(self.STORY_PATTERN, content))
+            story_matches = list(self._story_re.finditer(content))
 
         self.logger.debug(f"Found {len(story_matches)} stories using h3 pattern")
 
@@ -30,6 +30,9 @@ Usage:
 
 from __future__ import annotations
 
+import bisect
+import functools
+import itertools
 import re
 from dataclasses import dataclass, field
 from enum import Enum
@@ -37,6 +40,8 @@ from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from spectryn.core.domain.entities import UserStory
 
 
@@ -48,7 +53,7 @@ class ParseSeverity(Enum):
     INFO = "info"  # Informational message about parsing behavior
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseLocation:
     """
     Precise location in the source document.
@@ -79,7 +84,7 @@ class ParseLocation:
         return ":".join(parts) if self.source else parts[0]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseIssue:
     """
     Base class for parse errors and warnings.
@@ -120,21 +125,21 @@ class ParseIssue:
         return "\n".join(parts)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseErrorInfo(ParseIssue):
     """A parse error that may prevent successful parsing."""
 
     severity: ParseSeverity = field(default=ParseSeverity.ERROR, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseWarning(ParseIssue):
     """A parse warning for non-critical issues."""
 
     severity: ParseSeverity = field(default=ParseSeverity.WARNING, init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """
     Result of parsing with stories, errors, and warnings.
@@ -202,6 +207,21 @@ class TolerantPatterns:
         re.MULTILINE | re.IGNORECASE,
     )
 
+    # STORY_HEADER or STORY_HEADER_H1 in one scan. A line is tried as an h2-h4
+    # story first: group 1 (hashes), 2 (ID), 3 (title); otherwise as an h1
+    # story: group 4 (ID), 5 (title). The h1 branch stays on one line so that a
+    # heading with an empty title (e.g. "## Phase 1:") can't swallow the story
+    # header below it
+    STORY_HEADER_ANY = re.compile(
+        r"^(?:"
+        r"(#{2,4})\s*(?:[^\n]*?\s)?([A-Z]+[-_/]\d+|#\d+)\s*:\s*([^\n]+?)\s*$"
+        r"|"
+        r"#[ \t]*(?:[^\n]*?[ \t])?([A-Z]+[-_/]\d+|#?\d+)[ \t]*:[ \t]*([^\n]+?)"
+        r"(?:[ \t]*[✅🔲🟡⏸️🔄📋]+)?[ \t]*$"
+        r")",
+        re.MULTILINE | re.IGNORECASE,
+    )
+
     # Field extraction - tolerant of formatting variations
     # Table format: | **Field** | Value | or |**Field**|Value|
     TABLE_FIELD = re.compile(r"\|\s*\*?\*?{field}\*?\*?\s*\|\s*([^|]+?)\s*\|", re.IGNORECASE)
@@ -256,37 +276,7 @@ class TolerantPatterns:
         Returns:
             Compiled regex pattern
         """
-        # Escape special regex chars but allow flexible spacing
-        field_escaped = re.escape(field_name)
-        # Allow optional spaces in field name (e.g., "Story Points" or "Story  Points")
-        field_pattern = field_escaped.replace(r"\ ", r"\s+")
-
-        if format_type == "table":
-            return re.compile(
-                rf"\|\s*\*?\*?{field_pattern}\*?\*?\s*\|\s*([^|]+?)\s*\|",
-                re.IGNORECASE,
-            )
-        if format_type == "inline":
-            return re.compile(
-                rf"(?<!>)\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)",
-                re.MULTILINE | re.IGNORECASE,
-            )
-        if format_type == "blockquote":
-            return re.compile(
-                rf">\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$)",
-                re.MULTILINE | re.IGNORECASE,
-            )
-        # All formats combined
-        return re.compile(
-            rf"(?:"
-            rf"\|\s*\*?\*?{field_pattern}\*?\*?\s*\|\s*([^|]+?)\s*\|"
-            rf"|"
-            rf"(?<!>)\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)"
-            rf"|"
-            rf">\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$)"
-            rf")",
-            re.MULTILINE | re.IGNORECASE,
-        )
+        return _field_pattern(field_name, format_type)
 
     @classmethod
     def section_pattern(cls, section_name: str, levels: str = "2-4") -> re.Pattern[str]:
@@ -301,14 +291,99 @@ class TolerantPatterns:
             Compiled regex pattern matching the section and capturing content
         """
         _ = levels  # Reserved for future use
-        section_escaped = re.escape(section_name)
-        # Allow flexible spacing and optional plural
-        section_pattern = section_escaped.replace(r"\ ", r"\s+")
+        return _section_pattern(section_name)
+
 
+# Patterns are built per field/section name and reused across extractions
+@functools.lru_cache(maxsize=256)
+def _field_pattern(field_name: str, format_type: str) -> re.Pattern[str]:
+    """Compile the TolerantPatterns.field_pattern regex for a field and format."""
+    # Escape special regex chars but allow flexible spacing
+    field_escaped = re.escape(field_name)
+    # Allow optional spaces in field name (e.g., "Story Points" or "Story  Points")
+    field_pattern = field_escaped.replace(r"\ ", r"\s+")
+
+    if format_type == "table":
+        return re.compile(
+            rf"\|\s*\*?\*?{field_pattern}\*?\*?\s*\|\s*([^|]+?)\s*\|",
+            re.IGNORECASE,
+        )
+    if format_type == "inline":
+        return re.compile(
+            rf"(?<!>)\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)",
+            re.MULTILINE | re.IGNORECASE,
+        )
+    if format_type == "blockquote":
         return re.compile(
-            rf"^(#{{2,4}})\s*{section_pattern}\s*\n([\s\S]*?)(?=^#{{2,4}}\s|\n---|\Z)",
+            rf">\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$)",
             re.MULTILINE | re.IGNORECASE,
         )
+    # All formats combined
+    return re.compile(
+        rf"(?:"
+        rf"\|\s*\*?\*?{field_pattern}\*?\*?\s*\|\s*([^|]+?)\s*\|"
+        rf"|"
+        rf"(?<!>)\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)"
+        rf"|"
+        rf">\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$)"
+        rf")",
+        re.MULTILINE | re.IGNORECASE,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _field_variants_pattern(variants: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile the combined field pattern for several names of one field.
+
+    Every format has a named group per variant (t0, i0, b0, t1, ...) and
+    closes with its value group (tv, iv or bv), so a match's lastindex is the
+    value and _matched_variant() tells which name was used.
+    """
+    names = [re.escape(variant).replace(r"\ ", r"\s+") for variant in variants]
+
+    def slot(prefix: str) -> str:
+        return "(?:" + "|".join(f"(?P<{prefix}{i}>{name})" for i, name in enumerate(names)) + ")"
+
+    return re.compile(
+        rf"(?:"
+        rf"\|\s*\*?\*?{slot('t')}\*?\*?\s*\|\s*(?P<tv>[^|]+?)\s*\|"
+        rf"|"
+        rf"(?<!>)\s*\*\*{slot('i')}\*\*\s*:\s*(?P<iv>.+?)(?:\s*$|\s{{2,}}|\n)"
+        rf"|"
+        rf">\s*\*\*{slot('b')}\*\*\s*:\s*(?P<bv>.+?)(?:\s*$)"
+        rf")",
+        re.MULTILINE | re.IGNORECASE,
+    )
+
+
+def _matched_variant(match: re.Match[str], count: int) -> int:
+    """Index of the variant a _field_variants_pattern match used."""
+    prefix = match.lastgroup[0]  # type: ignore[index]
+    return next(i for i in range(count) if match.group(f"{prefix}{i}") is not None)
+
+
+# Formats in order of precedence when a field appears in more than one
+_FIELD_FORMAT_RANK = {"t": 0, "i": 1, "b": 2}
+
+
+def _match_rank(match: re.Match[str], count: int) -> tuple[int, int]:
+    """Precedence of a _field_variants_pattern match: variant index, then format."""
+    prefix = match.lastgroup[0]  # type: ignore[index]
+    return _matched_variant(match, count), _FIELD_FORMAT_RANK[prefix]
+
+
+@functools.lru_cache(maxsize=256)
+def _section_pattern(section_name: str) -> re.Pattern[str]:
+    """Compile the TolerantPatterns.section_pattern regex for a section."""
+    section_escaped = re.escape(section_name)
+    # Allow flexible spacing and optional plural
+    section_pattern = section_escaped.replace(r"\ ", r"\s+")
+
+    return re.compile(
+        rf"^(#{{2,4}})\s*{section_pattern}\s*\n([\s\S]*?)(?=^#{{2,4}}\s|\n---|\Z)",
+        re.MULTILINE | re.IGNORECASE,
+    )
 
 
 # =============================================================================
@@ -316,6 +391,48 @@ class TolerantPatterns:
 # =============================================================================
 
 
+class LineIndex:
+    """
+    Line and column lookups for one text.
+
+    The text is split into lines and their start offsets are computed once,
+    so each lookup is a binary search or an index instead of a scan.
+    """
+
+    __slots__ = ("_lines", "_starts")
+
+    def __init__(self, content: str):
+        """
+        Index the line starts of a text.
+
+        Args:
+            content: Full text content
+        """
+        self._lines = content.split("\n")
+        self._starts = list(
+            itertools.accumulate((len(line) + 1 for line in self._lines[:-1]), initial=0)
+        )
+
+    @property
+    def lines(self) -> list[str]:
+        """The text's lines, without newlines (don't modify)."""
+        return self._lines
+
+    def line_for(self, position: int) -> int:
+        """Get the 1-indexed line number for a character position (0-indexed)."""
+        return bisect.bisect_right(self._starts, position)
+
+    def column_for(self, position: int) -> int:
+        """Get the 1-indexed column number for a character position (0-indexed)."""
+        return position - self._starts[self.line_for(position) - 1] + 1
+
+
+@functools.lru_cache(maxsize=8)
+def _line_index(content: str) -> LineIndex:
+    """Shared LineIndex for the texts currently being parsed."""
+    return LineIndex(content)
+
+
 def get_line_number(content: str, position: int) -> int:
     """
     Get the 1-indexed line number for a character position.
@@ -327,7 +444,7 @@ def get_line_number(content: str, position: int) -> int:
     Returns:
         1-indexed line number
     """
-    return content[:position].count("\n") + 1
+    return _line_index(content).line_for(position)
 
 
 def get_column_number(content: str, position: int) -> int:
@@ -341,8 +458,7 @@ def get_column_number(content: str, position: int) -> int:
     Returns:
         1-indexed column number
     """
-    line_start = content.rfind("\n", 0, position) + 1
-    return position - line_start + 1
+    return _line_index(content).column_for(position)
 
 
 def get_line_content(content: str, line_number: int) -> str:
@@ -356,7 +472,7 @@ def get_line_content(content: str, line_number: int) -> str:
     Returns:
         Content of the specified line (without newline)
     """
-    lines = content.split("\n")
+    lines = _line_index(content).lines
     if 1 <= line_number <= len(lines):
         return lines[line_number - 1]
     return ""
@@ -375,7 +491,7 @@ def get_context_lines(content: str, line_number: int, before: int = 1, after: in
     Returns:
         Formatted context string with line numbers
     """
-    lines = content.split("\n")
+    lines = _line_index(content).lines
     start = max(0, line_number - 1 - before)
     end = min(len(lines), line_number + after)
 
@@ -401,13 +517,14 @@ def location_from_match(
     Returns:
         ParseLocation with line and column info
     """
+    index = _line_index(content)
     start = match.start()
     end = match.end()
     return ParseLocation(
-        line=get_line_number(content, start),
-        column=get_column_number(content, start),
-        end_line=get_line_number(content, end),
-        end_column=get_column_number(content, end),
+        line=index.line_for(start),
+        column=index.column_for(start),
+        end_line=index.line_for(end),
+        end_column=index.column_for(end),
         source=source,
     )
 
@@ -436,6 +553,15 @@ class TolerantFieldExtractor:
         "Story ID": ["ID", "Issue ID"],
     }
 
+    # Names to try per field, the field's own name first
+    _VARIANTS: dict[str, tuple[str, ...]] = {
+        name: (name, *aliases) for name, aliases in FIELD_ALIASES.items()
+    }
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._VARIANTS = {name: (name, *aliases) for name, aliases in cls.FIELD_ALIASES.items()}
+
     def __init__(self, content: str, source: str | None = None):
         """
         Initialize extractor with content.
@@ -447,6 +573,8 @@ class TolerantFieldExtractor:
         self.content = content
         self.source = source
         self.warnings: list[ParseWarning] = []
+        # Lookups by primary field name; None records a field that isn't there
+        self._fields: dict[str, tuple[str, ParseLocation] | None] = {}
 
     def extract_field(
         self,
@@ -465,39 +593,12 @@ class TolerantFieldExtractor:
         Returns:
             Tuple of (value, location) where location is None if not found
         """
-        # Get all variants of the field name
-        variants = [field_name, *self.FIELD_ALIASES.get(field_name, [])]
+        if field_name not in self._fields:
+            self._fields[field_name] = self._find_field(field_name)
 
-        for variant in variants:
-            # Try table format
-            pattern = TolerantPatterns.field_pattern(variant, "table")
-            match = pattern.search(self.content)
-            if match:
-                value = self._clean_field_value(match.group(1))
-                location = location_from_match(self.content, match, self.source)
-                if variant != field_name:
-                    self._add_alias_warning(variant, field_name, location)
-                return value, location
-
-            # Try inline format
-            pattern = TolerantPatterns.field_pattern(variant, "inline")
-            match = pattern.search(self.content)
-            if match:
-                value = self._clean_field_value(match.group(1))
-                location = location_from_match(self.content, match, self.source)
-                if variant != field_name:
-                    self._add_alias_warning(variant, field_name, location)
-                return value, location
-
-            # Try blockquote format
-            pattern = TolerantPatterns.field_pattern(variant, "blockquote")
-            match = pattern.search(self.content)
-            if match:
-                value = self._clean_field_value(match.group(1))
-                location = location_from_match(self.content, match, self.source)
-                if variant != field_name:
-                    self._add_alias_warning(variant, field_name, location)
-                return value, location
+        found = self._fields[field_name]
+        if found is not None:
+            return found
 
         # Not found
         if required:
@@ -512,14 +613,109 @@ class TolerantFieldExtractor:
 
         return default, None
 
+    def extract_fields(self, field_names: Iterable[str]) -> dict[str, tuple[str, ParseLocation]]:
+        """
+        Extract several fields with a single scan of the content.
+
+        Results are the same as calling extract_field() for each name, and
+        later extract_field() calls for these names reuse them.
+
+        Args:
+            field_names: Primary field names to look for
+
+        Returns:
+            Dict of field name to (value, location) for the fields found
+        """
+        requested = list(dict.fromkeys(field_names))
+        names = [name for name in requested if name not in self._fields]
+        if len(names) > 1:
+            self._find_fields(names)
+        for name in names:
+            if name not in self._fields:
+                self._fields[name] = self._find_field(name)
+
+        return {name: found for name in requested if (found := self._fields[name]) is not None}
+
+    def _find_fields(self, field_names: list[str]) -> None:
+        """Scan the content once for every name and alias of several fields."""
+        owners: list[tuple[int, int]] = []
+        variants: list[str] = []
+        for field, name in enumerate(field_names):
+            for index, variant in enumerate(self._VARIANTS.get(name) or (name,)):
+                owners.append((field, index))
+                variants.append(variant)
+        if len({variant.casefold() for variant in variants}) < len(variants):
+            # A name shared between fields; let _find_field() look for each one
+            return
+
+        # Each match start names exactly one variant, so stepping one character
+        # past every match sees all of them; keep the best variant and format per
+        # field, at its first position
+        pattern = _field_variants_pattern(tuple(variants))
+        best: dict[int, tuple[tuple[int, int], re.Match[str]]] = {}
+        match = pattern.search(self.content)
+        while match:
+            position, fmt = _match_rank(match, len(variants))
+            field, index = owners[position]
+            if field not in best or (index, fmt) < best[field][0]:
+                best[field] = ((index, fmt), match)
+                if len(best) == len(field_names) and not any(
+                    any(rank) for rank, _ in best.values()
+                ):
+                    break
+            match = pattern.search(self.content, match.start() + 1)
+
+        for field, name in enumerate(field_names):
+            if field not in best:
+                self._fields[name] = None
+                continue
+            (index, _), match = best[field]
+            self._fields[name] = self._field_from_match(match, name, index)
+
+    def _find_field(self, field_name: str) -> tuple[str, ParseLocation] | None:
+        """Scan the content for a field under its name or an alias."""
+        variants = self._VARIANTS.get(field_name) or (field_name,)
+
+        # One scan for every variant in the table, inline and blockquote formats.
+        # An earlier variant (the name before its aliases) still wins when it only
+        # appears further down, and for one variant the table form wins over the
+        # inline form, which wins over the blockquote form
+        pattern = _field_variants_pattern(variants)
+        best: tuple[tuple[int, int], re.Match[str]] | None = None
+        match = pattern.search(self.content)
+        while match:
+            rank = _match_rank(match, len(variants))
+            if best is None or rank < best[0]:
+                best = (rank, match)
+                if not any(rank):
+                    break
+            match = pattern.search(self.content, match.start() + 1)
+
+        if best is None:
+            return None
+        (index, _), match = best
+        return self._field_from_match(match, field_name, index)
+
+    def _field_from_match(
+        self, match: re.Match[str], field_name: str, index: int
+    ) -> tuple[str, ParseLocation]:
+        """Build a field result from a match on variant ``index`` of the field."""
+        value = self._clean_field_value(match[match.lastindex])
+        location = location_from_match(self.content, match, self.source)
+        if index:
+            variants = self._VARIANTS.get(field_name) or (field_name,)
+            self._add_alias_warning(variants[index], field_name, location)
+        return value, location
+
     def _clean_field_value(self, value: str) -> str:
         """Clean and normalize a field value."""
-        # Remove leading/trailing whitespace
-        value = value.strip()
-        # Remove trailing punctuation that might be noise
-        value = value.rstrip(",;")
-        # Normalize internal whitespace
-        return " ".join(value.split())
+        # Remove leading/trailing whitespace, then trailing punctuation that might be noise
+        value = value.strip().rstrip(",;")
+        # Normalize internal whitespace; printable strings have no whitespace but
+        # plain spaces, so single-spaced values are returned as they are
+        if "  " in value or value[-1:] == " " or not value.isprintable():
+            return " ".join(value.split())
+        return value
 
     def _add_alias_warning(self, alias: str, canonical: str, location: ParseLocation) -> None:
         """Add warning about using an alias instead of canonical name."""
@@ -560,6 +756,15 @@ class TolerantSectionExtractor:
         "Links": ["Related Issues", "Related"],
     }
 
+    # Names to try per section, the section's own name first
+    _VARIANTS: dict[str, tuple[str, ...]] = {
+        name: (name, *aliases) for name, aliases in SECTION_ALIASES.items()
+    }
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._VARIANTS = {name: (name, *aliases) for name, aliases in cls.SECTION_ALIASES.items()}
+
     def __init__(self, content: str, source: str | None = None):
         """
         Initialize extractor with content.
@@ -571,6 +776,8 @@ class TolerantSectionExtractor:
         self.content = content
         self.source = source
         self.warnings: list[ParseWarning] = []
+        # Lookups by primary section name; None records a section that isn't there
+        self._sections: dict[str, tuple[str, ParseLocation] | None] = {}
 
     def extract_section(
         self,
@@ -587,17 +794,12 @@ class TolerantSectionExtractor:
         Returns:
             Tuple of (content, location) where both are None if not found
         """
-        variants = [section_name, *self.SECTION_ALIASES.get(section_name, [])]
+        if section_name not in self._sections:
+            self._sections[section_name] = self._find_section(section_name)
 
-        for variant in variants:
-            pattern = TolerantPatterns.section_pattern(variant)
-            match = pattern.search(self.content)
-            if match:
-                section_content = match.group(2).strip()
-                location = location_from_match(self.content, match, self.source)
-                if variant != section_name:
-                    self._add_alias_warning(variant, section_name, location)
-                return section_content, location
+        found = self._sections[section_name]
+        if found is not None:
+            return found
 
         if required:
             self.warnings.append(
@@ -611,6 +813,22 @@ class TolerantSectionExtractor:
 
         return "", None
 
+    def _find_section(self, section_name: str) -> tuple[str, ParseLocation] | None:
+        """Scan the content for a section under its name or an alias."""
+        variants = self._VARIANTS.get(section_name) or (section_name,)
+
+        for variant in variants:
+            pattern = TolerantPatterns.section_pattern(variant)
+            match = pattern.search(self.content)
+            if match:
+                section_content = match.group(2).strip()
+                location = location_from_match(self.content, match, self.source)
+                if variant != section_name:
+                    self._add_alias_warning(variant, section_name, location)
+                return section_content, location
+
+        return None
+
     def _add_alias_warning(self, alias: str, canonical: str, location: ParseLocation) -> None:
         """Add warning about using an alias instead of canonical name."""
         self.warnings.append(
@@ -628,6 +846,23 @@ class TolerantSectionExtractor:
 # =============================================================================
 
 
+# Lenient checkbox line: - [ ], * [x], +[], -[X] ... The text must be on the
+# same line; a bare "- [ ]" is not an item
+_CHECKBOX_LINE_PATTERN = re.compile(r"\s*[-*+]\s*\[([xX\s]?)\]\s*(\S.*)")
+_CHECKBOX_MARKERS = ("-", "*", "+")
+
+
+def _line_location(line_number: int, line: str, source: str | None) -> ParseLocation:
+    """ParseLocation spanning a whole line."""
+    return ParseLocation(
+        line=line_number,
+        column=1,
+        end_line=line_number,
+        end_column=len(line) + 1,
+        source=source,
+    )
+
+
 def parse_checkboxes_tolerant(
     content: str,
     source: str | None = None,
@@ -649,43 +884,65 @@ def parse_checkboxes_tolerant(
     Returns:
         Tuple of (items, warnings) where items is list of (text, checked) tuples
     """
-    items: list[tuple[str, bool]] = []
-    warnings: list[ParseWarning] = []
+    texts, checked, warnings = parse_checkbox_columns(content, source)
+    return list(zip(texts, checked, strict=True)), warnings
 
-    # More lenient pattern for checkbox detection
-    lenient_pattern = re.compile(r"^[\s]*[-*+]\s*\[([xX\s]?)\]\s*(.+?)$", re.MULTILINE)
 
-    for match in lenient_pattern.finditer(content):
-        checkbox_char = match.group(1).strip().lower()
-        text = match.group(2).strip()
-        checked = checkbox_char == "x"
+def parse_checkbox_columns(
+    content: str,
+    source: str | None = None,
+) -> tuple[list[str], list[bool], list[ParseWarning]]:
+    """
+    Parse checkboxes like parse_checkboxes_tolerant, as parallel columns.
+
+    Callers that want the texts and checked flags separately (such as
+    AcceptanceCriteria.from_list) get them without a (text, checked) tuple
+    per item.
 
-        items.append((text, checked))
+    Args:
+        content: Content containing checkboxes
+        source: Source file for error reporting
+
+    Returns:
+        Tuple of (texts, checked, warnings)
+    """
+    texts: list[str] = []
+    checked: list[bool] = []
+    warnings: list[ParseWarning] = []
+
+    # A checkbox is always a line of its own; most lines are rejected by their
+    # first character before any regex work
+    for line_number, line in enumerate(content.split("\n"), start=1):
+        if not line.lstrip().startswith(_CHECKBOX_MARKERS):
+            continue
+        match = _CHECKBOX_LINE_PATTERN.match(line)
+        if not match:
+            continue
+
+        texts.append(match.group(2).strip())
+        checked.append(match.group(1).strip().lower() == "x")
 
         # Warn about non-standard formatting
-        full_match = match.group(0)
-        if "* [" in full_match:
-            location = location_from_match(content, match, source)
+        if "* [" in line:
             warnings.append(
                 ParseWarning(
                     message="Non-standard checkbox format (using * instead of -)",
-                    location=location,
+                    location=_line_location(line_number, line, source),
                     suggestion="Use '- [ ]' or '- [x]' for checkboxes",
                     code="NONSTANDARD_CHECKBOX",
                 )
             )
-        elif "[]" in full_match:
-            location = location_from_match(content, match, source)
+        elif "[]" in line:
             warnings.append(
                 ParseWarning(
                     message="Empty checkbox marker '[]', treating as unchecked",
-                    location=location,
+                    location=_line_location(line_number, line, source),
                     suggestion="Use '- [ ]' for unchecked items",
                     code="EMPTY_CHECKBOX",
                 )
             )
 
-    return items, warnings
+    return texts, checked, warnings
 
 
 # =============================================================================
@@ -693,7 +950,67 @@ def parse_checkboxes_tolerant(
 # =============================================================================
 
 
-@dataclass
+# Pattern for checkbox detection with optional metadata
+# Matches: - [ ] name, - [x] name, * [ ] name, + [ ] name
+_SUBTASK_CHECKBOX_PATTERN = re.compile(
+    r"^[\s]*([-*+])\s*\[([xX\s]?)\]\s*(.+?)$",
+    re.MULTILINE,
+)
+
+# Pattern to extract story points from text like "(2 SP)" or "(3 points)"
+_SUBTASK_POINTS_PATTERN = re.compile(
+    r"\s*\((\d+)\s*(?:SP|sp|pts?|points?|story\s*points?)\)\s*$",
+    re.IGNORECASE,
+)
+
+# Separators between a subtask name and its description
+_SUBTASK_DESCRIPTION_SEPARATORS = "-–—:"
+
+# Markdown formatting stripped from subtask names
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_PATTERN = re.compile(r"\*(.+?)\*")
+_CODE_SPAN_PATTERN = re.compile(r"`(.+?)`")
+_STRIKETHROUGH_PATTERN = re.compile(r"~~(.+?)~~")
+
+
+def _split_subtask_description(name: str) -> tuple[str, str]:
+    """
+    Split "Task - description" or "Task: description" at the first separator.
+
+    A separator counts from the second character on, when whitespace and at
+    least one more character follow it.
+
+    Returns:
+        Tuple of (name, description); the name is unchanged when there is no
+        separator, otherwise both parts are stripped
+    """
+    end = len(name) - 2
+    split = -1
+    for separator in _SUBTASK_DESCRIPTION_SEPARATORS:
+        index = name.find(separator, 1, end)
+        while index != -1 and not name[index + 1].isspace():
+            index = name.find(separator, index + 1, end)
+        if index != -1 and (split == -1 or index < split):
+            split = index
+    if split == -1:
+        return name, ""
+    return name[:split].strip(), name[split + 1 :].strip()
+
+
+def _strip_inline_formatting(text: str) -> str:
+    """Remove bold, italic, code and strikethrough markers from a subtask name."""
+    # Each pass only runs when its marker is present; most names have none
+    if "*" in text:
+        text = _BOLD_PATTERN.sub(r"\1", text)
+        text = _ITALIC_PATTERN.sub(r"\1", text)
+    if "`" in text:
+        text = _CODE_SPAN_PATTERN.sub(r"\1", text)
+    if "~~" in text:
+        text = _STRIKETHROUGH_PATTERN.sub(r"\1", text)
+    return text
+
+
+@dataclass(slots=True)
 class InlineSubtaskInfo:
     """
     Information about a subtask parsed from an inline checkbox.
@@ -759,50 +1076,28 @@ def parse_inline_subtasks(
     subtasks: list[InlineSubtaskInfo] = []
     warnings: list[ParseWarning] = []
 
-    # Pattern for checkbox detection with optional metadata
-    # Matches: - [ ] name, - [x] name, * [ ] name, + [ ] name
-    checkbox_pattern = re.compile(
-        r"^[\s]*[-*+]\s*\[([xX\s]?)\]\s*(.+?)$",
-        re.MULTILINE,
-    )
-
-    # Pattern to extract story points from text like "(2 SP)" or "(3 points)"
-    sp_pattern = re.compile(
-        r"\s*\((\d+)\s*(?:SP|sp|pts?|points?|story\s*points?)\)\s*$",
-        re.IGNORECASE,
-    )
-
-    # Pattern to extract description after separator (- or :)
-    desc_pattern = re.compile(
-        r"^(.+?)(?:\s*[-–—:]\s+(.+))?$",
-    )
+    # Every checkbox has a '['; content without one needs no scan
+    if "[" not in content:
+        return subtasks, warnings
 
-    for match in checkbox_pattern.finditer(content):
-        checkbox_char = match.group(1).strip().lower()
-        full_text = match.group(2).strip()
+    for match in _SUBTASK_CHECKBOX_PATTERN.finditer(content):
+        marker = match.group(1)
+        checkbox_char = match.group(2).strip().lower()
+        full_text = match.group(3).strip()
         checked = checkbox_char == "x"
-        line_number = get_line_number(content, match.start())
 
-        # Extract story points if present
+        # Extract story points if present; they close the (stripped) text
         story_points = 1
-        sp_match = sp_pattern.search(full_text)
+        sp_match = full_text.endswith(")") and _SUBTASK_POINTS_PATTERN.search(full_text)
         if sp_match:
             story_points = int(sp_match.group(1))
             full_text = full_text[: sp_match.start()].strip()
 
         # Remove markdown formatting (bold, code, etc.)
-        name = full_text
-        name = re.sub(r"\*\*(.+?)\*\*", r"\1", name)  # Remove bold
-        name = re.sub(r"\*(.+?)\*", r"\1", name)  # Remove italic
-        name = re.sub(r"`(.+?)`", r"\1", name)  # Remove code
-        name = re.sub(r"~~(.+?)~~", r"\1", name)  # Remove strikethrough
+        name = _strip_inline_formatting(full_text)
 
         # Extract description if separator found
-        description = ""
-        desc_match = desc_pattern.match(name)
-        if desc_match and desc_match.group(2):
-            name = desc_match.group(1).strip()
-            description = desc_match.group(2).strip()
+        name, description = _split_subtask_description(name)
 
         # Skip empty or very short names
         if len(name) < 2:
@@ -822,14 +1117,13 @@ def parse_inline_subtasks(
                 name=name,
                 checked=checked,
                 description=description,
-                line_number=line_number,
+                line_number=get_line_number(content, match.start()),
                 story_points=story_points,
             )
         )
 
         # Warn about non-standard formatting
-        original = match.group(0)
-        if "* [" in original or "+ [" in original:
+        if marker != "-":
             location = location_from_match(content, match, source)
             warnings.append(
                 ParseWarning(
@@ -848,6 +1142,28 @@ def parse_inline_subtasks(
 # =============================================================================
 
 
+# Very lenient description in a blockquote
+_BLOCKQUOTE_DESCRIPTION_PATTERN = re.compile(
+    r">\s*\*\*As\s+a\*\*\s*([^,\n]+)"
+    r"[\s\S]*?"
+    r"\*\*I\s+want\*\*\s*([^,\n]+)"
+    r"[\s\S]*?"
+    r"\*\*So\s+that\*\*\s*([^.\n]+)",
+    re.IGNORECASE,
+)
+
+# Individual description parts, for partial descriptions; the group that
+# matched names the part. Values stop before '*', so no part hides another.
+_DESCRIPTION_PART_PATTERN = re.compile(
+    r"\*\*(?:"
+    r"As\s+a\*\*\s*(?P<role>[^,\n*]+)"
+    r"|I\s+want\*\*\s*(?P<want>[^,\n*]+)"
+    r"|So\s+that\*\*\s*(?P<benefit>[^,.\n*]+)"
+    r")",
+    re.IGNORECASE,
+)
+
+
 def parse_description_tolerant(
     content: str,
     source: str | None = None,
@@ -871,6 +1187,10 @@ def parse_description_tolerant(
     """
     warnings: list[ParseWarning] = []
 
+    # Every format marks its keywords in bold
+    if "**" not in content:
+        return None, warnings
+
     # Try full multi-line pattern first
     match = TolerantPatterns.DESCRIPTION_FULL.search(content)
     if match:
@@ -890,15 +1210,7 @@ def parse_description_tolerant(
         }, warnings
 
     # Try very lenient pattern for blockquotes
-    lenient_blockquote = re.compile(
-        r">\s*\*\*As\s+a\*\*\s*([^,\n]+)"
-        r"[\s\S]*?"
-        r"\*\*I\s+want\*\*\s*([^,\n]+)"
-        r"[\s\S]*?"
-        r"\*\*So\s+that\*\*\s*([^.\n]+)",
-        re.IGNORECASE,
-    )
-    match = lenient_blockquote.search(content)
+    match = _BLOCKQUOTE_DESCRIPTION_PATTERN.search(content)
     if match:
         return {
             "role": _clean_description_part(match.group(1)),
@@ -907,20 +1219,21 @@ def parse_description_tolerant(
         }, warnings
 
     # Try partial matches with warnings
-    partial_parts: dict[str, str] = {}
-
-    # Look for individual parts
-    as_a_match = re.search(r"\*\*As\s+a\*\*\s*([^,\n*]+)", content, re.IGNORECASE)
-    if as_a_match:
-        partial_parts["role"] = _clean_description_part(as_a_match.group(1))
-
-    i_want_match = re.search(r"\*\*I\s+want\*\*\s*([^,\n*]+)", content, re.IGNORECASE)
-    if i_want_match:
-        partial_parts["want"] = _clean_description_part(i_want_match.group(1))
-
-    so_that_match = re.search(r"\*\*So\s+that\*\*\s*([^,.\n*]+)", content, re.IGNORECASE)
-    if so_that_match:
-        partial_parts["benefit"] = _clean_description_part(so_that_match.group(1))
+    found: dict[str, str] = {}
+
+    # Look for individual parts in one scan; the first of each part counts
+    for part_match in _DESCRIPTION_PART_PATTERN.finditer(content):
+        part = part_match.lastgroup
+        if part not in found:
+            found[part] = part_match[part]  # type: ignore[index]
+            if len(found) == 3:
+                break
+
+    partial_parts = {
+        part: _clean_description_part(found[part])
+        for part in ("role", "want", "benefit")
+        if part in found
+    }
 
     if partial_parts:
         missing = [k for k in ["role", "want", "benefit"] if k not in partial_parts]
@@ -2618,6 +2931,7 @@ __all__ = [
     "EmbeddedImage",
     # Core types
     "InlineSubtaskInfo",
+    "LineIndex",
     # Error codes
     "ParseErrorCode",
     "ParseErrorInfo",
@@ -2648,6 +2962,7 @@ __all__ = [
     "get_line_content",
     "get_line_number",
     "location_from_match",
+    "parse_checkbox_columns",
     "parse_checkboxes_tolerant",
     "parse_code_blocks",
     "parse_description_tolerant",
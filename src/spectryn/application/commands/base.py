@@ -7,7 +7,10 @@ Commands follow the Command pattern for:
 - Enabling logging and audit trails
 """
 
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Generic, TypeVar
@@ -18,6 +21,8 @@ from spectryn.core.ports.issue_tracker import IssueTrackerPort
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CommandResult(Generic[T]):
@@ -150,6 +155,64 @@ class CommandBatch:
 
         return self.results
 
+    def execute_parallel(
+        self,
+        max_workers: int,
+        on_result: Callable[[int, CommandResult], None] | None = None,
+    ) -> list[CommandResult]:
+        """
+        Execute all commands concurrently on a thread pool.
+
+        Intended for I/O-bound commands that each make a tracker request.
+        Results are returned in the order the commands were added. Since
+        commands are already in flight when a failure is seen,
+        ``stop_on_error`` is not honored. Unexpected exceptions are captured
+        as failed results so one bad command doesn't abort the batch.
+
+        Args:
+            max_workers: Maximum number of commands to run at once.
+            on_result: Optional callback invoked on the calling thread with
+                each command's index and result as soon as it finishes.
+
+        Returns:
+            List of CommandResult, one per command.
+        """
+        if not self.commands:
+            self.results = []
+            return self.results
+
+        results: list[CommandResult | None] = [None] * len(self.commands)
+        workers = max(1, min(max_workers, len(self.commands)))
+        if workers == 1:
+            # Nothing to overlap, so don't pay for a pool
+            for index, command in enumerate(self.commands):
+                result = results[index] = self._execute_guarded(command)
+                if on_result is not None:
+                    on_result(index, result)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._execute_guarded, command): index
+                    for index, command in enumerate(self.commands)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    result = results[index] = future.result()
+                    if on_result is not None:
+                        on_result(index, result)
+
+        self.results = [result for result in results if result is not None]
+        return self.results
+
+    @staticmethod
+    def _execute_guarded(command: Command) -> CommandResult:
+        """Execute a command, converting unexpected exceptions to failures."""
+        try:
+            return command.execute()
+        except Exception as e:
+            logger.exception(f"Unexpected error in {command.name}")
+            return CommandResult.fail(f"Unexpected error: {e}")
+
     @property
     def all_succeeded(self) -> bool:
         """Check if all commands succeeded."""
@@ -12,6 +12,7 @@ from spectryn.core.domain.events import (
     StoryUpdated,
     SubtaskCreated,
 )
+from spectryn.core.memory import intern_string
 from spectryn.core.ports.issue_tracker import IssueTrackerError, IssueTrackerPort
 
 from .base import Command, CommandResult
@@ -86,7 +87,7 @@ class UpdateDescriptionCommand(Command):
             if success:
                 self._publish_event(
                     StoryUpdated(
-                        issue_key=self.issue_key,
+                        issue_key=intern_string(self.issue_key),
                         field_name="description",
                     )
                 )
@@ -188,32 +189,82 @@ class CreateSubtaskCommand(Command):
             if self.dry_run:
                 return CommandResult.ok("[DRY-RUN] Would create subtask", dry_run=True)
 
-            new_key = self.tracker.create_subtask(
-                parent_key=self.parent_key,
-                summary=self.summary,
-                description=self.description or "",
-                project_key=self.project_key,
-                story_points=self.story_points,
-                assignee=self.assignee,
-                priority=self.priority,
-            )
+            new_key = self.tracker.create_subtask(**self._create_kwargs())
+            return self._created(new_key)
 
-            if new_key:
-                self._undo_data = new_key
-                self._publish_event(
-                    SubtaskCreated(
-                        parent_key=self.parent_key,
-                        subtask_key=new_key,
-                        subtask_name=self.summary,
-                        story_points=self.story_points or 0,
+        except IssueTrackerError as e:
+            return CommandResult.fail(str(e))
+
+    @classmethod
+    def execute_bulk(cls, commands: list["CreateSubtaskCommand"]) -> list[CommandResult[str]]:
+        """Execute several create commands with one bulk tracker call.
+
+        Invalid and dry-run commands are executed on their own. The rest go
+        through ``create_subtasks_bulk`` of the first command's tracker, so
+        the commands must share a tracker.
+
+        Args:
+            commands: Commands to execute.
+
+        Returns:
+            One CommandResult per command, in the order given.
+        """
+        results: list[CommandResult[str] | None] = [None] * len(commands)
+        pending: list[int] = []
+        for i, cmd in enumerate(commands):
+            if cmd.dry_run or cmd.validate():
+                results[i] = cmd.execute()
+            else:
+                pending.append(i)
+
+        if pending:
+            tracker = commands[pending[0]].tracker
+            try:
+                created = tracker.create_subtasks_bulk(
+                    [commands[i]._create_kwargs() for i in pending]
+                )
+                if len(created) != len(pending):
+                    raise IssueTrackerError(
+                        f"Bulk create returned {len(created)} results for {len(pending)} subtasks"
                     )
+            except IssueTrackerError as e:
+                created = [e] * len(pending)
+
+            for i, new_key in zip(pending, created, strict=True):
+                if isinstance(new_key, IssueTrackerError):
+                    results[i] = CommandResult.fail(str(new_key))
+                else:
+                    results[i] = commands[i]._created(new_key)
+
+        return [result for result in results if result is not None]
+
+    def _create_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for the tracker's create_subtask."""
+        return {
+            "parent_key": self.parent_key,
+            "summary": self.summary,
+            "description": self.description or "",
+            "project_key": self.project_key,
+            "story_points": self.story_points,
+            "assignee": self.assignee,
+            "priority": self.priority,
+        }
+
+    def _created(self, new_key: str | None) -> CommandResult[str]:
+        """Record a created subtask, or fail if the tracker returned no key."""
+        if new_key:
+            self._undo_data = new_key
+            self._publish_event(
+                SubtaskCreated(
+                    parent_key=intern_string(self.parent_key),
+                    subtask_key=intern_string(new_key),
+                    subtask_name=self.summary,
+                    story_points=self.story_points or 0,
                 )
-                return CommandResult.ok(new_key)
-
-            return CommandResult.fail("Failed to create subtask")
+            )
+            return CommandResult.ok(new_key)
 
-        except IssueTrackerError as e:
-            return CommandResult.fail(str(e))
+        return CommandResult.fail("Failed to create subtask")
 
 
 @dataclass
@@ -357,7 +408,7 @@ class AddCommentCommand(Command):
             if success:
                 self._publish_event(
                     CommentAdded(
-                        issue_key=self.issue_key,
+                        issue_key=intern_string(self.issue_key),
                         comment_type="text",
                     )
                 )
@@ -441,9 +492,9 @@ class TransitionStatusCommand(Command):
             if success:
                 self._publish_event(
                     StatusTransitioned(
-                        issue_key=self.issue_key,
-                        from_status=self._undo_data,
-                        to_status=self.target_status,
+                        issue_key=intern_string(self.issue_key),
+                        from_status=intern_string(self._undo_data),
+                        to_status=intern_string(self.target_status),
                     )
                 )
 
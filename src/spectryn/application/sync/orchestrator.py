@@ -6,13 +6,19 @@ This is the main entry point for sync operations.
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerPort
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerPort, content_hash
 
 
 if TYPE_CHECKING:
@@ -23,6 +29,9 @@ if TYPE_CHECKING:
 
 from spectryn.application.commands import (
     AddCommentCommand,
+    Command,
+    CommandBatch,
+    CommandResult,
     CreateSubtaskCommand,
     TransitionStatusCommand,
     UpdateDescriptionCommand,
@@ -37,6 +46,16 @@ from spectryn.core.ports.document_parser import DocumentParserPort
 from .progress import ProgressReporter, SyncPhase, create_progress_reporter
 
 
+# Heading of the commit table comment added by the comments phase
+COMMITS_COMMENT_MARKER = "Related Commits"
+
+# Seconds a sync_*_only call may reuse the previous analysis of the same inputs
+ANALYSIS_REUSE_SECONDS = 60.0
+
+# Lowercased tracker statuses the status phase treats as already done
+_COMPLETED_STATUSES: frozenset[str] = frozenset({"resolved", "done", "closed"})
+
+
 @dataclass
 class FailedOperation:
     """
@@ -60,6 +79,17 @@ class FailedOperation:
 
 
 @dataclass
+class _QueuedOperation:
+    """A command queued by a sync phase, with the context needed to report it."""
+
+    command: Command
+    operation: str
+    issue_key: str
+    story_id: str
+    label: str = ""  # Progress label shown when the result is recorded
+
+
+@dataclass(slots=True)
 class SyncResult:
     """
     Result of a sync operation with graceful degradation support.
@@ -157,6 +187,23 @@ class SyncResult:
         """
         self.warnings.append(warning)
 
+    def merge(self, other: SyncResult) -> None:
+        """
+        Fold the counts and messages of a phase-local result into this one.
+
+        Args:
+            other: Result produced by a subset of the sync phases.
+        """
+        self.success = self.success and other.success
+        self.stories_updated += other.stories_updated
+        self.subtasks_created += other.subtasks_created
+        self.subtasks_updated += other.subtasks_updated
+        self.comments_added += other.comments_added
+        self.statuses_updated += other.statuses_updated
+        self.failed_operations.extend(other.failed_operations)
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+
     @property
     def partial_success(self) -> bool:
         """
@@ -298,13 +345,34 @@ class SyncOrchestrator:
 
         self._md_stories: list[UserStory] = []
         self._jira_issues: list[IssueData] = []
+        # Epic child count and issue_key -> description hash, from the fetched
+        # issues or, when the fetch is skipped, from the run whose matches are reused
+        self._jira_issue_count = 0
+        self._description_hashes: dict[str, str] = {}
         self._matches: dict[str, str] = {}  # story_id -> issue_key
+        # Matched (story, issue_key) pairs in markdown order, shared by all phases
+        self._matched_pairs: list[tuple[UserStory, str]] = []
         self._state: SyncState | None = None
         self._last_backup: Backup | None = None
 
+        # (markdown_path, epic_key, markdown mtime) of the last analysis, and
+        # the monotonic time until which the *_only methods may reuse it
+        self._analysis_key: tuple[str, str, int] | None = None
+        self._analysis_expires = 0.0
+
+        # Inputs of the current matching, persisted so later runs can reuse it
+        self._markdown_hash = ""
+        self._epic_updated = ""
+
         # Cached priority lookup (project_key -> {priority_name_lower: priority_id})
         self._priority_cache: dict[str | None, dict[str, str]] = {}
 
+        # Per-run tracker read caches (issue_key -> data), cleared by analyze()
+        self._issue_cache: dict[str, IssueData] = {}
+        self._comments_cache: dict[str, list[dict]] = {}
+        # Formatted ADF per markdown text; subtasks often repeat descriptions
+        self._adf_cache: dict[str, Any] = {}
+
         # Incremental sync support
         self._change_tracker: ChangeTracker | None = None
         self._changed_story_ids: set[str] = set()
@@ -313,8 +381,9 @@ class SyncOrchestrator:
         self._delta_tracker: DeltaTracker | None = None
         self._delta_result: DeltaSyncResult | None = None
 
-        # Progress reporting
+        # Progress reporting (guarded by a lock while phases run concurrently)
         self._progress: ProgressReporter | None = None
+        self._progress_lock = threading.Lock()
         if self.config.incremental:
             from .incremental import ChangeTracker
 
@@ -378,7 +447,7 @@ class SyncOrchestrator:
 
         # Check epic exists
         try:
-            epic_data = self.tracker.get_issue(epic_key)
+            epic_data = self.tracker.get_issue_light(epic_key)
             if not epic_data:
                 errors.append(f"Epic {epic_key} not found in Jira")
         except Exception as e:
@@ -437,20 +506,132 @@ class SyncOrchestrator:
             SyncResult with analysis details
         """
         result = SyncResult(dry_run=True)
+        # Stat the inputs before reading them, but only record the analysis as
+        # reusable once it completes; a failed run must not be reused with
+        # this run's stories and the previous run's issues and matches
+        analysis_key = self._analysis_inputs(markdown_path, epic_key)
+        self._analysis_key = None
+        self._analysis_expires = 0.0
+
+        # Tracker reads are only cached for the duration of one run
+        self._issue_cache.clear()
+        self._comments_cache.clear()
+        self._adf_cache.clear()
 
         # Parse markdown
         self._md_stories = self.parser.parse_stories(markdown_path)
         self.logger.info(f"Parsed {len(self._md_stories)} stories from markdown")
 
+        # Reuse the last completed run's matches if neither side has changed
+        previous = self._load_reusable_state(markdown_path, epic_key)
+        if previous is not None:
+            self._jira_issues = []
+            self._jira_issue_count = previous.issue_count
+            self._description_hashes = dict(previous.description_hashes)
+            self._apply_cached_matches(dict(previous.matched_stories), result)
+            self.logger.info("Markdown and epic unchanged, reusing previous story matches")
+            self._remember_analysis(analysis_key)
+            return result
+
         # Fetch Jira issues
         self._jira_issues = self.tracker.get_epic_children(epic_key)
-        self.logger.info(f"Found {len(self._jira_issues)} issues in Jira epic")
+        self._jira_issue_count = len(self._jira_issues)
+        self._description_hashes = {
+            issue.key: description_hash
+            for issue in self._jira_issues
+            if (description_hash := issue.description_hash) is not None
+        }
+        self.logger.info(f"Found {self._jira_issue_count} issues in Jira epic")
 
         # Match stories
         self._match_stories(result)
 
+        self._remember_analysis(analysis_key)
         return result
 
+    def _remember_analysis(self, analysis_key: tuple[str, str, int] | None) -> None:
+        """Allow _ensure_analyzed to reuse the analysis just completed."""
+        self._analysis_key = analysis_key
+        self._analysis_expires = time.monotonic() + ANALYSIS_REUSE_SECONDS
+
+    def _analysis_inputs(self, markdown_path: str, epic_key: str) -> tuple[str, str, int] | None:
+        """Identify an analysis by its inputs, or None if the markdown can't be stat'ed."""
+        try:
+            mtime = Path(markdown_path).stat().st_mtime_ns
+        except OSError:
+            return None
+        return (markdown_path, epic_key, mtime)
+
+    def _ensure_analyzed(self, markdown_path: str, epic_key: str) -> None:
+        """
+        Analyze unless the previous analysis of the same inputs is still fresh.
+
+        Lets sync_*_only calls made back to back share one parse, fetch and
+        match. The reuse window is short so tracker-side edits are picked up.
+        """
+        key = self._analysis_inputs(markdown_path, epic_key)
+        fresh = time.monotonic() < self._analysis_expires
+        if key is not None and key == self._analysis_key and fresh:
+            self.logger.debug("Reusing analysis of the previous call")
+            return
+        self.analyze(markdown_path, epic_key)
+
+    def _load_reusable_state(self, markdown_path: str, epic_key: str) -> SyncState | None:
+        """
+        Load the last completed run's state, if its matches are still valid.
+
+        Matches are reused only when the markdown content hash and the
+        tracker's epic marker both equal the ones recorded with that run; the
+        unchanged marker also means the recorded description hashes still
+        hold. Records the current hash and marker for the next run either way.
+
+        Returns:
+            The previous run's state, or None if matching must be redone.
+        """
+        self._markdown_hash = ""
+        self._epic_updated = ""
+
+        # Delta sync compares against the fetched remote issues, so it can't skip them
+        if self.state_store is None or self._delta_tracker or self.config.force_full_sync:
+            return None
+
+        try:
+            self._markdown_hash = hashlib.blake2b(Path(markdown_path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+        epic_updated = self.tracker.get_epic_updated(epic_key)
+        if epic_updated is None:
+            return None
+        self._epic_updated = epic_updated
+
+        previous = self.state_store.find_latest_completed(markdown_path, epic_key)
+        if (
+            previous is None
+            or previous.markdown_hash != self._markdown_hash
+            or previous.epic_updated != self._epic_updated
+        ):
+            return None
+
+        return previous
+
+    def _apply_cached_matches(self, matches: dict[str, str], result: SyncResult) -> None:
+        """Populate matches and match results from a previous run's matches."""
+        self._matches = {}
+        self._matched_pairs = []
+
+        for md_story in self._md_stories:
+            story_id = str(md_story.id)
+            if story_id in matches:
+                self._matches[story_id] = matches[story_id]
+                self._matched_pairs.append((md_story, matches[story_id]))
+                result.matched_stories.append((story_id, matches[story_id]))
+            else:
+                result.unmatched_stories.append(story_id)
+                result.add_warning(f"Could not match story: {md_story.id} - {md_story.title}")
+
+        result.stories_matched = len(self._matches)
+
     def sync(
         self,
         markdown_path: str,
@@ -500,9 +681,10 @@ class SyncOrchestrator:
         if self._progress:
             self._progress.start_phase(SyncPhase.ANALYZING)
         self._report_progress(progress_callback, "Analyzing", 1, total_phases)
-        self.analyze(markdown_path, epic_key)
-        result.stories_matched = len(self._matches)
-        result.matched_stories = list(self._matches.items())
+        analysis = self.analyze(markdown_path, epic_key)
+        result.stories_matched = analysis.stories_matched
+        # Take over the list built during matching rather than rebuilding it
+        result.matched_stories = analysis.matched_stories
 
         # Phase 1b: Detect changes (incremental sync)
         if self.config.incremental and self._change_tracker and not self.config.force_full_sync:
@@ -544,38 +726,8 @@ class SyncOrchestrator:
                 }
                 self._changed_story_ids &= stories_with_field_changes
 
-        # Phase 2: Update descriptions
-        if self.config.sync_descriptions:
-            if self._progress:
-                # Count stories with descriptions to sync
-                stories_with_desc = self._count_syncable_descriptions()
-                self._progress.start_phase(SyncPhase.DESCRIPTIONS, stories_with_desc)
-            self._report_progress(progress_callback, "Updating descriptions", 2, total_phases)
-            self._sync_descriptions(result)
-
-        # Phase 3: Sync subtasks
-        if self.config.sync_subtasks:
-            if self._progress:
-                # Count total subtasks to sync
-                total_subtasks = self._count_syncable_subtasks()
-                self._progress.start_phase(SyncPhase.SUBTASKS, total_subtasks)
-            self._report_progress(progress_callback, "Syncing subtasks", 3, total_phases)
-            self._sync_subtasks(result)
-
-        # Phase 4: Add commit comments
-        if self.config.sync_comments:
-            if self._progress:
-                stories_with_commits = self._count_syncable_comments()
-                self._progress.start_phase(SyncPhase.COMMENTS, stories_with_commits)
-            self._report_progress(progress_callback, "Adding comments", 4, total_phases)
-            self._sync_comments(result)
-
-        # Phase 5: Sync statuses
-        if self.config.sync_statuses:
-            if self._progress:
-                self._progress.start_phase(SyncPhase.STATUSES)
-            self._report_progress(progress_callback, "Syncing statuses", 5, total_phases)
-            self._sync_statuses(result)
+        # Phases 2-5: descriptions, subtasks then statuses, comments
+        self._run_phase_groups(self._build_phase_groups(progress_callback, total_phases), result)
 
         # Save incremental sync state (on successful non-dry-run)
         if (
@@ -694,7 +846,7 @@ class SyncOrchestrator:
             SyncResult with sync details.
         """
         result = SyncResult(dry_run=self.config.dry_run)
-        self.analyze(markdown_path, epic_key)
+        self._ensure_analyzed(markdown_path, epic_key)
         self._sync_descriptions(result)
         return result
 
@@ -714,7 +866,7 @@ class SyncOrchestrator:
             SyncResult with sync details.
         """
         result = SyncResult(dry_run=self.config.dry_run)
-        self.analyze(markdown_path, epic_key)
+        self._ensure_analyzed(markdown_path, epic_key)
         self._sync_subtasks(result)
         return result
 
@@ -738,7 +890,7 @@ class SyncOrchestrator:
             SyncResult with sync details.
         """
         result = SyncResult(dry_run=self.config.dry_run)
-        self.analyze(markdown_path, epic_key)
+        self._ensure_analyzed(markdown_path, epic_key)
         self._sync_statuses(result, target_status)
         return result
 
@@ -750,25 +902,40 @@ class SyncOrchestrator:
         """
         Match markdown stories to Jira issues by title.
 
-        Populates self._matches with story_id -> issue_key mappings.
+        Populates self._matches with story_id -> issue_key mappings and
+        self._matched_pairs with the matched (story, issue_key) pairs.
         Updates result with matched and unmatched story information.
 
         Args:
             result: SyncResult to update with matching results.
         """
         self._matches = {}
+        self._matched_pairs = []
+
+        # Normalize each issue title once; exact matches resolve in O(1)
+        # and the first issue wins on duplicates
+        normalized_issues = [
+            (UserStory.normalize_external_title(jira_issue.summary), jira_issue)
+            for jira_issue in self._jira_issues
+        ]
+        title_index: dict[str, IssueData] = {}
+        for normalized, jira_issue in normalized_issues:
+            title_index.setdefault(normalized, jira_issue)
 
         for md_story in self._md_stories:
-            matched_issue = None
+            story_title = md_story.normalize_title()
+            matched_issue = title_index.get(story_title)
 
-            # Try to match by title
-            for jira_issue in self._jira_issues:
-                if md_story.matches_title(jira_issue.summary):
-                    matched_issue = jira_issue
-                    break
+            # Fall back to fuzzy (substring) matching by title
+            if matched_issue is None:
+                for normalized, jira_issue in normalized_issues:
+                    if UserStory.normalized_titles_match(story_title, normalized):
+                        matched_issue = jira_issue
+                        break
 
             if matched_issue:
                 self._matches[str(md_story.id)] = matched_issue.key
+                self._matched_pairs.append((md_story, matched_issue.key))
                 result.matched_stories.append((str(md_story.id), matched_issue.key))
                 self.logger.debug(f"Matched {md_story.id} -> {matched_issue.key}")
             else:
@@ -786,30 +953,34 @@ class SyncOrchestrator:
         Sync story descriptions from markdown to issue tracker.
 
         Creates UpdateDescriptionCommand for each matched story with a description,
-        and executes them individually with progress reporting.
+        and executes them concurrently with progress reporting. Stories whose
+        formatted description hashes the same as the tracker's current one are
+        skipped, so unchanged descriptions aren't written again.
 
         Args:
             result: SyncResult to update with operation counts and errors.
         """
-        for md_story in self._md_stories:
+        queued: list[_QueuedOperation] = []
+
+        # Current descriptions of the epic children, as known to analyze()
+        current_hashes = self._description_hashes
+
+        for md_story, issue_key in self._matched_pairs:
             story_id = str(md_story.id)
-            if story_id not in self._matches:
-                continue
 
             # Skip unchanged stories in incremental mode
             if self.config.incremental and story_id not in self._changed_story_ids:
                 continue
 
-            issue_key = self._matches[story_id]
-
             # Only update if story has description
             if md_story.description:
-                # Report progress
-                if self._progress:
-                    self._progress.update_item(f"{issue_key}: {md_story.title[:30]}")
-
                 adf = self.formatter.format_story_description(md_story)
 
+                current_hash = current_hashes.get(issue_key)
+                if current_hash is not None and current_hash == content_hash(adf):
+                    self.logger.debug(f"Description of {issue_key} unchanged, skipping")
+                    continue
+
                 cmd = UpdateDescriptionCommand(
                     tracker=self.tracker,
                     issue_key=issue_key,
@@ -817,57 +988,213 @@ class SyncOrchestrator:
                     event_bus=self.event_bus,
                     dry_run=self.config.dry_run,
                 )
-
-                cmd_result = cmd.execute()
-                if cmd_result.success:
-                    result.stories_updated += 1
-                elif cmd_result.error:
-                    result.add_failed_operation(
+                queued.append(
+                    _QueuedOperation(
+                        command=cmd,
                         operation="update_description",
                         issue_key=issue_key,
-                        error=cmd_result.error,
                         story_id=story_id,
+                        label=f"{issue_key}: {md_story.title[:30]}",
                     )
+                )
+
+        for op, cmd_result in self._execute_queued(queued, SyncPhase.DESCRIPTIONS):
+            if cmd_result.success:
+                result.stories_updated += 1
+            elif cmd_result.error:
+                self._record_failure(result, op, cmd_result.error)
 
     def _sync_subtasks(self, result: SyncResult) -> None:
         """
         Sync subtasks from markdown to issue tracker.
 
         For each matched story, creates new subtasks or updates existing ones
-        based on name matching. Uses graceful degradation - failures don't
+        based on name matching. Commands for all stories are executed
+        concurrently once queued. Uses graceful degradation - failures don't
         stop processing of remaining subtasks.
 
         Args:
             result: SyncResult to update with operation counts and errors.
         """
-        for md_story in self._md_stories:
-            story_id = str(md_story.id)
+        queued: list[_QueuedOperation] = []
 
-            # Skip unmatched or unchanged stories
-            if not self._should_sync_story_subtasks(story_id):
-                continue
+        pairs = [
+            (md_story, issue_key)
+            for md_story, issue_key in self._matched_pairs
+            if self._should_sync_story_subtasks(str(md_story.id))
+        ]
+        self._prefetch_issues([issue_key for _, issue_key in pairs])
 
-            issue_key = self._matches[story_id]
+        for md_story, issue_key in pairs:
+            story_id = str(md_story.id)
             existing_subtasks = self._fetch_existing_subtasks(issue_key, story_id, result)
 
             if existing_subtasks is None:
                 continue  # Failed to fetch, already logged
 
-            # Sync each subtask
-            project_key = issue_key.split("-")[0]
+            # Queue each subtask (stories may live outside the epic's project)
+            project_key = issue_key.partition("-")[0]
             for md_subtask in md_story.subtasks:
-                # Report progress
-                if self._progress:
-                    self._progress.update_item(f"{issue_key}: {md_subtask.name[:25]}")
-
                 self._sync_single_subtask(
-                    md_subtask, existing_subtasks, issue_key, project_key, story_id, result
+                    md_subtask,
+                    existing_subtasks,
+                    issue_key,
+                    project_key,
+                    story_id,
+                    queued=queued,
+                    result=result,
                 )
 
+        executed: Iterator[tuple[_QueuedOperation, CommandResult]]
+        if self.config.dry_run:
+            executed = self._execute_queued(queued, SyncPhase.SUBTASKS)
+        else:
+            # New subtasks go through the tracker's bulk create; updates stay per issue
+            creates = [
+                (op, op.command) for op in queued if isinstance(op.command, CreateSubtaskCommand)
+            ]
+            updates = [op for op in queued if not isinstance(op.command, CreateSubtaskCommand)]
+            executed = chain(
+                self._execute_queued(updates, SyncPhase.SUBTASKS),
+                self._execute_creates_bulk(creates),
+            )
+
+        for op, cmd_result in executed:
+            if cmd_result.success:
+                if op.operation == "create_subtask":
+                    result.subtasks_created += 1
+                    if not cmd_result.dry_run:
+                        self._record_created_subtask(op, cmd_result.data)
+                elif not cmd_result.dry_run:
+                    result.subtasks_updated += 1
+            elif cmd_result.error:
+                self._record_failure(result, op, cmd_result.error)
+
+    def _record_created_subtask(self, op: _QueuedOperation, subtask_key: str) -> None:
+        """
+        Add a newly created subtask to its parent's cached issue.
+
+        The status phase then sees the subtask without fetching the parent
+        again. Its status is left unknown, so it is treated as not done.
+        Updates only touch fields that no later phase reads from the cache.
+        """
+        parent = self._issue_cache.get(op.issue_key)
+        if parent is None or not isinstance(op.command, CreateSubtaskCommand):
+            return
+        parent.subtasks.append(
+            IssueData(key=subtask_key, summary=op.command.summary, issue_type="Sub-task")
+        )
+
+    def _build_phase_groups(
+        self, progress_callback: Callable | None, total_phases: int
+    ) -> list[list[Callable[[SyncResult], None]]]:
+        """
+        Group the enabled write phases by data dependency.
+
+        Phases in different groups touch disjoint issue data and can run at
+        the same time. Statuses stay behind subtasks in one group because
+        they transition the subtasks that phase creates.
+        """
+        groups: list[list[Callable[[SyncResult], None]]] = []
+        args = {"progress_callback": progress_callback, "total_phases": total_phases}
+
+        if self.config.sync_descriptions:
+            groups.append([partial(self._run_descriptions_phase, **args)])
+
+        subtask_group: list[Callable[[SyncResult], None]] = []
+        if self.config.sync_subtasks:
+            subtask_group.append(partial(self._run_subtasks_phase, **args))
+        if self.config.sync_statuses:
+            subtask_group.append(partial(self._run_statuses_phase, **args))
+        if subtask_group:
+            groups.append(subtask_group)
+
+        if self.config.sync_comments:
+            groups.append([partial(self._run_comments_phase, **args)])
+
+        return groups
+
+    def _run_phase_groups(
+        self, groups: list[list[Callable[[SyncResult], None]]], result: SyncResult
+    ) -> None:
+        """
+        Run phase groups, concurrently when config.concurrent_phases is set.
+
+        Each concurrent group records into its own SyncResult, merged into
+        ``result`` in group order once all groups finish. Tracker requests
+        from every group still share the adapter's rate limiter.
+        """
+        if not self.config.concurrent_phases or len(groups) < 2:
+            for group in groups:
+                for phase in group:
+                    phase(result)
+            return
+
+        partials = [SyncResult(dry_run=result.dry_run) for _ in groups]
+        with ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="sync-phase") as pool:
+            futures = [
+                pool.submit(self._run_phase_group, group, partial_result)
+                for group, partial_result in zip(groups, partials, strict=True)
+            ]
+            for future in futures:
+                future.result()
+
+        for partial_result in partials:
+            result.merge(partial_result)
+
+    @staticmethod
+    def _run_phase_group(group: list[Callable[[SyncResult], None]], result: SyncResult) -> None:
+        """Run the phases of one group in order."""
+        for phase in group:
+            phase(result)
+
+    def _run_descriptions_phase(
+        self, result: SyncResult, progress_callback: Callable | None, total_phases: int
+    ) -> None:
+        """Phase 2: Update descriptions."""
+        with self._progress_lock:
+            if self._progress:
+                # Count stories with descriptions to sync
+                stories_with_desc = self._count_syncable_descriptions()
+                self._progress.start_phase(SyncPhase.DESCRIPTIONS, stories_with_desc)
+            self._report_progress(progress_callback, "Updating descriptions", 2, total_phases)
+        self._sync_descriptions(result)
+
+    def _run_subtasks_phase(
+        self, result: SyncResult, progress_callback: Callable | None, total_phases: int
+    ) -> None:
+        """Phase 3: Sync subtasks."""
+        with self._progress_lock:
+            if self._progress:
+                # Count total subtasks to sync
+                total_subtasks = self._count_syncable_subtasks()
+                self._progress.start_phase(SyncPhase.SUBTASKS, total_subtasks)
+            self._report_progress(progress_callback, "Syncing subtasks", 3, total_phases)
+        self._sync_subtasks(result)
+
+    def _run_comments_phase(
+        self, result: SyncResult, progress_callback: Callable | None, total_phases: int
+    ) -> None:
+        """Phase 4: Add commit comments."""
+        with self._progress_lock:
+            if self._progress:
+                stories_with_commits = self._count_syncable_comments()
+                self._progress.start_phase(SyncPhase.COMMENTS, stories_with_commits)
+            self._report_progress(progress_callback, "Adding comments", 4, total_phases)
+        self._sync_comments(result)
+
+    def _run_statuses_phase(
+        self, result: SyncResult, progress_callback: Callable | None, total_phases: int
+    ) -> None:
+        """Phase 5: Sync statuses."""
+        with self._progress_lock:
+            if self._progress:
+                self._progress.start_phase(SyncPhase.STATUSES)
+            self._report_progress(progress_callback, "Syncing statuses", 5, total_phases)
+        self._sync_statuses(result)
+
     def _should_sync_story_subtasks(self, story_id: str) -> bool:
-        """Check if a story's subtasks should be synced."""
-        if story_id not in self._matches:
-            return False
+        """Check if a matched story's subtasks should be synced."""
         return not (self.config.incremental and story_id not in self._changed_story_ids)
 
     def _fetch_existing_subtasks(
@@ -877,8 +1204,8 @@ class SyncOrchestrator:
         from spectryn.core.ports.issue_tracker import IssueTrackerError
 
         try:
-            jira_issue = self.tracker.get_issue(issue_key)
-            return {st.summary.lower(): st for st in jira_issue.subtasks}
+            jira_issue = self._get_issue_cached(issue_key)
+            return {st.summary_lower: st for st in jira_issue.subtasks}
         except IssueTrackerError as e:
             result.add_failed_operation(
                 operation="fetch_issue",
@@ -896,19 +1223,26 @@ class SyncOrchestrator:
         parent_key: str,
         project_key: str,
         story_id: str,
+        *,
+        queued: list[_QueuedOperation],
         result: SyncResult,
     ) -> None:
-        """Sync a single subtask - update if exists, create if new."""
+        """Queue a single subtask sync - update if exists, create if new."""
 
         subtask_name_lower = md_subtask.name.lower()
+        label = f"{parent_key}: {md_subtask.name[:25]}"
 
         try:
             if subtask_name_lower in existing_subtasks:
-                self._update_existing_subtask(
-                    md_subtask, existing_subtasks[subtask_name_lower], story_id, result
+                queued.append(
+                    self._update_existing_subtask(
+                        md_subtask, existing_subtasks[subtask_name_lower], story_id, label
+                    )
                 )
             else:
-                self._create_new_subtask(md_subtask, parent_key, project_key, story_id, result)
+                queued.append(
+                    self._create_new_subtask(md_subtask, parent_key, project_key, story_id, label)
+                )
         except Exception as e:
             result.add_failed_operation(
                 operation="sync_subtask",
@@ -923,9 +1257,9 @@ class SyncOrchestrator:
         md_subtask: Subtask,
         existing: IssueData,
         story_id: str,
-        result: SyncResult,
-    ) -> None:
-        """Update an existing subtask."""
+        label: str,
+    ) -> _QueuedOperation:
+        """Build the update for an existing subtask."""
         update_cmd = UpdateSubtaskCommand(
             tracker=self.tracker,
             issue_key=existing.key,
@@ -934,17 +1268,13 @@ class SyncOrchestrator:
             event_bus=self.event_bus,
             dry_run=self.config.dry_run,
         )
-        update_result = update_cmd.execute()
-
-        if update_result.success and not update_result.dry_run:
-            result.subtasks_updated += 1
-        elif not update_result.success and update_result.error:
-            result.add_failed_operation(
-                operation="update_subtask",
-                issue_key=existing.key,
-                error=update_result.error,
-                story_id=story_id,
-            )
+        return _QueuedOperation(
+            command=update_cmd,
+            operation="update_subtask",
+            issue_key=existing.key,
+            story_id=story_id,
+            label=label,
+        )
 
     def _create_new_subtask(
         self,
@@ -952,10 +1282,10 @@ class SyncOrchestrator:
         parent_key: str,
         project_key: str,
         story_id: str,
-        result: SyncResult,
-    ) -> None:
-        """Create a new subtask."""
-        adf = self.formatter.format_text(md_subtask.description)
+        label: str,
+    ) -> _QueuedOperation:
+        """Build the creation of a new subtask."""
+        adf = self._format_text_cached(md_subtask.description)
 
         create_cmd = CreateSubtaskCommand(
             tracker=self.tracker,
@@ -967,17 +1297,13 @@ class SyncOrchestrator:
             event_bus=self.event_bus,
             dry_run=self.config.dry_run,
         )
-        create_result = create_cmd.execute()
-
-        if create_result.success:
-            result.subtasks_created += 1
-        elif create_result.error:
-            result.add_failed_operation(
-                operation="create_subtask",
-                issue_key=parent_key,
-                error=create_result.error,
-                story_id=story_id,
-            )
+        return _QueuedOperation(
+            command=create_cmd,
+            operation="create_subtask",
+            issue_key=parent_key,
+            story_id=story_id,
+            label=label,
+        )
 
     def _sync_comments(self, result: SyncResult) -> None:
         """
@@ -991,32 +1317,35 @@ class SyncOrchestrator:
         """
         from spectryn.core.ports.issue_tracker import IssueTrackerError
 
-        for md_story in self._md_stories:
+        queued: list[_QueuedOperation] = []
+
+        pairs = [
+            (md_story, issue_key)
+            for md_story, issue_key in self._matched_pairs
+            # Only stories with commits, skipping unchanged ones in incremental mode
+            if md_story.commits
+            and not (self.config.incremental and str(md_story.id) not in self._changed_story_ids)
+        ]
+        self._prefetch_comments([issue_key for _, issue_key in pairs])
+
+        # Resolve the "already commented" check once from the prefetched comments
+        already_commented = {
+            issue_key
+            for _, issue_key in pairs
+            if issue_key in self._comments_cache
+            and self._has_commits_comment(self._comments_cache[issue_key])
+        }
+
+        for md_story, issue_key in pairs:
             story_id = str(md_story.id)
-            if story_id not in self._matches:
-                continue
-
-            if not md_story.commits:
-                continue
-
-            # Skip unchanged stories in incremental mode
-            if self.config.incremental and story_id not in self._changed_story_ids:
+            if issue_key in already_commented:
                 continue
 
-            issue_key = self._matches[story_id]
-
-            # Report progress
-            if self._progress:
-                self._progress.update_item(f"{issue_key}: {len(md_story.commits)} commits")
-
             try:
-                # Check if commits comment already exists
-                existing_comments = self.tracker.get_issue_comments(issue_key)
-                has_commits_comment = any(
-                    "Related Commits" in str(c.get("body", "")) for c in existing_comments
-                )
-
-                if has_commits_comment:
+                # Check if commits comment already exists (if it wasn't prefetched)
+                if issue_key not in self._comments_cache and self._has_commits_comment(
+                    self._get_issue_comments_cached(issue_key)
+                ):
                     continue
 
                 # Format commits as table
@@ -1029,17 +1358,15 @@ class SyncOrchestrator:
                     event_bus=self.event_bus,
                     dry_run=self.config.dry_run,
                 )
-                cmd_result = cmd.execute()
-
-                if cmd_result.success:
-                    result.comments_added += 1
-                elif cmd_result.error:
-                    result.add_failed_operation(
+                queued.append(
+                    _QueuedOperation(
+                        command=cmd,
                         operation="add_comment",
                         issue_key=issue_key,
-                        error=cmd_result.error,
                         story_id=story_id,
+                        label=f"{issue_key}: {len(md_story.commits)} commits",
                     )
+                )
 
             except IssueTrackerError as e:
                 result.add_failed_operation(
@@ -1058,6 +1385,24 @@ class SyncOrchestrator:
                 )
                 self.logger.exception(f"Unexpected error adding comment to {issue_key}")
 
+        for op, cmd_result in self._execute_queued(queued, SyncPhase.COMMENTS):
+            if cmd_result.success:
+                if not cmd_result.dry_run:
+                    self._comments_cache.pop(op.issue_key, None)
+                result.comments_added += 1
+            elif cmd_result.error:
+                self._record_failure(result, op, cmd_result.error)
+
+    @staticmethod
+    def _has_commits_comment(comments: list[dict]) -> bool:
+        """Check whether any comment is a "Related Commits" table."""
+        for comment in comments:
+            body = comment.get("body", "")
+            # ADF bodies are dicts; only stringify when the body isn't text already
+            if COMMITS_COMMENT_MARKER in (body if isinstance(body, str) else str(body)):
+                return True
+        return False
+
     def _sync_statuses(self, result: SyncResult, target_status: str = "Resolved") -> None:
         """
         Transition subtask statuses based on markdown story status.
@@ -1072,23 +1417,22 @@ class SyncOrchestrator:
         """
         from spectryn.core.ports.issue_tracker import IssueTrackerError
 
-        for md_story in self._md_stories:
-            story_id = str(md_story.id)
-            if story_id not in self._matches:
-                continue
-
-            # Only sync done stories
-            if not md_story.status.is_complete():
-                continue
+        queued: list[_QueuedOperation] = []
 
-            # Skip unchanged stories in incremental mode
-            if self.config.incremental and story_id not in self._changed_story_ids:
-                continue
+        pairs = [
+            (md_story, issue_key)
+            for md_story, issue_key in self._matched_pairs
+            # Only sync done stories, skipping unchanged ones in incremental mode
+            if md_story.status.is_complete()
+            and not (self.config.incremental and str(md_story.id) not in self._changed_story_ids)
+        ]
+        self._prefetch_issues([issue_key for _, issue_key in pairs])
 
-            issue_key = self._matches[story_id]
+        for md_story, issue_key in pairs:
+            story_id = str(md_story.id)
 
             try:
-                jira_issue = self.tracker.get_issue(issue_key)
+                jira_issue = self._get_issue_cached(issue_key)
             except IssueTrackerError as e:
                 result.add_failed_operation(
                     operation="fetch_issue",
@@ -1100,45 +1444,146 @@ class SyncOrchestrator:
                 continue  # Skip this story but continue with others
 
             for jira_subtask in jira_issue.subtasks:
-                if jira_subtask.status.lower() in ("resolved", "done", "closed"):
+                if jira_subtask.status.lower() in _COMPLETED_STATUSES:
                     continue
 
-                try:
-                    cmd = TransitionStatusCommand(
-                        tracker=self.tracker,
-                        issue_key=jira_subtask.key,
-                        target_status=target_status,
-                        event_bus=self.event_bus,
-                        dry_run=self.config.dry_run,
-                    )
-                    cmd_result = cmd.execute()
-
-                    if cmd_result.success:
-                        result.statuses_updated += 1
-                    elif cmd_result.error:
-                        result.add_failed_operation(
-                            operation="transition_status",
-                            issue_key=jira_subtask.key,
-                            error=cmd_result.error,
-                            story_id=story_id,
-                        )
-
-                except IssueTrackerError as e:
-                    result.add_failed_operation(
-                        operation="transition_status",
-                        issue_key=jira_subtask.key,
-                        error=str(e),
-                        story_id=story_id,
-                    )
-                    self.logger.warning(f"Failed to transition {jira_subtask.key}: {e}")
-                except Exception as e:
-                    result.add_failed_operation(
+                cmd = TransitionStatusCommand(
+                    tracker=self.tracker,
+                    issue_key=jira_subtask.key,
+                    target_status=target_status,
+                    event_bus=self.event_bus,
+                    dry_run=self.config.dry_run,
+                )
+                queued.append(
+                    _QueuedOperation(
+                        command=cmd,
                         operation="transition_status",
                         issue_key=jira_subtask.key,
-                        error=f"Unexpected error: {e}",
                         story_id=story_id,
                     )
-                    self.logger.exception(f"Unexpected error transitioning {jira_subtask.key}")
+                )
+
+        for op, cmd_result in self._execute_queued(queued, SyncPhase.STATUSES):
+            if cmd_result.success:
+                result.statuses_updated += 1
+            elif cmd_result.error:
+                self._record_failure(result, op, cmd_result.error)
+
+    def _format_text_cached(self, text: str) -> Any:
+        """Format markdown text, reusing the result for text seen earlier in the run."""
+        adf = self._adf_cache.get(text)
+        if adf is None:
+            adf = self._adf_cache[text] = self.formatter.format_text(text)
+        return adf
+
+    def _get_issue_cached(self, issue_key: str) -> IssueData:
+        """
+        Get an issue, reusing the copy already fetched during this run.
+
+        Cached issues are fetched light: the phases reading them only need the
+        subtasks and statuses, not the description.
+        """
+        issue = self._issue_cache.get(issue_key)
+        if issue is None:
+            issue = self._issue_cache[issue_key] = self.tracker.get_issue_light(issue_key)
+        return issue
+
+    def _get_issue_comments_cached(self, issue_key: str) -> list[dict]:
+        """Get an issue's comments, reusing the copy already fetched during this run."""
+        comments = self._comments_cache.get(issue_key)
+        if comments is None:
+            comments = self._comments_cache[issue_key] = self.tracker.get_issue_comments(issue_key)
+        return comments
+
+    def _prefetch_issues(self, issue_keys: list[str]) -> None:
+        """
+        Load the uncached issues a sync phase works on in a single bulk request.
+
+        If the bulk fetch fails, the cache is left as is and
+        _get_issue_cached() falls back to fetching issues one at a time.
+        """
+        from spectryn.core.ports.issue_tracker import IssueTrackerError
+
+        missing = [key for key in issue_keys if key not in self._issue_cache]
+        if not missing:
+            return
+
+        try:
+            self._issue_cache.update(self.tracker.get_issues_bulk(missing, light=True))
+        except IssueTrackerError as e:
+            self.logger.warning(f"Bulk fetch failed, fetching issues individually: {e}")
+
+    def _prefetch_comments(self, issue_keys: list[str]) -> None:
+        """Load uncached comments for a sync phase in a single bulk request."""
+        from spectryn.core.ports.issue_tracker import IssueTrackerError
+
+        missing = [key for key in issue_keys if key not in self._comments_cache]
+        if not missing:
+            return
+
+        try:
+            self._comments_cache.update(self.tracker.get_issue_comments_bulk(missing))
+        except IssueTrackerError as e:
+            self.logger.warning(f"Bulk comment fetch failed, fetching individually: {e}")
+
+    def _execute_queued(
+        self, queued: list[_QueuedOperation], phase: SyncPhase
+    ) -> Iterator[tuple[_QueuedOperation, CommandResult]]:
+        """
+        Execute queued commands concurrently and yield them with their results.
+
+        Commands run on a thread pool bounded by ``config.sync_workers``.
+        Item progress advances as each command finishes. Results are yielded in
+        queue order on the calling thread, so callers can update the SyncResult
+        without locking.
+
+        Args:
+            queued: Operations queued by a sync phase.
+            phase: The sync phase, whose item progress the results advance.
+
+        Yields:
+            Tuples of (queued operation, command result).
+        """
+
+        def report(index: int, _: CommandResult) -> None:
+            label = queued[index].label
+            if self._progress and label:
+                with self._progress_lock:
+                    self._progress.update_item(label, phase=phase)
+
+        batch = CommandBatch(commands=[op.command for op in queued], stop_on_error=False)
+        results = batch.execute_parallel(self.config.sync_workers, on_result=report)
+
+        yield from zip(queued, results, strict=True)
+
+    def _execute_creates_bulk(
+        self, creates: list[tuple[_QueuedOperation, CreateSubtaskCommand]]
+    ) -> Iterator[tuple[_QueuedOperation, CommandResult]]:
+        """
+        Create queued subtasks with one bulk tracker call and yield their results.
+
+        Args:
+            creates: Queued operations paired with their CreateSubtaskCommands.
+
+        Yields:
+            Tuples of (queued operation, command result), in queue order.
+        """
+        results = CreateSubtaskCommand.execute_bulk([cmd for _, cmd in creates])
+
+        for (op, _), cmd_result in zip(creates, results, strict=True):
+            if self._progress and op.label:
+                with self._progress_lock:
+                    self._progress.update_item(op.label, phase=SyncPhase.SUBTASKS)
+            yield op, cmd_result
+
+    def _record_failure(self, result: SyncResult, op: _QueuedOperation, error: str) -> None:
+        """Record a failed queued operation on the result."""
+        result.add_failed_operation(
+            operation=op.operation,
+            issue_key=op.issue_key,
+            error=error,
+            story_id=op.story_id,
+        )
 
     # -------------------------------------------------------------------------
     # Resumable Sync
@@ -1188,6 +1633,10 @@ class SyncOrchestrator:
 
         # Update state with results
         self._state.matched_stories = result.matched_stories
+        self._state.markdown_hash = self._markdown_hash
+        self._state.epic_updated = self._epic_updated
+        self._state.issue_count = self._jira_issue_count
+        self._state.description_hashes = self._description_hashes
         self._state.set_phase(SyncPhase.COMPLETED if result.success else SyncPhase.FAILED)
         self._save_state()
 
@@ -136,6 +136,9 @@ class ProgressReporter:
         self._legacy_callback = legacy_callback
         self._state = ProgressState(total_phases=total_phases)
 
+        # Each started phase keeps its own item counter, since phases can run concurrently
+        self._phase_states: dict[SyncPhase, ProgressState] = {}
+
     @property
     def state(self) -> ProgressState:
         """Get current progress state."""
@@ -149,42 +152,58 @@ class ProgressReporter:
             phase: The phase starting.
             total_items: Total items to process in this phase (0 if unknown).
         """
-        self._state.phase = phase
-        self._state.phase_index = self._get_phase_index(phase)
-        self._state.total_items = total_items
-        self._state.current_item = 0
-        self._state.item_name = ""
-        self._state.phase_start_time = datetime.now()
+        self._state = ProgressState(
+            phase=phase,
+            phase_index=self._get_phase_index(phase),
+            total_phases=self._state.total_phases,
+            total_items=total_items,
+            start_time=self._state.start_time,
+        )
+        self._phase_states[phase] = self._state
 
         self._report()
 
-    def update_item(self, item_name: str = "", increment: bool = True) -> None:
+    def update_item(
+        self, item_name: str = "", increment: bool = True, phase: SyncPhase | None = None
+    ) -> None:
         """
         Update progress for current item.
 
         Args:
             item_name: Name of the current item being processed.
             increment: Whether to increment the item counter.
+            phase: Started phase the item belongs to (defaults to the current phase).
         """
+        self._switch_to(phase)
         if increment:
             self._state.current_item += 1
         self._state.item_name = item_name
 
         self._report()
 
-    def set_total_items(self, total: int) -> None:
-        """Set total items for current phase."""
+    def set_total_items(self, total: int, phase: SyncPhase | None = None) -> None:
+        """Set total items for a started phase (defaults to the current phase)."""
+        self._switch_to(phase)
         self._state.total_items = total
 
     def complete(self) -> None:
         """Mark sync as complete."""
-        self._state.phase = SyncPhase.COMPLETE
-        self._state.phase_index = self._state.total_phases
-        self._state.current_item = self._state.total_items
-        self._state.item_name = ""
+        self._state = ProgressState(
+            phase=SyncPhase.COMPLETE,
+            phase_index=self._state.total_phases,
+            total_phases=self._state.total_phases,
+            current_item=self._state.total_items,
+            total_items=self._state.total_items,
+            start_time=self._state.start_time,
+        )
 
         self._report()
 
+    def _switch_to(self, phase: SyncPhase | None) -> None:
+        """Make a started phase's progress the current state."""
+        if phase is not None and phase in self._phase_states:
+            self._state = self._phase_states[phase]
+
     def _get_phase_index(self, phase: SyncPhase) -> int:
         """Get numeric index for a phase."""
         phase_order = [
@@ -121,6 +121,10 @@ class SyncState:
         created_at: When the sync started.
         updated_at: When the state was last updated.
         dry_run: Whether this is a dry-run sync.
+        markdown_hash: Content hash of the markdown file that was synced.
+        epic_updated: Tracker marker for the epic's children at sync time.
+        issue_count: Number of epic children at sync time.
+        description_hashes: Issue key to description content hash at sync time.
     """
 
     session_id: str
@@ -137,6 +141,12 @@ class SyncState:
     matched_stories: list[tuple[str, str]] = field(default_factory=list)
     unmatched_stories: list[str] = field(default_factory=list)
 
+    # Inputs the matching was computed from, for reuse by later runs
+    markdown_hash: str = ""
+    epic_updated: str = ""
+    issue_count: int = 0
+    description_hashes: dict[str, str] = field(default_factory=dict)
+
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp."""
         self.updated_at = datetime.now().isoformat()
@@ -246,6 +256,10 @@ class SyncState:
             "dry_run": self.dry_run,
             "matched_stories": self.matched_stories,
             "unmatched_stories": self.unmatched_stories,
+            "markdown_hash": self.markdown_hash,
+            "epic_updated": self.epic_updated,
+            "issue_count": self.issue_count,
+            "description_hashes": self.description_hashes,
         }
 
     @classmethod
@@ -262,6 +276,10 @@ class SyncState:
             dry_run=data.get("dry_run", True),
             matched_stories=data.get("matched_stories", []),
             unmatched_stories=data.get("unmatched_stories", []),
+            markdown_hash=data.get("markdown_hash", ""),
+            epic_updated=data.get("epic_updated", ""),
+            issue_count=data.get("issue_count", 0),
+            description_hashes=data.get("description_hashes", {}),
         )
         state.operations = [OperationRecord.from_dict(op) for op in data.get("operations", [])]
         return state
@@ -455,6 +473,35 @@ class StateStore:
         # Load the most recent
         return self.load(resumable[0]["session_id"])
 
+    def find_latest_completed(
+        self,
+        markdown_path: str,
+        epic_key: str,
+    ) -> SyncState | None:
+        """
+        Find the most recent completed session for a given markdown/epic.
+
+        Args:
+            markdown_path: Path to the markdown file.
+            epic_key: Jira epic key.
+
+        Returns:
+            The most recent completed SyncState, or None.
+        """
+        completed = [
+            s
+            for s in self.list_sessions()
+            if s.get("phase") == SyncPhase.COMPLETED.value
+            and s.get("markdown_path") == markdown_path
+            and s.get("epic_key") == epic_key
+        ]
+
+        if not completed:
+            return None
+
+        completed.sort(key=lambda s: s.get("updated_at", ""), reverse=True)
+        return self.load(completed[0]["session_id"])
+
     def cleanup_old_sessions(self, max_age_days: int = 7) -> int:
         """
         Clean up old completed/failed sessions.
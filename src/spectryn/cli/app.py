@@ -197,8 +197,8 @@ def run_sync(
     if args.execute and config.sync.backup_enabled:
         console.info("Backup: Enabled")
 
-    # Initialize components
-    event_bus = EventBus()
+    # Initialize components (the sync only reacts to events, it never reads the history)
+    event_bus = EventBus(history_limit=0)
     formatter = ADFFormatter()
     parser = MarkdownParser()
 
@@ -185,7 +185,7 @@ class InteractiveSession:
 
             # Show results
             self.console.success(f"Found {len(self.orchestrator._md_stories)} stories in markdown")
-            self.console.success(f"Found {len(self.orchestrator._jira_issues)} issues in Jira")
+            self.console.success(f"Found {self.orchestrator._jira_issue_count} issues in Jira")
             self.console.success(f"Matched {result.stories_matched} stories")
 
             if result.unmatched_stories:
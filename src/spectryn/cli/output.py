@@ -4,7 +4,11 @@ Output - Rich console output formatting.
 Provides pretty-printed output with colors and formatting.
 """
 
+import contextlib
+import functools
+import io
 import sys
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -236,50 +240,45 @@ def list_themes() -> list[tuple[str, str]]:
     return [(t.name, t.description) for t in THEMES.values()]
 
 
+@functools.lru_cache(maxsize=16)
+def _theme_color_map(theme: ColorTheme) -> dict[str, str]:
+    """Map Colors attribute names to the codes of a theme, built once per theme."""
+    return {
+        # Text colors -> semantic mapping
+        "RED": theme.error,
+        "GREEN": theme.success,
+        "YELLOW": theme.warning,
+        "BLUE": theme.accent,
+        "MAGENTA": theme.highlight,
+        "CYAN": theme.info,
+        "WHITE": theme.text,
+        "GRAY": theme.muted,
+        "GREY": theme.muted,
+        # Background colors
+        "BG_RED": theme.bg_error,
+        "BG_GREEN": theme.bg_success,
+        "BG_YELLOW": theme.bg_warning,
+        "BG_BLUE": theme.bg_info,
+        # Semantic names (preferred)
+        "SUCCESS": theme.success,
+        "ERROR": theme.error,
+        "WARNING": theme.warning,
+        "INFO": theme.info,
+        "ACCENT": theme.accent,
+        "MUTED": theme.muted,
+        "HIGHLIGHT": theme.highlight,
+        "TEXT": theme.text,
+    }
+
+
 class _ColorsMeta(type):
     """Metaclass for dynamic color access based on current theme."""
 
     def __getattr__(cls, name: str) -> str:
-        # Static values (not theme-dependent)
-        static = {
-            "RESET": "\033[0m",
-            "BOLD": "\033[1m",
-            "DIM": "\033[2m",
-            "UNDERLINE": "\033[4m",
-        }
-        if name in static:
-            return static[name]
-
-        # Map old color names to semantic theme colors
-        theme = get_theme()
-        color_map = {
-            # Text colors -> semantic mapping
-            "RED": theme.error,
-            "GREEN": theme.success,
-            "YELLOW": theme.warning,
-            "BLUE": theme.accent,
-            "MAGENTA": theme.highlight,
-            "CYAN": theme.info,
-            "WHITE": theme.text,
-            "GRAY": theme.muted,
-            "GREY": theme.muted,
-            # Background colors
-            "BG_RED": theme.bg_error,
-            "BG_GREEN": theme.bg_success,
-            "BG_YELLOW": theme.bg_warning,
-            "BG_BLUE": theme.bg_info,
-            # Semantic names (preferred)
-            "SUCCESS": theme.success,
-            "ERROR": theme.error,
-            "WARNING": theme.warning,
-            "INFO": theme.info,
-            "ACCENT": theme.accent,
-            "MUTED": theme.muted,
-            "HIGHLIGHT": theme.highlight,
-            "TEXT": theme.text,
-        }
-        if name in color_map:
-            return color_map[name]
+        # Static values (RESET, BOLD, ...) are plain class attributes and never get here
+        color = _theme_color_map(get_theme()).get(name)
+        if color is not None:
+            return color
 
         raise AttributeError(f"'{cls.__name__}' has no attribute '{name}'")
 
@@ -310,11 +309,13 @@ class Colors(metaclass=_ColorsMeta):
         BG_RED, BG_GREEN, BG_YELLOW, BG_BLUE: Background colors.
     """
 
+    # Static styles (not theme-dependent), looked up without the metaclass
+    RESET: str = "\033[0m"
+    BOLD: str = "\033[1m"
+    DIM: str = "\033[2m"
+    UNDERLINE: str = "\033[4m"
+
     # Type hints for IDE support (actual values from metaclass)
-    RESET: str
-    BOLD: str
-    DIM: str
-    UNDERLINE: str
 
     # Traditional color names (mapped to semantic colors via theme)
     RED: str
@@ -856,18 +857,7 @@ class _SymbolsMeta(type):
     """Metaclass to enable dynamic class attribute access for Symbols."""
 
     def __getattr__(cls, name: str) -> str:
-        # Handle box drawing characters (not affected by emoji toggle)
-        if name.startswith("BOX_"):
-            box_chars = {
-                "BOX_TL": "╭",
-                "BOX_TR": "╮",
-                "BOX_BL": "╰",
-                "BOX_BR": "╯",
-                "BOX_H": "─",
-                "BOX_V": "│",
-            }
-            if name in box_chars:
-                return box_chars[name]
+        # Box drawing characters are plain class attributes and never get here
         # Handle symbol lookup with emoji toggle
         if name in _EMOJI_SYMBOLS:
             return get_symbol(name)
@@ -932,12 +922,12 @@ class Symbols(metaclass=_SymbolsMeta):
     DIFF: str
 
     # Box drawing (static, not affected by emoji toggle)
-    BOX_TL: str
-    BOX_TR: str
-    BOX_BL: str
-    BOX_BR: str
-    BOX_H: str
-    BOX_V: str
+    BOX_TL: str = "╭"
+    BOX_TR: str = "╮"
+    BOX_BL: str = "╰"
+    BOX_BR: str = "╯"
+    BOX_H: str = "─"
+    BOX_V: str = "│"
 
     @staticmethod
     def set_emoji_mode(use_emoji: bool) -> None:
@@ -950,6 +940,32 @@ class Symbols(metaclass=_SymbolsMeta):
         return get_emoji_mode()
 
 
+# Characters of output after which Console drops its buffer instead of reusing it
+_MAX_RETAINED_BUFFER = 64 * 1024
+
+# Progress bars indexed by filled cells, for progress() and progress_detailed()
+_PROGRESS_WIDTH = 30
+_PROGRESS_BARS = tuple(
+    "█" * filled + "░" * (_PROGRESS_WIDTH - filled) for filled in range(_PROGRESS_WIDTH + 1)
+)
+_DETAILED_PROGRESS_WIDTH = 25
+_DETAILED_PROGRESS_BARS = tuple(
+    "█" * filled + "░" * (_DETAILED_PROGRESS_WIDTH - filled)
+    for filled in range(_DETAILED_PROGRESS_WIDTH + 1)
+)
+
+# item() statuses shown with a fixed colorized tag
+_ITEM_STATUS_TAGS = frozenset({"ok", "skip", "fail"})
+
+
+@functools.lru_cache(maxsize=16)
+def _header_border(width: int, color: str) -> str:
+    """Build a header border line, drawn in the given color code ("" for plain text)."""
+    if not color:
+        return "-" * width
+    return color + Symbols.BOX_H * width + Colors.RESET
+
+
 class Console:
     """
     Console output helper with colors and formatting.
@@ -1001,10 +1017,21 @@ class Console:
         self._json_errors: list[str] = []
 
         # Progress tracking state
+        self._last_progress_line: str = ""
         self._last_progress_message: str = ""
         self._last_progress_phase: str = ""
         self._last_had_item: bool = False
 
+        # Lines printed while a multi-line method runs, written out in one go
+        # (reused across calls; replaced when a large write leaves it oversized)
+        self._buffer = io.StringIO()
+        self._buffering = False
+
+        # Colorized fixed fragments, built for one theme, emoji mode and color setting
+        self._fragment_cache: dict[str, str] = {}
+        self._fragment_theme: ColorTheme | None = None
+        self._fragment_flags: tuple[bool, bool] | None = None
+
         # Quiet mode overrides verbose
         if self.quiet:
             self.verbose = False
@@ -1024,6 +1051,47 @@ class Console:
             return text
         return "".join(codes) + text + Colors.RESET
 
+    def _fragments(self) -> dict[str, str]:
+        """
+        Colorized fixed fragments of the message helpers.
+
+        Colors and Symbols resolve the theme and emoji mode on every access,
+        so the fragments are built once and only rebuilt when either of them,
+        or the console's color setting, changes.
+        Message prefixes leave the color open; "reset" closes it.
+        """
+        theme = get_theme()
+        flags = (get_emoji_mode(), self.color)
+        if theme is not self._fragment_theme or flags != self._fragment_flags:
+
+            def opening(*codes: str) -> str:
+                return "".join(codes) if self.color else ""
+
+            self._fragment_cache = {
+                "success": opening(Colors.GREEN) + f"  {Symbols.CHECK} ",
+                "error": opening(Colors.RED) + f"  {Symbols.CROSS} ",
+                "warning": opening(Colors.YELLOW) + f"  {Symbols.WARN} ",
+                "info": opening(Colors.CYAN) + f"  {Symbols.INFO} ",
+                "detail": opening(Colors.DIM) + "    ",
+                "debug": opening(Colors.DIM) + "  [DEBUG] ",
+                "reset": Colors.RESET if self.color else "",
+                "dot": f"    {Symbols.DOT} ",
+                "border": opening(Colors.CYAN),
+                # Status tags of item()
+                "ok": self._c(f" [{Symbols.CHECK}]", Colors.GREEN),
+                "skip": self._c(" [SKIP]", Colors.YELLOW),
+                "fail": self._c(f" [{Symbols.CROSS}]", Colors.RED),
+            }
+            self._fragment_theme = theme
+            self._fragment_flags = flags
+        return self._fragment_cache
+
+    def _message(self, kind: str, text: str) -> str:
+        """Format text with the colorized prefix of a message kind."""
+        fragments = self._fragments()
+        # One f-string builds the line in a single allocation
+        return f"{fragments[kind]}{text}{fragments['reset']}"
+
     def print(self, text: str = "", force: bool = False) -> None:
         """
         Print text to stdout.
@@ -1034,7 +1102,42 @@ class Console:
         """
         if self.quiet and not force:
             return
-        print(text)
+        self._write_line(text)
+
+    def _write_line(self, text: str) -> None:
+        """Write a line to stdout, or to the buffer while one is open."""
+        if self._buffering:
+            self._buffer.write(text)
+            self._buffer.write("\n")
+        else:
+            sys.stdout.write(f"{text}\n")
+
+    @contextlib.contextmanager
+    def _buffered(self) -> Iterator[None]:
+        """
+        Collect the lines printed inside the block and write them at once.
+
+        Nested blocks join the outermost one, so a composite method such as
+        sync_result() reaches the terminal in a single write.
+        """
+        if self._buffering:
+            yield
+            return
+
+        self._buffering = True
+        try:
+            yield
+        finally:
+            self._buffering = False
+            text = self._buffer.getvalue()
+            if len(text) > _MAX_RETAINED_BUFFER:
+                self._buffer = io.StringIO()
+            else:
+                self._buffer.seek(0)
+                self._buffer.truncate()
+            if text:
+                sys.stdout.write(text)
+                sys.stdout.flush()
 
     def header(self, text: str) -> None:
         """
@@ -1046,13 +1149,14 @@ class Console:
         if self.quiet:
             return
         width = max(len(text) + 4, 50)
-        border = Colors.CYAN + Symbols.BOX_H * width + Colors.RESET if self.color else "-" * width
+        border = _header_border(width, self._fragments()["border"])
 
-        self.print()
-        self.print(border)
-        self.print(self._c(f"  {text}", Colors.BOLD, Colors.CYAN))
-        self.print(border)
-        self.print()
+        with self._buffered():
+            self.print()
+            self.print(border)
+            self.print(self._c(f"  {text}", Colors.BOLD, Colors.CYAN))
+            self.print(border)
+            self.print()
 
     def section(self, text: str) -> None:
         """
@@ -1063,8 +1167,9 @@ class Console:
         """
         if self.quiet:
             return
-        self.print()
-        self.print(self._c(f"{Symbols.ARROW} {text}", Colors.BOLD, Colors.BLUE))
+        with self._buffered():
+            self.print()
+            self.print(self._c(f"{Symbols.ARROW} {text}", Colors.BOLD, Colors.BLUE))
 
     def success(self, text: str) -> None:
         """
@@ -1081,7 +1186,7 @@ class Console:
             indicator = get_status_indicator("success", include_label=True, use_color=self.color)
             self.print(f"  {indicator} {text}")
         else:
-            self.print(self._c(f"  {Symbols.CHECK} {text}", Colors.GREEN))
+            self.print(self._message("success", text))
 
     def error(self, text: str) -> None:
         """
@@ -1099,9 +1204,9 @@ class Console:
         # Errors always print, even in quiet mode
         if self.accessible:
             indicator = get_status_indicator("error", include_label=True, use_color=self.color)
-            print(f"  {indicator} {text}")
+            self._write_line(f"  {indicator} {text}")
         else:
-            print(self._c(f"  {Symbols.CROSS} {text}", Colors.RED))
+            self._write_line(self._message("error", text))
 
     def error_rich(self, exc: Exception) -> None:
         """
@@ -1120,7 +1225,7 @@ class Console:
             return
 
         formatted = format_error(exc, color=self.color, verbose=self.verbose)
-        print(formatted)
+        self._write_line(formatted)
 
     def config_errors(self, errors: list[str]) -> None:
         """
@@ -1139,7 +1244,7 @@ class Console:
             return
 
         formatted = format_config_errors(errors, color=self.color)
-        print(formatted)
+        self._write_line(formatted)
 
     def connection_error(self, url: str = "") -> None:
         """
@@ -1158,7 +1263,7 @@ class Console:
             return
 
         formatted = format_connection_error(url, color=self.color)
-        print(formatted)
+        self._write_line(formatted)
 
     def warning(self, text: str) -> None:
         """
@@ -1175,7 +1280,7 @@ class Console:
             indicator = get_status_indicator("warning", include_label=True, use_color=self.color)
             self.print(f"  {indicator} {text}")
         else:
-            self.print(self._c(f"  {Symbols.WARN} {text}", Colors.YELLOW))
+            self.print(self._message("warning", text))
 
     def info(self, text: str) -> None:
         """
@@ -1192,7 +1297,7 @@ class Console:
             indicator = get_status_indicator("info", include_label=True, use_color=self.color)
             self.print(f"  {indicator} {text}")
         else:
-            self.print(self._c(f"  {Symbols.INFO} {text}", Colors.CYAN))
+            self.print(self._message("info", text))
 
     def detail(self, text: str) -> None:
         """
@@ -1203,7 +1308,7 @@ class Console:
         """
         if self.quiet:
             return
-        self.print(self._c(f"    {text}", Colors.DIM))
+        self.print(self._message("detail", text))
 
     def debug(self, text: str) -> None:
         """
@@ -1213,7 +1318,7 @@ class Console:
             text: Debug message to display.
         """
         if self.verbose:
-            self.print(self._c(f"  [DEBUG] {text}", Colors.DIM))
+            self.print(self._message("debug", text))
 
     def item(self, text: str, status: str | None = None) -> None:
         """
@@ -1229,17 +1334,14 @@ class Console:
         """
         if self.quiet:
             return
+        fragments = self._fragments()
         status_str = ""
-        if status == "ok":
-            status_str = self._c(f" [{Symbols.CHECK}]", Colors.GREEN)
-        elif status == "skip":
-            status_str = self._c(" [SKIP]", Colors.YELLOW)
-        elif status == "fail":
-            status_str = self._c(f" [{Symbols.CROSS}]", Colors.RED)
+        if status in _ITEM_STATUS_TAGS:
+            status_str = fragments[status]
         elif status:
             status_str = self._c(f" [{status}]", Colors.DIM)
 
-        self.print(f"    {Symbols.DOT} {text}{status_str}")
+        self.print(f"{fragments['dot']}{text}{status_str}")
 
     def table(self, headers: list[str], rows: list[list[str]]) -> None:
         """
@@ -1253,27 +1355,42 @@ class Console:
         """
         if self.quiet:
             return
-        # Calculate column widths
+        # Calculate column widths, converting each non-string cell to text once
+        cells = [[c if type(c) is str else str(c) for c in row] for row in rows]
+        columns = len(headers)
         widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                if i < len(widths):
-                    widths[i] = max(widths[i], len(str(cell)))
-
-        # Print header
-        header_line = "  " + "  ".join(
-            self._c(h.ljust(widths[i]), Colors.BOLD) for i, h in enumerate(headers)
-        )
-        self.print(header_line)
-        self.print("  " + "  ".join("-" * w for w in widths))
-
-        # Print rows
-        for row in rows:
-            row_line = "  " + "  ".join(
-                str(cell).ljust(widths[i]) if i < len(widths) else str(cell)
-                for i, cell in enumerate(row)
-            )
-            self.print(row_line)
+        for row in cells:
+            for i, length in enumerate(map(len, row[:columns])):
+                widths[i] = max(widths[i], length)
+
+        with self._buffered():
+            self._write_table(headers, cells, widths)
+
+    def _write_table(self, headers: list[str], cells: list[list[str]], widths: list[int]) -> None:
+        """Write table lines straight into the open output buffer."""
+        buf = self._buffer
+        columns = len(headers)
+
+        # Header
+        for i, h in enumerate(headers):
+            buf.write("  ")
+            buf.write(self._c(h.ljust(widths[i]), Colors.BOLD))
+        buf.write("\n")
+        for w in widths:
+            buf.write("  ")
+            buf.write("-" * w)
+
+        # Rows
+        for row in cells:
+            buf.write("\n")
+            for text, width in zip(row, widths, strict=False):
+                buf.write("  ")
+                buf.write(text.ljust(width))
+            # Cells beyond the headers are written unpadded
+            for text in row[columns:]:
+                buf.write("  ")
+                buf.write(text)
+        buf.write("\n")
 
     def progress(self, current: int, total: int, message: str = "") -> None:
         """
@@ -1290,19 +1407,22 @@ class Console:
         if self.quiet:
             return
 
-        width = 30
-        filled = int(width * current / total) if total > 0 else 0
-        bar = "█" * filled + "░" * (width - filled)
+        filled = int(_PROGRESS_WIDTH * current / total) if total > 0 else 0
+        bar = _PROGRESS_BARS[min(max(filled, 0), _PROGRESS_WIDTH)]
         pct = int(100 * current / total) if total > 0 else 0
 
         # Check if running in interactive terminal
         if sys.stdout.isatty():
             # Interactive: update in place with carriage return
-            padded_message = f"{message:<25}"
-            line = f"\r  [{bar}] {pct:>3}% {padded_message}"
-            sys.stdout.write(line)
-            sys.stdout.flush()
-            if current >= total > 0:
+            line = f"\r  [{bar}] {pct:>3}% {message:<25}"
+            done = current >= total > 0
+            # Most updates of a large total don't change the visible line
+            if line != self._last_progress_line or done:
+                self._last_progress_line = line
+                sys.stdout.write(line)
+                sys.stdout.flush()
+            if done:
+                self._last_progress_line = ""
                 self.print()
         else:
             # Non-interactive: print each phase once (track with instance variable)
@@ -1335,9 +1455,8 @@ class Console:
         if self.quiet:
             return
 
-        width = 25
-        filled = int(width * overall_progress / 100)
-        bar = "█" * filled + "░" * (width - filled)
+        filled = int(_DETAILED_PROGRESS_WIDTH * overall_progress / 100)
+        bar = _DETAILED_PROGRESS_BARS[min(max(filled, 0), _DETAILED_PROGRESS_WIDTH)]
         pct = int(overall_progress)
 
         # Build message with phase and item info
@@ -1387,13 +1506,14 @@ class Console:
         """
         if self.quiet:
             return
-        self.print()
         banner = f"  {Symbols.GEAR} DRY-RUN MODE - No changes will be made"
-        if self.color:
-            self.print(f"{Colors.BG_YELLOW}{Colors.BOLD}{banner}{Colors.RESET}")
-        else:
-            self.print(f"*** {banner} ***")
-        self.print()
+        with self._buffered():
+            self.print()
+            if self.color:
+                self.print(f"{Colors.BG_YELLOW}{Colors.BOLD}{banner}{Colors.RESET}")
+            else:
+                self.print(f"*** {banner} ***")
+            self.print()
 
     def sync_result(self, result: SyncResult) -> None:
         """
@@ -1441,7 +1561,7 @@ class Console:
                     for op in result.failed_operations
                 ]
 
-            print(json.dumps(output, indent=2))
+            self._write_line(json.dumps(output, indent=2))
             return
 
         # Quiet mode: compact one-line output for CI/scripting
@@ -1458,13 +1578,20 @@ class Console:
             ]
             if result.errors:
                 parts.append(f"errors={len(result.errors)}")
-            print(" ".join(parts))
 
-            # Still print errors even in quiet mode
-            for e in result.errors:
-                print(f"ERROR: {e}")
+            with self._buffered():
+                self._write_line(" ".join(parts))
+
+                # Still print errors even in quiet mode
+                for e in result.errors:
+                    self._write_line(f"ERROR: {e}")
             return
 
+        with self._buffered():
+            self._sync_result_text(result)
+
+    def _sync_result_text(self, result: SyncResult) -> None:
+        """Print the human-readable sync result summary."""
         # Clear the progress line with a newline
         self.print()
         self.section("Sync Complete")
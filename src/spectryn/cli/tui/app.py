@@ -330,6 +330,11 @@ class DashboardScreen(Screen):
     def __init__(self, state: TUIState, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.state = state
+        # Widgets kept from compose() so handlers don't query the DOM for them
+        self._stats_panel: StatsPanel | None = None
+        self._browser: StoryBrowser | None = None
+        self._progress_panel: SyncProgressPanel | None = None
+        self._detail: StoryDetail | None = None
         self._log_panel: LogPanel | None = None
 
     def compose(self) -> ComposeResult:
@@ -339,16 +344,20 @@ class DashboardScreen(Screen):
         with Horizontal(id="main-layout"):
             # Left sidebar - Story browser
             with Vertical(id="sidebar"):
-                yield StatsPanel(self.state.stories, id="stats-panel")
-                yield StoryBrowser(self.state.stories, id="story-browser")
+                self._stats_panel = StatsPanel(self.state.stories, id="stats-panel")
+                yield self._stats_panel
+                self._browser = StoryBrowser(self.state.stories, id="story-browser")
+                yield self._browser
 
             # Main content area
             with Vertical(id="main-content"):
-                yield SyncProgressPanel(id="sync-progress-panel")
+                self._progress_panel = SyncProgressPanel(id="sync-progress-panel")
+                yield self._progress_panel
 
                 with TabbedContent(id="content-tabs"):
                     with TabPane("📝 Details", id="tab-details"):
-                        yield StoryDetail(id="story-detail")
+                        self._detail = StoryDetail(id="story-detail")
+                        yield self._detail
 
                     with TabPane("⚠️ Conflicts", id="tab-conflicts"):
                         yield ConflictPanel(self.state.conflicts, id="conflict-panel")
@@ -386,8 +395,8 @@ class DashboardScreen(Screen):
         """Handle story selection."""
         self.state.selected_story_id = event.story_id
         story = self.state.get_selected_story()
-        detail = self.query_one("#story-detail", StoryDetail)
-        detail.update_story(story)
+        if self._detail:
+            self._detail.update_story(story)
         self._log(f"Selected: {event.story_id}", "info")
 
     @on(ConflictPanel.ConflictResolved)
@@ -404,11 +413,10 @@ class DashboardScreen(Screen):
             self.state.epic = epic
 
             # Update widgets
-            browser = self.query_one("#story-browser", StoryBrowser)
-            browser.update_stories(stories)
-
-            stats = self.query_one("#stats-panel", StatsPanel)
-            stats.update_stories(stories)
+            if self._browser:
+                self._browser.update_stories(stories)
+            if self._stats_panel:
+                self._stats_panel.update_stories(stories)
 
             self._log(f"Loaded {len(stories)} stories", "success")
         else:
@@ -562,7 +570,9 @@ class DashboardScreen(Screen):
         """Apply current filter to story browser."""
         from spectryn.core.domain.enums import Status
 
-        browser = self.query_one("#story-browser", StoryBrowser)
+        browser = self._browser
+        if browser is None:
+            return
 
         if self.state.status_filter is None:
             browser.update_stories(self.state.stories)
@@ -695,7 +705,9 @@ class DashboardScreen(Screen):
 
     async def _simulate_sync(self) -> None:
         """Simulate a sync operation with progress updates."""
-        progress_panel = self.query_one("#sync-progress-panel", SyncProgressPanel)
+        progress_panel = self._progress_panel
+        if progress_panel is None:
+            return
 
         progress = SyncProgress(
             total_operations=len(self.state.stories) * 3,
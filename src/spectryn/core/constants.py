@@ -156,6 +156,8 @@ class JiraField:
 
     # Standard field sets for API calls
     BASIC_FIELDS: Final[tuple[str, ...]] = ("summary", "description", "status", "issuetype")
+    # Lightweight projection for read paths that don't need the (often large) ADF description
+    LIGHT_FIELDS: Final[tuple[str, ...]] = ("summary", "status", "issuetype", "subtasks")
     ISSUE_WITH_SUBTASKS: Final[tuple[str, ...]] = (
         "summary",
         "description",
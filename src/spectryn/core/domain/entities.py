@@ -183,6 +183,19 @@ class UserStory:
         title = re.sub(r"[^\w\s]", " ", title)
         return " ".join(title.split())
 
+    @staticmethod
+    def normalize_external_title(title: str) -> str:
+        """Normalize an external issue title the way matches_title() compares it.
+
+        Args:
+            title: The external issue title.
+
+        Returns:
+            Lowercased title with punctuation replaced and whitespace collapsed.
+        """
+        title = re.sub(r"[^\w\s]", " ", title.lower())
+        return " ".join(title.split())
+
     def matches_title(self, other_title: str) -> bool:
         """Check if this story matches an external title using fuzzy matching.
 
@@ -195,16 +208,25 @@ class UserStory:
         Returns:
             True if titles are considered a match.
         """
-        self_normalized = self.normalize_title()
-        other_normalized = re.sub(r"[^\w\s]", " ", other_title.lower())
-        other_normalized = " ".join(other_normalized.split())
-
-        return (
-            self_normalized == other_normalized
-            or self_normalized in other_normalized
-            or other_normalized in self_normalized
+        return self.normalized_titles_match(
+            self.normalize_title(), self.normalize_external_title(other_title)
         )
 
+    @staticmethod
+    def normalized_titles_match(title: str, other_title: str) -> bool:
+        """Compare two already-normalized titles the way matches_title() does.
+
+        Lets callers matching many titles normalize each one only once.
+
+        Args:
+            title: A title from normalize_title().
+            other_title: A title from normalize_external_title().
+
+        Returns:
+            True if the titles are equal or one contains the other.
+        """
+        return title == other_title or title in other_title or other_title in title
+
     def get_full_description(self) -> str:
         """Get the complete description including acceptance criteria and notes.
 
@@ -5,7 +5,10 @@ Events are immutable records of something that occurred.
 They enable loose coupling and audit trails.
 """
 
-from collections.abc import Callable
+import itertools
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -14,11 +17,33 @@ from uuid import uuid4
 from .value_objects import IssueKey, StoryId
 
 
-@dataclass(frozen=True)
+# Event ids are a per-process random prefix plus a counter, so only one uuid4()
+# is drawn per process rather than one per event
+_event_id_prefix = uuid4().hex[:12]
+_event_counter = itertools.count(1)
+
+
+def _reset_event_ids() -> None:
+    """Start a fresh id sequence, so forked processes don't reuse the parent's ids."""
+    global _event_id_prefix, _event_counter
+    _event_id_prefix = uuid4().hex[:12]
+    _event_counter = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_event_ids)
+
+
+def _new_event_id() -> str:
+    """Generate an id unique across processes and runs."""
+    return f"{_event_id_prefix}-{next(_event_counter):x}"
+
+
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
     """Base class for all domain events."""
 
-    event_id: str = field(default_factory=lambda: str(uuid4()))
+    event_id: str = field(default_factory=_new_event_id)
     timestamp: datetime = field(default_factory=datetime.now)
 
     @property
@@ -27,7 +52,7 @@ class DomainEvent:
         return self.__class__.__name__
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoryMatched(DomainEvent):
     """Event: A markdown story was matched to a Jira issue."""
 
@@ -37,7 +62,7 @@ class StoryMatched(DomainEvent):
     match_method: str = "title"  # title, id, manual
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoryUpdated(DomainEvent):
     """Event: A story's description was updated."""
 
@@ -47,7 +72,7 @@ class StoryUpdated(DomainEvent):
     new_value: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubtaskCreated(DomainEvent):
     """Event: A new subtask was created."""
 
@@ -57,7 +82,7 @@ class SubtaskCreated(DomainEvent):
     story_points: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubtaskUpdated(DomainEvent):
     """Event: A subtask was updated."""
 
@@ -65,7 +90,7 @@ class SubtaskUpdated(DomainEvent):
     changes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusTransitioned(DomainEvent):
     """Event: An issue's status changed."""
 
@@ -75,7 +100,7 @@ class StatusTransitioned(DomainEvent):
     transition_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommentAdded(DomainEvent):
     """Event: A comment was added to an issue."""
 
@@ -84,7 +109,7 @@ class CommentAdded(DomainEvent):
     commit_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyncStarted(DomainEvent):
     """Event: A sync operation started."""
 
@@ -93,7 +118,7 @@ class SyncStarted(DomainEvent):
     dry_run: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyncCompleted(DomainEvent):
     """Event: A sync operation completed."""
 
@@ -110,7 +135,7 @@ class SyncCompleted(DomainEvent):
 # -------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PullStarted(DomainEvent):
     """Event: A pull (reverse sync) operation started."""
 
@@ -119,7 +144,7 @@ class PullStarted(DomainEvent):
     dry_run: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PullCompleted(DomainEvent):
     """Event: A pull (reverse sync) operation completed."""
 
@@ -131,7 +156,7 @@ class PullCompleted(DomainEvent):
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoryPulled(DomainEvent):
     """Event: A story was pulled from Jira."""
 
@@ -141,7 +166,7 @@ class StoryPulled(DomainEvent):
     changes: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarkdownUpdated(DomainEvent):
     """Event: Markdown file was updated from Jira."""
 
@@ -155,7 +180,7 @@ class MarkdownUpdated(DomainEvent):
 # -------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConflictDetected(DomainEvent):
     """Event: A sync conflict was detected."""
 
@@ -165,7 +190,7 @@ class ConflictDetected(DomainEvent):
     conflict_type: str = ""  # both_modified, local_deleted, etc.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConflictResolved(DomainEvent):
     """Event: A conflict was resolved."""
 
@@ -175,7 +200,7 @@ class ConflictResolved(DomainEvent):
     resolution: str = ""  # local, remote, skip, merge
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConflictCheckCompleted(DomainEvent):
     """Event: Conflict check completed for sync operation."""
 
@@ -189,12 +214,18 @@ class EventBus:
     """
     Simple event bus for publishing and subscribing to domain events.
 
-    This enables loose coupling between components.
+    This enables loose coupling between components. The history keeps every
+    event by default; ``history_limit`` keeps only the most recent events
+    (0 turns history recording off for runs that never read it).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, history_limit: int | None = None) -> None:
         self._handlers: dict[type[DomainEvent], list[Callable[[DomainEvent], None]]] = {}
-        self._history: list[DomainEvent] = []
+        # Specific then catch-all handlers per published event type, reset on subscribe
+        self._dispatch_cache: dict[
+            type[DomainEvent], tuple[Callable[[DomainEvent], None], ...]
+        ] = {}
+        self._history: deque[DomainEvent] = deque(maxlen=history_limit)
 
     def subscribe(
         self,
@@ -205,22 +236,29 @@ class EventBus:
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+        self._dispatch_cache.clear()
 
     def publish(self, event: DomainEvent) -> None:
         """Publish an event to all subscribers."""
         self._history.append(event)
 
-        # Call specific handlers
-        for handler in self._handlers.get(type(event), []):
-            handler(event)
+        event_type = type(event)
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            # Specific handlers first, then catch-all handlers
+            handlers = (*self._handlers.get(event_type, ()), *self._handlers.get(DomainEvent, ()))
+            self._dispatch_cache[event_type] = handlers
 
-        # Call catch-all handlers
-        for handler in self._handlers.get(DomainEvent, []):
+        for handler in handlers:
             handler(event)
 
     def get_history(self) -> list[DomainEvent]:
-        """Get all published events."""
-        return self._history.copy()
+        """Get a copy of the event history."""
+        return list(self._history)
+
+    def iter_history(self) -> Iterator[DomainEvent]:
+        """Iterate over the event history without copying it."""
+        return iter(self._history)
 
     def clear_history(self) -> None:
         """Clear event history."""
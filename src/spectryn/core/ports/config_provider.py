@@ -44,6 +44,12 @@ class TrackerConfig:
     # Jira-specific
     story_points_field: str = "customfield_10014"
 
+    # Max parallel requests for async fan-out reads
+    max_concurrent_requests: int = 10
+
+    # Directory persisting epic child descriptions across runs (None = disabled)
+    description_cache_dir: str | None = None
+
     def is_valid(self) -> bool:
         """Check if configuration is valid."""
         return bool(self.url and self.email and self.api_token)
@@ -958,6 +964,15 @@ class SyncConfig:
     sync_comments: bool = True
     sync_statuses: bool = True
 
+    # Concurrency
+    # Write commands a sync phase runs at once. Separate from
+    # TrackerConfig.max_concurrent_requests, which bounds the Jira adapter's own
+    # async read fan-out. Stays 1 unless the adapter is safe to call from threads
+    sync_workers: int = 1
+    # Run phases touching disjoint data at the same time. Off by default: the
+    # adapter and its client must be safe to call from several threads
+    concurrent_phases: bool = False
+
     # Filters
     story_filter: str | None = None
 
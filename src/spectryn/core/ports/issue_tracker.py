@@ -8,9 +8,12 @@ Implementations:
 - AzureDevOpsAdapter: Azure DevOps
 """
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 # Import exceptions from centralized module and re-export for backward compatibility
@@ -148,6 +151,18 @@ class IssueLink:
 # for backward compatibility. See core/exceptions.py for definitions.
 
 
+def content_hash(value: Any) -> str:
+    """
+    Hash rich-text content (markdown string or structured document like ADF).
+
+    Structured values are hashed in canonical (sorted-key) JSON form so equal
+    documents hash the same regardless of key order.
+    """
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
 @dataclass
 class IssueData:
     """
@@ -185,6 +200,18 @@ class IssueData:
             return self.key.split("-")[0]
         return ""
 
+    @cached_property
+    def summary_lower(self) -> str:
+        """Lowercased summary for case-insensitive matching, computed once."""
+        return self.summary.lower()
+
+    @property
+    def description_hash(self) -> str | None:
+        """Content hash of the current description, or None if it has none."""
+        if self.description is None:
+            return None
+        return content_hash(self.description)
+
 
 class IssueTrackerPort(ABC):
     """
@@ -240,6 +267,24 @@ class IssueTrackerPort(ABC):
         """
         ...
 
+    def get_issue_light(self, issue_key: str) -> IssueData:
+        """
+        Fetch an issue for callers that only read its summary, status and subtasks.
+
+        Adapters may leave the description out to keep the response small.
+        The default implementation fetches the full issue.
+
+        Args:
+            issue_key: The issue key (e.g., 'PROJ-123')
+
+        Returns:
+            IssueData, possibly without a description
+
+        Raises:
+            NotFoundError: If issue doesn't exist
+        """
+        return self.get_issue(issue_key)
+
     @abstractmethod
     def get_epic_children(self, epic_key: str) -> list[IssueData]:
         """
@@ -285,6 +330,68 @@ class IssueTrackerPort(ABC):
         """
         ...
 
+    def get_issues_bulk(
+        self, issue_keys: list[str], *, light: bool = False
+    ) -> dict[str, IssueData]:
+        """
+        Fetch several issues at once.
+
+        The default implementation fetches issues one at a time. Adapters
+        whose API can return many issues per request should override it.
+
+        Args:
+            issue_keys: Keys of the issues to fetch
+            light: Fetch the issues as get_issue_light() would
+
+        Returns:
+            Mapping of issue key to IssueData. Issues that could not be
+            fetched are omitted.
+        """
+        fetch = self.get_issue_light if light else self.get_issue
+        issues: dict[str, IssueData] = {}
+        for issue_key in issue_keys:
+            try:
+                issues[issue_key] = fetch(issue_key)
+            except IssueTrackerError:
+                continue
+        return issues
+
+    def get_epic_updated(self, epic_key: str) -> str | None:
+        """
+        Get a marker that changes whenever the epic's children change.
+
+        Used to tell whether a previous run's story matching is still valid.
+        The default implementation returns None, which disables that reuse.
+
+        Args:
+            epic_key: The epic's key
+
+        Returns:
+            Opaque marker string, or None if not supported
+        """
+        return None
+
+    def get_issue_comments_bulk(self, issue_keys: list[str]) -> dict[str, list[dict]]:
+        """
+        Fetch the comments of several issues at once.
+
+        The default implementation fetches comments one issue at a time.
+
+        Args:
+            issue_keys: Keys of the issues whose comments to fetch
+
+        Returns:
+            Mapping of issue key to comment dictionaries. Issues whose
+            comments could not be fetched are omitted.
+        """
+        comments: dict[str, list[dict]] = {}
+        for issue_key in issue_keys:
+            try:
+                comments[issue_key] = self.get_issue_comments(issue_key)
+            except IssueTrackerError:
+                continue
+        return comments
+
     # -------------------------------------------------------------------------
     # Write Operations
     # -------------------------------------------------------------------------
@@ -346,6 +453,30 @@ class IssueTrackerPort(ABC):
         """
         ...
 
+    def create_subtasks_bulk(
+        self, subtasks: list[dict[str, Any]]
+    ) -> list[str | IssueTrackerError | None]:
+        """
+        Create several subtasks at once.
+
+        The default implementation creates subtasks one at a time.
+
+        Args:
+            subtasks: Keyword arguments for create_subtask, one dict per subtask
+
+        Returns:
+            New subtask keys in input order. A subtask that could not be
+            created gets the error explaining why, or None if the tracker
+            gave no reason (as create_subtask does)
+        """
+        keys: list[str | IssueTrackerError | None] = []
+        for subtask in subtasks:
+            try:
+                keys.append(self.create_subtask(**subtask))
+            except IssueTrackerError as e:
+                keys.append(e)
+        return keys
+
     @abstractmethod
     def update_subtask(
         self,
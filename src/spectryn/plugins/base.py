@@ -5,7 +5,7 @@ Plugin Base Classes - Abstract base for all plugins.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any
+from typing import Any, ClassVar
 
 
 class PluginType(Enum):
@@ -57,6 +57,15 @@ class PluginMetadata:
     config_schema: dict[str, Any] | None = None
 
 
+def _required_config_fields(schema: dict[str, Any]) -> tuple[str, ...]:
+    """Names of the properties a config schema marks as required."""
+    return tuple(
+        name
+        for name, field_schema in schema.get("properties", {}).items()
+        if field_schema.get("required")
+    )
+
+
 class Plugin(ABC):
     """
     Abstract base class for all plugins.
@@ -76,6 +85,7 @@ class Plugin(ABC):
         """
         self.config: dict[str, Any] = config or {}
         self._initialized = False
+        self._required_config: tuple[dict[str, Any], tuple[str, ...]] | None = None
 
     @property
     @abstractmethod
@@ -106,18 +116,18 @@ class Plugin(ABC):
         Returns:
             List of validation errors (empty if valid)
         """
-        errors: list[str] = []
-
         schema = self.metadata.config_schema
         if not schema:
-            return errors
+            return []
 
-        # Check required fields
-        for field, field_schema in schema.get("properties", {}).items():
-            if field_schema.get("required") and field not in self.config:
-                errors.append(f"Missing required config: {field}")
+        # Subclasses usually build metadata per access around a shared class-level
+        # schema, so the required fields are kept per schema object
+        cached = getattr(self, "_required_config", None)
+        if cached is None or cached[0] is not schema:
+            cached = (schema, _required_config_fields(schema))
+            self._required_config = cached
 
-        return errors
+        return [f"Missing required config: {name}" for name in cached[1] if name not in self.config]
 
     @property
     def is_initialized(self) -> bool:
@@ -138,10 +148,8 @@ class ParserPlugin(Plugin):
     reading different input formats (Markdown, YAML, etc.).
     """
 
-    @property
-    def plugin_type(self) -> PluginType:
-        """Return the plugin type (always PARSER for this class)."""
-        return PluginType.PARSER
+    # Plugin type (always PARSER for this class)
+    plugin_type: ClassVar[PluginType] = PluginType.PARSER
 
     @abstractmethod
     def get_parser(self) -> Any:
@@ -162,10 +170,8 @@ class TrackerPlugin(Plugin):
     integrating with issue tracking systems (Jira, GitHub, etc.).
     """
 
-    @property
-    def plugin_type(self) -> PluginType:
-        """Return the plugin type (always TRACKER for this class)."""
-        return PluginType.TRACKER
+    # Plugin type (always TRACKER for this class)
+    plugin_type: ClassVar[PluginType] = PluginType.TRACKER
 
     @abstractmethod
     def get_tracker(self) -> Any:
@@ -186,10 +192,8 @@ class FormatterPlugin(Plugin):
     formatting output in different formats (ADF, HTML, etc.).
     """
 
-    @property
-    def plugin_type(self) -> PluginType:
-        """Return the plugin type (always FORMATTER for this class)."""
-        return PluginType.FORMATTER
+    # Plugin type (always FORMATTER for this class)
+    plugin_type: ClassVar[PluginType] = PluginType.FORMATTER
 
     @abstractmethod
     def get_formatter(self) -> Any:
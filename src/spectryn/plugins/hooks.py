@@ -2,10 +2,14 @@
 Hook System - Pre/post processing hooks for extensibility.
 """
 
+import bisect
 import logging
+import sys
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from operator import attrgetter
 from typing import Any
 
 
@@ -69,7 +73,7 @@ class HookPoint(Enum):
     ON_ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class HookContext:
     """
     Context passed to hook handlers.
@@ -122,6 +126,8 @@ class Hook:
         priority: Execution order (lower = earlier, default 100).
     """
 
+    __slots__ = ("handler", "hook_point", "name", "priority")
+
     def __init__(
         self,
         name: str,
@@ -138,7 +144,7 @@ class Hook:
             handler: Function to call when hook is triggered.
             priority: Execution order (lower = earlier).
         """
-        self.name = name
+        self.name = sys.intern(name)  # Shared key in the manager's name index
         self.hook_point = hook_point
         self.handler = handler
         self.priority = priority
@@ -165,6 +171,15 @@ class Hook:
         return self.priority < other.priority
 
 
+_hook_priority = attrgetter("priority")
+_HOOK_POINT_ORDER = {hp: i for i, hp in enumerate(HookPoint)}
+
+
+def _hook_order(hook: Hook) -> tuple[int, int]:
+    """Position of a hook across all hook points: point order, then priority."""
+    return _HOOK_POINT_ORDER[hook.hook_point], hook.priority
+
+
 class HookManager:
     """
     Manages hooks and their execution.
@@ -184,28 +199,32 @@ class HookManager:
     """
 
     def __init__(self) -> None:
-        """Initialize the hook manager with empty hook lists for all hook points."""
-        self._hooks: dict[HookPoint, list[Hook]] = {hp: [] for hp in HookPoint}
+        """Initialize the hook manager; hook lists are created on first registration."""
+        self._hooks: defaultdict[HookPoint, list[Hook]] = defaultdict(list)
+        # Registered hooks by name, in registration order (names need not be unique)
+        self._by_name: dict[str, list[Hook]] = {}
         self.logger = logging.getLogger("HookManager")
 
     def register(self, hook: Hook) -> None:
         """
         Register a hook at its designated hook point.
 
-        Hooks are automatically sorted by priority after registration.
+        Hooks are kept in priority order; a hook is placed after any
+        already registered hooks of the same priority.
 
         Args:
             hook: The Hook instance to register.
         """
-        self._hooks[hook.hook_point].append(hook)
-        self._hooks[hook.hook_point].sort()  # Sort by priority
+        bisect.insort_right(self._hooks[hook.hook_point], hook, key=_hook_priority)
+        self._by_name.setdefault(hook.name, []).append(hook)
         self.logger.debug(f"Registered hook: {hook.name} at {hook.hook_point.name}")
 
     def unregister(self, hook_name: str) -> bool:
         """
         Unregister a hook by its name.
 
-        Searches all hook points for a hook with the given name.
+        If several hooks share the name, the first one in hook point, then
+        execution, order is removed.
 
         Args:
             hook_name: Name of the hook to remove.
@@ -213,12 +232,18 @@ class HookManager:
         Returns:
             True if the hook was found and removed, False otherwise.
         """
-        for hook_point in HookPoint:
-            for hook in self._hooks[hook_point]:
-                if hook.name == hook_name:
-                    self._hooks[hook_point].remove(hook)
-                    return True
-        return False
+        named = self._by_name.get(hook_name)
+        if not named:
+            return False
+
+        # min() keeps the earliest registered among equal keys, matching the
+        # stable priority order of the per-point lists
+        hook = min(named, key=_hook_order)
+        named.remove(hook)
+        if not named:
+            del self._by_name[hook_name]
+        self._hooks[hook.hook_point].remove(hook)
+        return True
 
     def trigger(
         self,
@@ -235,12 +260,15 @@ class HookManager:
         Returns:
             HookContext with results
         """
+        hooks = self._hooks.get(hook_point, ())
         context = HookContext(
             hook_point=hook_point,
             data=data or {},
         )
+        if not hooks:
+            return context
 
-        for hook in self._hooks[hook_point]:
+        for hook in hooks:
             try:
                 hook(context)
 
@@ -286,7 +314,7 @@ class HookManager:
         Returns:
             Copy of the list of hooks at this point (sorted by priority).
         """
-        return self._hooks[hook_point].copy()
+        return list(self._hooks.get(hook_point, ()))
 
     def clear(self, hook_point: HookPoint | None = None) -> None:
         """
@@ -297,7 +325,11 @@ class HookManager:
                        If None, clear all hooks at all points.
         """
         if hook_point:
-            self._hooks[hook_point] = []
+            self._hooks.pop(hook_point, None)
+            for name, named in list(self._by_name.items()):
+                named[:] = [h for h in named if h.hook_point is not hook_point]
+                if not named:
+                    del self._by_name[name]
         else:
-            for hp in HookPoint:
-                self._hooks[hp] = []
+            self._hooks.clear()
+            self._by_name.clear()
@@ -32,6 +32,15 @@ class TestGitHubRateLimiter:
         assert limiter.acquire(timeout=0.1) is True
         assert limiter.acquire(timeout=0.1) is True
 
+    def test_acquire_respects_pause(self):
+        """Should hold callers during pause() unless they ignore it."""
+        limiter = GitHubRateLimiter(requests_per_second=1000.0, burst_size=5)
+
+        limiter.pause(1.0)
+
+        assert limiter.acquire(timeout=0.05) is False
+        assert limiter.acquire(timeout=0.05, ignore_pause=True) is True
+
     def test_stats_tracking(self):
         """Should track request statistics."""
         limiter = GitHubRateLimiter(requests_per_second=10.0, burst_size=5)
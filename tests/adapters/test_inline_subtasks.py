@@ -166,6 +166,14 @@ class TestParseInlineSubtasks:
         # Should have a warning about non-standard format
         assert any("NONSTANDARD_SUBTASK_CHECKBOX" in str(w.code) for w in warnings)
 
+    def test_nonstandard_warning_follows_list_marker(self):
+        """Test that the non-standard warning depends on the line's own marker."""
+        _, warnings = parse_inline_subtasks("*[ ] Tight asterisk task")
+        assert any("NONSTANDARD_SUBTASK_CHECKBOX" in str(w.code) for w in warnings)
+
+        _, warnings = parse_inline_subtasks("- [ ] Document the * [x] syntax")
+        assert not any("NONSTANDARD_SUBTASK_CHECKBOX" in str(w.code) for w in warnings)
+
     def test_indented_checkbox(self):
         """Test parsing indented checkboxes."""
         content = "  - [ ] Indented task"
@@ -4,13 +4,13 @@ Tests for JiraAdapter.
 Tests the Jira implementation of IssueTrackerPort.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from spectryn.adapters.jira.adapter import JiraAdapter
 from spectryn.core.ports.config_provider import TrackerConfig
-from spectryn.core.ports.issue_tracker import IssueData
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerError
 
 
 @pytest.fixture
@@ -83,6 +83,17 @@ class TestJiraAdapterInit:
 
             assert adapter.STORY_POINTS_FIELD == "customfield_99999"
 
+    def test_init_sizes_connection_pool_for_concurrent_phases(self, mock_config):
+        """Test that the keep-alive pool covers concurrent phase request fan-out."""
+        with (
+            patch("spectryn.adapters.jira.adapter.JiraApiClient") as MockClient,
+            patch("spectryn.adapters.jira.adapter.JiraBatchClient"),
+        ):
+            JiraAdapter(config=mock_config, dry_run=True)
+
+            pool_maxsize = MockClient.call_args.kwargs["pool_maxsize"]
+            assert pool_maxsize == mock_config.max_concurrent_requests * 3
+
 
 class TestJiraAdapterProperties:
     """Tests for adapter properties."""
@@ -124,16 +135,91 @@ class TestJiraAdapterReadOperations:
 
         assert isinstance(result, IssueData)
         assert result.key == "TEST-123"
+        params = adapter._client.get.call_args.kwargs["params"]
+        assert params["fields"] == "summary,description,status,issuetype,subtasks"
+
+    def test_get_issue_light_skips_description(self, adapter):
+        """Test that the light read path doesn't request the description."""
+        adapter._client.get.return_value = {
+            "key": "TEST-123",
+            "fields": {"summary": "Test Issue", "status": {"name": "Open"}},
+        }
+
+        result = adapter.get_issue_light("TEST-123")
+
+        assert result.summary == "Test Issue"
+        assert result.description is None
+        params = adapter._client.get.call_args.kwargs["params"]
+        assert params["fields"] == "summary,status,issuetype,subtasks"
 
     def test_get_epic_children(self, adapter, mock_issue_data):
         """Test getting epic children."""
-        adapter._client.search_jql.return_value = {"issues": [mock_issue_data]}
+        adapter._client.search_jql_all.return_value = [mock_issue_data]
 
         result = adapter.get_epic_children("TEST-1")
 
         assert len(result) == 1
         assert result[0].key == "TEST-123"
 
+    def test_get_epic_children_reuses_persisted_descriptions(self, adapter, tmp_path):
+        """Test that unchanged descriptions come from the disk cache on later runs."""
+        from spectryn.adapters.cache import FileCache
+
+        adapter._description_cache = FileCache(cache_dir=tmp_path)
+        light_issue = {
+            "key": "TEST-123",
+            "fields": {"summary": "Story", "updated": "2024-01-01T10:00:00.000+0000"},
+        }
+
+        def search(jql, fields):
+            if jql.startswith("key in"):
+                return [{"key": "TEST-123", "fields": {"description": "Cached body"}}]
+            return [{"key": light_issue["key"], "fields": dict(light_issue["fields"])}]
+
+        adapter._client.search_jql_all.side_effect = search
+
+        first = adapter.get_epic_children("TEST-1")
+        second = adapter.get_epic_children("TEST-1")
+
+        assert first[0].description == second[0].description == "Cached body"
+        # Cold run: children plus descriptions; warm run: children only
+        assert adapter._client.search_jql_all.call_count == 3
+
+    def test_get_issues_bulk_uses_single_key_in_search(self, adapter, mock_issue_data):
+        """Test that bulk fetch issues one "key in (...)" search instead of per-issue GETs."""
+        adapter._client.search_jql_all.return_value = [mock_issue_data]
+
+        result = adapter.get_issues_bulk(["TEST-123", "TEST-124"])
+
+        assert list(result) == ["TEST-123"]
+        adapter._client.search_jql_all.assert_called_once()
+        assert adapter._client.search_jql_all.call_args.args[0] == "key in (TEST-123, TEST-124)"
+        adapter._client.get.assert_not_called()
+
+    def test_get_issues_bulk_light_skips_description(self, adapter, mock_issue_data):
+        """Test that a light bulk fetch leaves the description out of the search."""
+        adapter._client.search_jql_all.return_value = [mock_issue_data]
+
+        adapter.get_issues_bulk(["TEST-123"], light=True)
+
+        assert adapter._client.search_jql_all.call_args.args[1] == [
+            "summary",
+            "status",
+            "issuetype",
+            "subtasks",
+        ]
+
+    def test_get_issue_comments_bulk(self, adapter):
+        """Test that bulk comment fetch reads the comment field from search results."""
+        adapter._client.search_jql_all.return_value = [
+            {"key": "TEST-123", "fields": {"comment": {"comments": [{"body": "hi"}]}}},
+        ]
+
+        result = adapter.get_issue_comments_bulk(["TEST-123"])
+
+        assert result == {"TEST-123": [{"body": "hi"}]}
+        assert adapter._client.search_jql_all.call_args.args[1] == ["comment"]
+
     def test_get_issue_comments(self, adapter):
         """Test getting issue comments."""
         adapter._client.get.return_value = {
@@ -149,7 +235,7 @@ class TestJiraAdapterReadOperations:
 
     def test_get_issue_status(self, adapter):
         """Test getting issue status."""
-        adapter._client.get.return_value = {"fields": {"status": {"name": "In Progress"}}}
+        adapter._client.raw_get.return_value = {"fields": {"status": {"name": "In Progress"}}}
 
         result = adapter.get_issue_status("TEST-123")
 
@@ -244,6 +330,32 @@ class TestJiraAdapterCreateOperations:
 
         assert result == "TEST-789"
 
+    def test_create_subtasks_bulk_uses_bulk_api(self, adapter):
+        """Test bulk subtask creation goes through one bulk create call."""
+        from spectryn.adapters.jira.batch import BatchResult
+
+        adapter._dry_run = False
+        adapter._client.get_current_user_id.return_value = "user-123"
+        batch_result = BatchResult()
+        batch_result.add_success(0, "TEST-10")
+        batch_result.add_failure(1, "Summary is required")
+        adapter._batch_client.bulk_create_issues.return_value = batch_result
+
+        keys = adapter.create_subtasks_bulk(
+            [
+                {"parent_key": "TEST-1", "summary": "First", "project_key": "TEST"},
+                {"parent_key": "TEST-2", "summary": "Second", "project_key": "TEST"},
+            ]
+        )
+
+        assert keys[0] == "TEST-10"
+        assert isinstance(keys[1], IssueTrackerError)
+        assert "Summary is required" in str(keys[1])
+        assert keys[1].issue_key == "TEST-2"
+        adapter._batch_client.bulk_create_issues.assert_called_once()
+        adapter._client.get_current_user_id.assert_called_once()
+        adapter._client.post.assert_not_called()
+
 
 class TestJiraAdapterUpdateSubtask:
     """Tests for update_subtask method."""
@@ -324,7 +436,7 @@ class TestJiraAdapterTransitions:
         """Test transitioning issue live."""
         adapter._dry_run = False
         # Mock get_issue_status to return the current status
-        adapter._client.get.return_value = {"fields": {"status": {"name": "Done"}}}
+        adapter._client.raw_get.return_value = {"fields": {"status": {"name": "Done"}}}
 
         result = adapter.transition_issue("TEST-123", "Done")
 
@@ -440,6 +552,19 @@ class TestJiraAdapterGetSubtaskDetails:
 
         assert result["key"] == "TEST-123"
         assert result["summary"] == "Subtask"
+        assert "description" in adapter._client.get.call_args.kwargs["params"]["fields"]
+
+    def test_get_subtask_details_without_description(self, adapter):
+        """Test that the description can be left out of the projection."""
+        adapter._client.get.return_value = {
+            "key": "TEST-123",
+            "fields": {"summary": "Subtask", "status": {"name": "Open"}},
+        }
+
+        result = adapter.get_subtask_details("TEST-123", include_description=False)
+
+        assert result["description"] is None
+        assert "description" not in adapter._client.get.call_args.kwargs["params"]["fields"]
 
 
 class TestJiraAdapterProjects:
@@ -548,17 +673,33 @@ class TestJiraAdapterTransitionWorkflow:
         adapter._dry_run = False
         # Mock get_issue_status - the method is called multiple times
         # We need to return Done for the final status check
-        adapter._client.get.return_value = {"fields": {"status": {"name": "Done"}}}
+        adapter._client.raw_get.return_value = {"fields": {"status": {"name": "Done"}}}
 
         result = adapter.transition_issue("TEST-123", "Done")
 
         # Already at Done status, so should return True
         assert result is True
 
+    def test_transition_to_in_progress_walks_path(self, adapter):
+        """Test that the in-progress path runs each transition from its status."""
+        adapter._dry_run = False
+        statuses = ["Analyze", "Analyze", "Open", "In Progress"]
+        adapter._client.raw_get.side_effect = [
+            {"fields": {"status": {"name": status}}} for status in statuses
+        ]
+
+        result = adapter.transition_issue("TEST-123", "In Progress")
+
+        assert result is True
+        posted_ids = [
+            call.kwargs["json"]["transition"]["id"] for call in adapter._client.post.call_args_list
+        ]
+        assert posted_ids == ["7", "4"]
+
     def test_transition_unknown_target(self, adapter):
         """Test transition to unknown status."""
         adapter._dry_run = False
-        adapter._client.get.return_value = {"fields": {"status": {"name": "Open"}}}
+        adapter._client.raw_get.return_value = {"fields": {"status": {"name": "Open"}}}
 
         result = adapter.transition_issue("TEST-123", "Unknown Status")
 
@@ -701,3 +842,25 @@ class TestJiraAdapterDescriptionFormatting:
 
         assert result is True
         adapter._client.put.assert_called_once()
+
+    def test_to_adf_passes_through_none_and_dicts(self, adapter):
+        """Test that non-string values are returned unchanged."""
+        adf_body = {"type": "doc", "content": []}
+
+        assert adapter._to_adf(None) is None
+        assert adapter._to_adf(adf_body) is adf_body
+
+    def test_to_adf_blank_text_skips_formatter(self, adapter):
+        """Test that blank text maps to the prebuilt empty document."""
+        expected = adapter.formatter.format_text("")
+
+        with patch.object(adapter.formatter, "format_text") as mock_format:
+            assert adapter._to_adf("") == expected
+            assert adapter._to_adf("  \n ") == expected
+            mock_format.assert_not_called()
+
+    def test_to_adf_formats_text(self, adapter):
+        """Test that non-blank text is converted with the formatter."""
+        result = adapter._to_adf("Some **text**")
+
+        assert result == adapter.formatter.format_text("Some **text**")
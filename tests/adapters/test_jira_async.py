@@ -208,6 +208,57 @@ class TestAsyncJiraAdapterReadOperations:
                 assert issue.status == "Open"
                 assert len(issue.subtasks) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_epic_children_parallel(self, mock_tracker_config, mock_jira_search_response):
+        """Test that epic children are listed by key then fetched in parallel."""
+        from spectryn.adapters.async_base import ParallelResult
+        from spectryn.adapters.jira.async_adapter import AsyncJiraAdapter
+
+        with patch("spectryn.adapters.jira.async_adapter.AsyncJiraApiClient") as mock_client_cls:
+            mock_client = MagicMock()
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock()
+            mock_client.search_all_jql = AsyncMock(
+                return_value=[{"key": "TEST-1"}, {"key": "TEST-2"}]
+            )
+            mock_client.get_issues_parallel = AsyncMock(
+                return_value=ParallelResult(results=mock_jira_search_response["issues"], total=2)
+            )
+            mock_client_cls.return_value = mock_client
+
+            adapter = AsyncJiraAdapter(config=mock_tracker_config, concurrency=3)
+            await adapter.connect()
+            children = await adapter.get_epic_children_parallel("TEST-100")
+
+        assert [child.key for child in children] == ["TEST-1", "TEST-2"]
+        assert mock_client.search_all_jql.call_args.args[1] == ["key"]
+        call = mock_client.get_issues_parallel.call_args
+        assert call.args[0] == ["TEST-1", "TEST-2"]
+        assert call.kwargs["concurrency"] == 3
+
+    @pytest.mark.asyncio
+    async def test_get_epic_children_parallel_raises_on_failed_fetch(self, mock_tracker_config):
+        """Test that a failed child fetch is surfaced instead of silently dropped."""
+        from spectryn.adapters.async_base import ParallelResult
+        from spectryn.adapters.jira.async_adapter import AsyncJiraAdapter
+        from spectryn.core.ports.issue_tracker import IssueTrackerError
+
+        with patch("spectryn.adapters.jira.async_adapter.AsyncJiraApiClient") as mock_client_cls:
+            mock_client = MagicMock()
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock()
+            mock_client.search_all_jql = AsyncMock(return_value=[{"key": "TEST-1"}])
+            mock_client.get_issues_parallel = AsyncMock(
+                return_value=ParallelResult(errors=[(0, RuntimeError("boom"))], total=1)
+            )
+            mock_client_cls.return_value = mock_client
+
+            adapter = AsyncJiraAdapter(config=mock_tracker_config)
+            await adapter.connect()
+
+            with pytest.raises(IssueTrackerError, match="1 of 1 children"):
+                await adapter.get_epic_children_parallel("TEST-100")
+
 
 class TestAsyncJiraAdapterWriteOperations:
     """Tests for AsyncJiraAdapter write operations."""
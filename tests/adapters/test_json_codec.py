@@ -0,0 +1,40 @@
+"""Tests for the fast JSON codec."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from spectryn.adapters.http import json_codec
+
+
+class TestJsonCodec:
+    """Tests for dumps/loads with and without orjson."""
+
+    PAYLOAD = {"fields": {"summary": "Café", "labels": ["a", "b"], "points": 3}}
+
+    def test_round_trip(self):
+        """Test that dumps output is parsed back by loads."""
+        data = json_codec.dumps(self.PAYLOAD)
+
+        assert isinstance(data, bytes)
+        assert json_codec.loads(data) == self.PAYLOAD
+
+    def test_loads_accepts_str(self):
+        """Test that loads accepts text as well as bytes."""
+        assert json_codec.loads(json.dumps(self.PAYLOAD)) == self.PAYLOAD
+
+    def test_stdlib_fallback(self):
+        """Test that the stdlib path is used when orjson is unavailable."""
+        with patch.object(json_codec, "orjson", None):
+            data = json_codec.dumps(self.PAYLOAD)
+
+            assert data == b'{"fields":{"summary":"Caf\xc3\xa9","labels":["a","b"],"points":3}}'
+            assert json_codec.loads(data) == self.PAYLOAD
+
+    def test_invalid_json_raises_value_error(self):
+        """Test that malformed input raises ValueError on both code paths."""
+        with pytest.raises(ValueError):
+            json_codec.loads(b"{not json")
+        with patch.object(json_codec, "orjson", None), pytest.raises(ValueError):
+            json_codec.loads(b"{not json")
@@ -1,15 +1,24 @@
 """Tests for Markdown parser adapter."""
 
+import pytest
+
+from spectryn.core.domain import Priority, Status
+
+
+@pytest.fixture(scope="module")
+def sample_md_file(tmp_path_factory, sample_markdown):
+    """Write the sample markdown to disk once per module."""
+    md_file = tmp_path_factory.mktemp("md") / "epic.md"
+    md_file.write_text(sample_markdown, encoding="utf-8")
+    return md_file
+
 
 class TestMarkdownParser:
     """Tests for MarkdownParser."""
 
-    def test_can_parse_markdown_file(self, markdown_parser, tmp_path):
+    def test_can_parse_markdown_file(self, markdown_parser, sample_md_file):
         """Test parser recognizes markdown files."""
-        md_file = tmp_path / "test.md"
-        md_file.write_text("# Test")
-
-        assert markdown_parser.can_parse(md_file)
+        assert markdown_parser.can_parse(sample_md_file)
 
     def test_can_parse_markdown_content(self, markdown_parser, sample_markdown):
         """Test parser recognizes markdown content."""
@@ -44,16 +53,12 @@ class TestMarkdownParser:
 
     def test_parse_priority(self, markdown_parser, sample_markdown):
         """Test priority extraction."""
-        from spectryn.core.domain import Priority
-
         stories = markdown_parser.parse_stories(sample_markdown)
         assert stories[0].priority == Priority.HIGH
         assert stories[1].priority == Priority.MEDIUM
 
     def test_parse_status(self, markdown_parser, sample_markdown):
         """Test status extraction."""
-        from spectryn.core.domain import Status
-
         stories = markdown_parser.parse_stories(sample_markdown)
         assert stories[0].status == Status.DONE
         assert stories[1].status == Status.IN_PROGRESS
@@ -107,12 +112,9 @@ class TestMarkdownParser:
         errors = markdown_parser.validate(content)
         assert len(errors) > 0
 
-    def test_parse_from_file(self, markdown_parser, sample_markdown, tmp_path):
+    def test_parse_from_file(self, markdown_parser, sample_md_file):
         """Test parsing from file path."""
-        md_file = tmp_path / "epic.md"
-        md_file.write_text(sample_markdown, encoding="utf-8")
-
-        stories = markdown_parser.parse_stories(str(md_file))
+        stories = markdown_parser.parse_stories(sample_md_file)
         assert len(stories) == 2
 
 
@@ -208,23 +210,17 @@ Create detailed technical documentation.
 
     def test_parse_inline_priority(self, markdown_parser):
         """Test priority extraction from inline format with P0/P1 notation."""
-        from spectryn.core.domain import Priority
-
         stories = markdown_parser.parse_stories(self.INLINE_FORMAT_MARKDOWN)
         assert stories[0].priority == Priority.CRITICAL  # P0
         assert stories[1].priority == Priority.HIGH  # P1
 
     def test_parse_inline_status_complete(self, markdown_parser):
         """Test status extraction for Complete status."""
-        from spectryn.core.domain import Status
-
         stories = markdown_parser.parse_stories(self.INLINE_FORMAT_MARKDOWN)
         assert stories[0].status == Status.DONE  # ✅ Complete
 
     def test_parse_inline_status_not_started(self, markdown_parser):
         """Test status extraction for Not Started status."""
-        from spectryn.core.domain import Status
-
         stories = markdown_parser.parse_stories(self.INLINE_FORMAT_MARKDOWN)
         assert stories[1].status == Status.PLANNED  # 🔲 Not Started
 
@@ -10,10 +10,12 @@ Tests cover:
 """
 
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
 from spectryn.adapters.parsers import (
+    LineIndex,
     MarkdownParser,
     ParseErrorCode,
     ParseErrorInfo,
@@ -27,6 +29,7 @@ from spectryn.adapters.parsers import (
     get_context_lines,
     get_line_content,
     get_line_number,
+    parse_checkbox_columns,
     parse_checkboxes_tolerant,
     parse_description_tolerant,
 )
@@ -69,6 +72,17 @@ class TestLinePositionUtilities:
         content = "hello\nworld"
         assert get_column_number(content, 8) == 3  # 'r' in world
 
+    def test_line_index_matches_line_and_column_helpers(self):
+        """Test LineIndex lookups at every position, including line ends."""
+        content = "ab\n\ncd\n"
+        index = LineIndex(content)
+        for position in range(len(content) + 1):
+            assert index.line_for(position) == content[:position].count("\n") + 1
+            assert index.column_for(position) == get_column_number(content, position)
+        assert index.line_for(len(content)) == 4
+        assert index.column_for(3) == 1
+        assert index.lines == ["ab", "", "cd", ""]
+
     def test_get_line_content(self):
         """Test getting content of specific line."""
         content = "line one\nline two\nline three"
@@ -167,6 +181,27 @@ class TestTolerantFieldExtractor:
         assert len(extractor.warnings) == 1
         assert "alias" in extractor.warnings[0].message.lower()
 
+    def test_extract_prefers_canonical_name_over_earlier_alias(self):
+        """Test that the canonical field wins even when an alias comes first."""
+        content = "**Points**: 13\n| **Story Points** | 5 |"
+        extractor = TolerantFieldExtractor(content)
+        value, location = extractor.extract_field("Story Points")
+        assert value == "5"
+        assert location is not None
+        assert location.line == 2
+        assert extractor.warnings == []
+
+    def test_extract_prefers_table_over_earlier_inline(self):
+        """Test that the table form wins when a field also appears inline first."""
+        content = "> **Story Points**: 2\n**Story Points**: 8\n| **Story Points** | 5 |"
+        value, location = TolerantFieldExtractor(content).extract_field("Story Points")
+        assert value == "5"
+        assert location is not None
+        assert location.line == 3
+
+        fields = TolerantFieldExtractor(content).extract_fields(["Story Points", "Priority"])
+        assert fields["Story Points"] == (value, location)
+
     def test_extract_with_extra_whitespace(self):
         """Test extraction tolerates extra whitespace."""
         content = "|  **Story Points**  |  5  |"
@@ -190,6 +225,44 @@ class TestTolerantFieldExtractor:
         assert len(extractor.warnings) == 1
         assert "Missing field" in extractor.warnings[0].message
 
+    def test_repeated_lookup_reuses_result(self):
+        """Test that a repeated lookup returns the first result without rescanning."""
+        extractor = TolerantFieldExtractor("**Points**: 13")
+        first = extractor.extract_field("Story Points")
+
+        with patch.object(TolerantPatterns, "field_pattern") as field_pattern:
+            assert extractor.extract_field("Story Points") == first
+            assert extractor.extract_field("Story Points", default="0") == first
+        field_pattern.assert_not_called()
+        # The alias warning is recorded once
+        assert len(extractor.warnings) == 1
+
+    def test_extract_fields_matches_single_lookups(self):
+        """Test that a batch lookup agrees with one extract_field call per field."""
+        content = "**SP**: 3\n| Priority | High |\n> **State**: Done\n**Story Points**: 5"
+        names = ["Story Points", "Priority", "Status", "Story ID"]
+        single = TolerantFieldExtractor(content)
+        expected = {name: single.extract_field(name) for name in names}
+
+        extractor = TolerantFieldExtractor(content)
+        fields = extractor.extract_fields(names)
+
+        assert fields["Story Points"][0] == "5"
+        assert "Story ID" not in fields
+        assert {name: extractor.extract_field(name) for name in names} == expected
+        assert extractor.warnings == single.warnings
+
+    def test_subclass_aliases(self):
+        """Test that a subclass overriding the alias table is honoured."""
+
+        class CustomExtractor(TolerantFieldExtractor):
+            FIELD_ALIASES = {"Story Points": ["Effort"]}
+
+        value, _ = CustomExtractor("**Effort**: 8").extract_field("Story Points")
+        assert value == "8"
+        _, location = TolerantFieldExtractor("**Effort**: 8").extract_field("Story Points")
+        assert location is None
+
 
 # =============================================================================
 # Tolerant Section Extractor Tests
@@ -302,6 +375,31 @@ class TestTolerantCheckboxParsing:
         assert len(items) == 1
         assert items[0] == ("Plus item", True)
 
+    def test_parse_checkbox_columns_matches_tuple_api(self):
+        """Test that the column form carries the same items and warnings."""
+        content = "- [x] Done\n* [ ] Open\n- [] Empty"
+        texts, checked, warnings = parse_checkbox_columns(content)
+        items, tuple_warnings = parse_checkboxes_tolerant(content)
+        assert list(zip(texts, checked, strict=True)) == items
+        assert checked == [True, False, False]
+        assert warnings == tuple_warnings
+
+    def test_checkbox_warning_points_at_checkbox_line(self):
+        """Test that warnings report the checkbox's own line, not preceding blanks."""
+        content = "Intro\n\n\n* [ ] Asterisk item\n- [ ] Plain item"
+        items, warnings = parse_checkboxes_tolerant(content)
+        assert [text for text, _ in items] == ["Asterisk item", "Plain item"]
+        assert len(warnings) == 1
+        assert warnings[0].location.line == 4
+        assert warnings[0].location.column == 1
+
+    def test_checkbox_does_not_span_lines(self):
+        """Test that a checkbox's marker, box and text must share one line."""
+        content = "- [ ]\nFollow-up text\n-\n[x] Split marker\n- [ ]   \n- [x] Real item"
+        items, warnings = parse_checkboxes_tolerant(content)
+        assert items == [("Real item", True)]
+        assert warnings == []
+
 
 # =============================================================================
 # Tolerant Description Parsing Tests
@@ -517,6 +615,20 @@ class TestMarkdownParserValidateDetailed:
         _errors, warnings = parser.validate_detailed(content)
         assert any("description" in w.message.lower() for w in warnings)
 
+    def test_validate_detailed_heading_with_empty_title(self, parser):
+        """Test that a heading ending in a colon doesn't hide the story below it."""
+        content = dedent("""
+            # Epic
+
+            ## Phase 1:
+            ### US-001: Login
+
+            ### US-002: Logout
+        """)
+        errors, _warnings = parser.validate_detailed(content)
+        # Both stories are validated, so each reports its missing story points
+        assert [e.location.line for e in errors] == [5, 7]
+
     def test_validate_detailed_error_has_context(self, parser):
         """Test that validation errors include context."""
         content = "# Empty file\n\nNo stories here."
@@ -583,6 +695,15 @@ class TestTolerantPatterns:
         assert match is not None
         assert match.group(1) == "PROJ-001"
 
+    def test_story_header_any_tells_levels_apart(self):
+        """Test the combined header pattern reports h2-h4 and h1 stories by group."""
+        content = "### US-001: Nested Story\n# PROJ-002: Standalone Story ✅\n"
+        nested, standalone = TolerantPatterns.STORY_HEADER_ANY.finditer(content)
+        assert nested.group(1) == "###"
+        assert nested.group(2, 3) == ("US-001", "Nested Story")
+        assert standalone.group(1) is None
+        assert standalone.group(4, 5) == ("PROJ-002", "Standalone Story")
+
     def test_checkbox_pattern_variations(self):
         """Test checkbox pattern matches various formats."""
         variations = [
@@ -612,3 +733,15 @@ class TestTolerantPatterns:
         match = pattern.search(content)
         assert match is not None
         assert "Item" in match.group(2)
+
+    def test_pattern_factories_reuse_compiled_patterns(self):
+        """Test that repeated factory calls return the same compiled pattern."""
+        assert TolerantPatterns.field_pattern("Priority", "inline") is (
+            TolerantPatterns.field_pattern("Priority", "inline")
+        )
+        assert TolerantPatterns.field_pattern("Priority", "table") is not (
+            TolerantPatterns.field_pattern("Priority", "inline")
+        )
+        assert TolerantPatterns.section_pattern("Subtasks") is (
+            TolerantPatterns.section_pattern("Subtasks")
+        )
@@ -1,6 +1,6 @@
 """Tests for application commands."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -14,32 +14,26 @@ from spectryn.application.commands import (
     UpdateSubtaskCommand,
 )
 from spectryn.core.domain.events import EventBus
-from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerError
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerError, IssueTrackerPort
 
 
-class TestCommandResult:
-    """Tests for CommandResult."""
-
-    def test_ok(self):
-        result = CommandResult.ok("data")
-        assert result.success
-        assert result.data == "data"
-        assert not result.dry_run
+# Pure in-memory unit tests (select with -m fast)
+pytestmark = pytest.mark.fast
 
-    def test_ok_dry_run(self):
-        result = CommandResult.ok("data", dry_run=True)
-        assert result.success
-        assert result.dry_run
 
-    def test_fail(self):
-        result = CommandResult.fail("error message")
-        assert not result.success
-        assert result.error == "error message"
+class TestCommandResult:
+    """Tests for CommandResult."""
 
-    def test_skip(self):
-        result = CommandResult.skip("reason")
-        assert result.success
-        assert result.skipped
+    def test_factories(self):
+        cases = [
+            ("ok", CommandResult.ok("data"), {"success": True, "data": "data", "dry_run": False}),
+            ("dry run", CommandResult.ok("data", dry_run=True), {"success": True, "dry_run": True}),
+            ("fail", CommandResult.fail("error"), {"success": False, "error": "error"}),
+            ("skip", CommandResult.skip("reason"), {"success": True, "skipped": True}),
+        ]
+        for label, result, expected in cases:
+            for attr, value in expected.items():
+                assert getattr(result, attr) == value, f"{label}: {attr}"
 
 
 class TestUpdateDescriptionCommand:
@@ -47,7 +41,7 @@ class TestUpdateDescriptionCommand:
 
     @pytest.fixture
     def mock_tracker(self):
-        tracker = Mock()
+        tracker = Mock(spec=IssueTrackerPort)
         tracker.get_issue.return_value = IssueData(
             key="PROJ-123", summary="Test", description="Old description"
         )
@@ -175,7 +169,7 @@ class TestCreateSubtaskCommand:
 
     @pytest.fixture
     def mock_tracker(self):
-        tracker = Mock()
+        tracker = Mock(spec=IssueTrackerPort)
         tracker.create_subtask.return_value = "PROJ-456"
         return tracker
 
@@ -321,13 +315,52 @@ class TestCreateSubtaskCommand:
         assert events[0].subtask_key == "PROJ-456"
         assert events[0].subtask_name == "Subtask"
 
+    def _bulk_commands(self, tracker, summaries):
+        return [
+            CreateSubtaskCommand(
+                tracker=tracker,
+                parent_key="PROJ-123",
+                project_key="PROJ",
+                summary=summary,
+                dry_run=False,
+            )
+            for summary in summaries
+        ]
+
+    def test_execute_bulk_keeps_per_item_errors(self, mock_tracker):
+        mock_tracker.create_subtasks_bulk.return_value = [
+            "PROJ-456",
+            IssueTrackerError("Field 'priority' is invalid"),
+            None,
+        ]
+        commands = self._bulk_commands(mock_tracker, ["One", "Two", "", "Three"])
+
+        results = CreateSubtaskCommand.execute_bulk(commands)
+
+        (subtasks,) = mock_tracker.create_subtasks_bulk.call_args.args
+        assert [s["summary"] for s in subtasks] == ["One", "Two", "Three"]
+        assert results[0].data == "PROJ-456"
+        assert results[1].error == "Field 'priority' is invalid"
+        assert "summary" in results[2].error.lower()
+        assert results[3].error == "Failed to create subtask"
+        mock_tracker.create_subtask.assert_not_called()
+
+    def test_execute_bulk_fails_all_on_wrong_result_count(self, mock_tracker):
+        mock_tracker.create_subtasks_bulk.return_value = ["PROJ-456"]
+        commands = self._bulk_commands(mock_tracker, ["One", "Two"])
+
+        results = CreateSubtaskCommand.execute_bulk(commands)
+
+        assert [r.success for r in results] == [False, False]
+        assert "returned 1 results for 2 subtasks" in results[0].error
+
 
 class TestTransitionStatusCommand:
     """Tests for TransitionStatusCommand."""
 
     @pytest.fixture
     def mock_tracker(self):
-        tracker = Mock()
+        tracker = Mock(spec=IssueTrackerPort)
         tracker.get_issue_status.return_value = "Open"
         tracker.transition_issue.return_value = True
         return tracker
@@ -421,13 +454,35 @@ class TestTransitionStatusCommand:
         assert not undo_result.success
         assert "Undo failed" in undo_result.error
 
+    def test_events_share_interned_keys(self, mock_tracker):
+        """Test that events for the same issue reference one key string."""
+        import sys
+
+        from spectryn.core.domain.events import DomainEvent
+
+        event_bus = EventBus()
+        events: list[DomainEvent] = []
+        event_bus.subscribe(DomainEvent, events.append)
+
+        for _ in range(2):
+            TransitionStatusCommand(
+                tracker=mock_tracker,
+                issue_key="".join(["PROJ-", "123"]),
+                target_status="Resolved",
+                event_bus=event_bus,
+                dry_run=False,
+            ).execute()
+
+        assert events[0].issue_key is events[1].issue_key is sys.intern("PROJ-123")
+        assert events[0].to_status is events[1].to_status
+
 
 class TestAddCommentCommand:
     """Tests for AddCommentCommand."""
 
     @pytest.fixture
     def mock_tracker(self):
-        tracker = Mock()
+        tracker = Mock(spec=IssueTrackerPort)
         tracker.add_comment.return_value = True
         return tracker
 
@@ -505,7 +560,7 @@ class TestUpdateSubtaskCommand:
 
     @pytest.fixture
     def mock_tracker(self):
-        tracker = Mock()
+        tracker = Mock(spec=IssueTrackerPort)
         tracker.update_subtask.return_value = True
         return tracker
 
@@ -589,55 +644,97 @@ class TestUpdateSubtaskCommand:
 class TestCommandBatch:
     """Tests for CommandBatch."""
 
-    def test_execute_all_success(self):
+    def test_execute_all(self):
+        # (first command's result, stop_on_error, results, executed, failed, second runs)
+        cases = [
+            ("all success", CommandResult.ok("result1"), True, 2, 2, 0, True),
+            ("stop on error", CommandResult.fail("error"), True, 1, 0, 1, False),
+            ("continue on error", CommandResult.fail("error"), False, 2, 1, 1, True),
+        ]
+        for label, first_result, stop_on_error, n_results, executed, failed, second_runs in cases:
+            cmd1 = Mock()
+            cmd1.execute.return_value = first_result
+
+            cmd2 = Mock()
+            cmd2.execute.return_value = CommandResult.ok("result2")
+
+            batch = CommandBatch(stop_on_error=stop_on_error)
+            batch.add(cmd1).add(cmd2)
+
+            results = batch.execute_all()
+
+            assert len(results) == n_results, label
+            assert batch.all_succeeded is (failed == 0), label
+            assert batch.executed_count == executed, label
+            assert batch.failed_count == failed, label
+            assert cmd2.execute.called is second_runs, label
+
+    def test_execute_parallel_preserves_order(self):
+        commands = []
+        for i in range(5):
+            cmd = Mock()
+            cmd.execute.return_value = CommandResult.ok(f"result{i}")
+            commands.append(cmd)
+
+        batch = CommandBatch(commands=commands, stop_on_error=False)
+        results = batch.execute_parallel(max_workers=3)
+
+        assert [r.data for r in results] == [f"result{i}" for i in range(5)]
+        assert batch.executed_count == 5
+
+    def test_execute_parallel_captures_exceptions(self):
         cmd1 = Mock()
-        cmd1.execute.return_value = CommandResult.ok("result1")
+        cmd1.name = "Broken"
+        cmd1.execute.side_effect = RuntimeError("boom")
 
         cmd2 = Mock()
-        cmd2.execute.return_value = CommandResult.ok("result2")
+        cmd2.execute.return_value = CommandResult.ok()
 
-        batch = CommandBatch()
+        batch = CommandBatch(stop_on_error=False)
         batch.add(cmd1).add(cmd2)
 
-        results = batch.execute_all()
+        results = batch.execute_parallel(max_workers=2)
 
         assert len(results) == 2
-        assert batch.all_succeeded
-        assert batch.executed_count == 2
+        assert results[0].error == "Unexpected error: boom"
+        assert results[1].success
+        assert batch.failed_count == 1
 
-    def test_execute_stop_on_error(self):
-        cmd1 = Mock()
-        cmd1.execute.return_value = CommandResult.fail("error")
+    def test_execute_parallel_reports_results_as_they_finish(self):
+        import threading
 
-        cmd2 = Mock()
-        cmd2.execute.return_value = CommandResult.ok()
+        second_reported = threading.Event()
+        slow = Mock()
+        slow.execute.side_effect = lambda: CommandResult.ok(second_reported.wait(timeout=5))
+        fast = Mock()
+        fast.execute.return_value = CommandResult.ok("fast")
+        reported: list[int] = []
 
-        batch = CommandBatch(stop_on_error=True)
-        batch.add(cmd1).add(cmd2)
+        def on_result(index, _result):
+            reported.append(index)
+            second_reported.set()
 
-        results = batch.execute_all()
+        batch = CommandBatch(commands=[slow, fast], stop_on_error=False)
+        results = batch.execute_parallel(max_workers=2, on_result=on_result)
 
-        # Should stop after first failure
-        assert len(results) == 1
-        assert batch.failed_count == 1
-        cmd2.execute.assert_not_called()
+        assert reported == [1, 0]
+        assert [r.data for r in results] == [True, "fast"]
 
-    def test_execute_continue_on_error(self):
-        cmd1 = Mock()
-        cmd1.execute.return_value = CommandResult.fail("error")
+    def test_execute_parallel_empty(self):
+        batch = CommandBatch()
 
-        cmd2 = Mock()
-        cmd2.execute.return_value = CommandResult.ok()
+        assert batch.execute_parallel(max_workers=4) == []
 
-        batch = CommandBatch(stop_on_error=False)
-        batch.add(cmd1).add(cmd2)
+    def test_execute_parallel_single_worker_runs_inline(self):
+        cmd = Mock()
+        cmd.execute.return_value = CommandResult.ok("done")
 
-        results = batch.execute_all()
+        batch = CommandBatch(commands=[cmd])
+        with patch("spectryn.application.commands.base.ThreadPoolExecutor") as mock_pool:
+            results = batch.execute_parallel(max_workers=4)
 
-        # Should continue despite failure
-        assert len(results) == 2
-        assert batch.failed_count == 1
-        assert batch.executed_count == 1
+        assert [r.data for r in results] == ["done"]
+        mock_pool.assert_not_called()
 
 
 # =============================================================================
@@ -720,6 +817,24 @@ class TestSyncResultGracefulDegradation:
         assert result.partial_success is True
         assert result.success is False
 
+    def test_merge_phase_result(self):
+        """Test folding a phase-local result into the overall result."""
+        from spectryn.application.sync.orchestrator import SyncResult
+
+        result = SyncResult()
+        result.stories_updated = 2
+
+        phase_result = SyncResult()
+        phase_result.subtasks_created = 3
+        phase_result.add_failed_operation("create_subtask", "PROJ-1", "err")
+
+        result.merge(phase_result)
+
+        assert result.stories_updated == 2
+        assert result.subtasks_created == 3
+        assert len(result.failed_operations) == 1
+        assert result.success is False
+
     def test_success_rate_calculation(self):
         """Test success rate calculation."""
         from spectryn.application.sync.orchestrator import SyncResult
@@ -839,3 +954,232 @@ class TestSyncOrchestratorGracefulDegradation:
 
         # failed_operations should be a list (even if empty)
         assert isinstance(result.failed_operations, list)
+
+    def test_sync_phases_run_concurrently(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config
+    ):
+        """Test that phase commands run on a pool and are tallied correctly."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+
+        sync_config.sync_workers = 4
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config,
+        )
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.stories_updated == 2
+        assert result.subtasks_created == 1
+        assert result.subtasks_updated == 1
+        assert result.statuses_updated == 1
+        assert mock_tracker_with_children.create_subtask.call_count == 1
+
+    def test_phase_only_syncs_share_analysis(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config, tmp_path
+    ):
+        """Test that back-to-back sync_*_only calls parse and fetch once."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+
+        markdown = tmp_path / "doc.md"
+        markdown.write_text("# Epic\n")
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config,
+        )
+
+        orchestrator.sync_descriptions_only(str(markdown), "TEST-1")
+        result = orchestrator.sync_subtasks_only(str(markdown), "TEST-1")
+
+        assert result.subtasks_created == 1
+        assert mock_parser.parse_stories.call_count == 1
+        assert mock_tracker_with_children.get_epic_children.call_count == 1
+
+        # A different epic is analyzed afresh
+        orchestrator.sync_subtasks_only(str(markdown), "TEST-2")
+        assert mock_tracker_with_children.get_epic_children.call_count == 2
+
+    def test_failed_analysis_is_not_reused(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config, tmp_path
+    ):
+        """Test that a retry after a failed fetch analyzes again instead of reusing state."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+
+        markdown = tmp_path / "doc.md"
+        markdown.write_text("# Epic\n")
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config,
+        )
+        orchestrator.sync_descriptions_only(str(markdown), "TEST-1")
+
+        children = mock_tracker_with_children.get_epic_children.return_value
+        mock_tracker_with_children.get_epic_children.side_effect = IssueTrackerError("down")
+        with pytest.raises(IssueTrackerError):
+            orchestrator.sync_subtasks_only(str(markdown), "TEST-2")
+
+        mock_tracker_with_children.get_epic_children.side_effect = None
+        mock_tracker_with_children.get_epic_children.return_value = children
+        orchestrator.sync_subtasks_only(str(markdown), "TEST-2")
+
+        assert mock_tracker_with_children.get_epic_children.call_count == 3
+
+    def test_reused_matches_keep_issue_count_and_description_hashes(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config, tmp_path
+    ):
+        """Test that a run reusing a completed run's matches still skips unchanged descriptions."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+        from spectryn.application.sync.state import StateStore
+
+        markdown = tmp_path / "doc.md"
+        markdown.write_text("# Epic\n")
+        epic_children = mock_tracker_with_children.get_epic_children.return_value
+        epic_children[0].description = mock_formatter.format_story_description.return_value
+        mock_tracker_with_children.get_epic_updated.return_value = "2:2026-01-01T00:00:00.000+0000"
+        store = StateStore(state_dir=tmp_path / "state")
+
+        for _ in range(2):
+            mock_tracker_with_children.update_issue_description.reset_mock()
+            orchestrator = SyncOrchestrator(
+                tracker=mock_tracker_with_children,
+                parser=mock_parser,
+                formatter=mock_formatter,
+                config=sync_config,
+                state_store=store,
+            )
+            orchestrator.sync_resumable(str(markdown), "TEST-1")
+
+        # The second run reused the first run's matches instead of the fetched children
+        assert orchestrator._jira_issues == []
+        assert orchestrator._jira_issue_count == 2
+        updated_keys = [
+            c.args[0] for c in mock_tracker_with_children.update_issue_description.call_args_list
+        ]
+        assert updated_keys == ["TEST-11"]
+
+    def test_sync_creates_subtasks_in_bulk(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config
+    ):
+        """Test that new subtasks are created with one bulk call per run."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+
+        mock_tracker_with_children.create_subtasks_bulk.side_effect = None
+        mock_tracker_with_children.create_subtasks_bulk.return_value = ["TEST-99"]
+
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config,
+        )
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.subtasks_created == 1
+        mock_tracker_with_children.create_subtasks_bulk.assert_called_once()
+        (subtasks,) = mock_tracker_with_children.create_subtasks_bulk.call_args.args
+        assert [s["parent_key"] for s in subtasks] == ["TEST-10"]
+        mock_tracker_with_children.create_subtask.assert_not_called()
+
+    def test_phases_run_on_calling_thread_by_default(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config
+    ):
+        """Test that phases only run on worker threads when concurrent_phases is set."""
+        import threading
+
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+
+        threads: set[str] = set()
+        mock_tracker_with_children.update_issue_description.side_effect = lambda *_args, **_kwargs: (
+            threads.add(threading.current_thread().name)
+        )
+
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config,
+        )
+        orchestrator.sync("/path/to/doc.md", "TEST-1")
+        assert threads == {threading.current_thread().name}
+
+        threads.clear()
+        sync_config.concurrent_phases = True
+        orchestrator.sync("/path/to/doc.md", "TEST-1")
+        assert all(name.startswith("sync-phase") for name in threads)
+
+    def test_sync_skips_unchanged_descriptions(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config
+    ):
+        """Test that a description matching the tracker's current one isn't rewritten."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+
+        epic_children = mock_tracker_with_children.get_epic_children.return_value
+        epic_children[0].description = mock_formatter.format_story_description.return_value
+
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config,
+        )
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.stories_updated == 1
+        updated_keys = [
+            c.args[0] for c in mock_tracker_with_children.update_issue_description.call_args_list
+        ]
+        assert updated_keys == ["TEST-11"]
+
+    def test_status_phase_sees_created_subtasks_without_refetch(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config
+    ):
+        """Test that subtasks created for a done story are transitioned from the cache."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+        from spectryn.core.domain.entities import Subtask
+
+        done_story = mock_parser.parse_stories.return_value[1]
+        done_story.subtasks.append(Subtask(name="Beta Extra", description="New", story_points=1))
+
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config,
+        )
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.subtasks_created == 2
+        assert result.statuses_updated == 2
+        assert mock_tracker_with_children.get_issues_bulk.call_count == 1
+
+    def test_sync_reuses_issue_reads_across_phases(
+        self, mock_tracker_with_children, mock_parser, mock_formatter, sync_config_dry_run
+    ):
+        """Test that subtask and status phases share one bulk issue read per run."""
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+
+        orchestrator = SyncOrchestrator(
+            tracker=mock_tracker_with_children,
+            parser=mock_parser,
+            formatter=mock_formatter,
+            config=sync_config_dry_run,
+        )
+
+        orchestrator.sync("/path/to/doc.md", "TEST-1")
+        assert mock_tracker_with_children.get_issues_bulk.call_count == 1
+        # Both phases only read subtasks and statuses, so descriptions are skipped
+        assert mock_tracker_with_children.get_issues_bulk.call_args.kwargs == {"light": True}
+        mock_tracker_with_children.get_issue.assert_not_called()
+
+        # A new run starts with an empty cache
+        orchestrator.sync("/path/to/doc.md", "TEST-1")
+        assert mock_tracker_with_children.get_issues_bulk.call_count == 2
@@ -134,6 +134,24 @@ class TestProgressReporter:
         assert reporter.state.current_item == 1
         assert reporter.state.item_name == "Item 1 (detail)"
 
+    def test_concurrent_phases_keep_their_own_counters(self) -> None:
+        """Items of interleaved phases should advance only their own phase."""
+        callback = MagicMock()
+        reporter = ProgressReporter(callback=callback, total_phases=5)
+        reporter.start_phase(SyncPhase.DESCRIPTIONS, total_items=2)
+        reporter.start_phase(SyncPhase.SUBTASKS, total_items=3)
+
+        reporter.update_item("PROJ-1", phase=SyncPhase.DESCRIPTIONS)
+        assert callback.call_args[0][0] == "Updating descriptions"
+        assert callback.call_args[0][3:] == (1, 2)
+
+        reporter.update_item("Subtask 1", phase=SyncPhase.SUBTASKS)
+        assert callback.call_args[0][0] == "Syncing subtasks"
+        assert callback.call_args[0][3:] == (1, 3)
+
+        reporter.update_item("PROJ-2", phase=SyncPhase.DESCRIPTIONS)
+        assert callback.call_args[0][3:] == (2, 2)
+
     def test_complete(self) -> None:
         """Completing should set phase to COMPLETE."""
         reporter = ProgressReporter(total_phases=5)
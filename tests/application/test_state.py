@@ -273,3 +273,25 @@ class TestStateStore:
         # Different path - should not find
         not_found = store.find_latest_resumable("/other.md", "PROJ-1")
         assert not_found is None
+
+    def test_find_latest_completed_keeps_match_inputs(self, tmp_path):
+        """Test that completed sessions round-trip the inputs their matches came from."""
+        store = StateStore(state_dir=tmp_path)
+
+        state = SyncState("finished", "/path.md", "PROJ-1")
+        state.matched_stories = [("US-1", "PROJ-2")]
+        state.markdown_hash = "abc"
+        state.epic_updated = "3:2026-01-01T00:00:00.000+0000"
+        state.issue_count = 3
+        state.description_hashes = {"PROJ-2": "d41d8c"}
+        state.set_phase(SyncPhase.COMPLETED)
+        store.save(state)
+
+        found = store.find_latest_completed("/path.md", "PROJ-1")
+        assert found is not None
+        assert found.markdown_hash == "abc"
+        assert found.epic_updated == "3:2026-01-01T00:00:00.000+0000"
+        assert dict(found.matched_stories) == {"US-1": "PROJ-2"}
+        assert found.issue_count == 3
+        assert found.description_hashes == {"PROJ-2": "d41d8c"}
+        assert store.find_latest_resumable("/path.md", "PROJ-1") is None
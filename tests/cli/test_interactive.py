@@ -138,6 +138,7 @@ class TestInteractiveSession:
         orchestrator.config.sync_statuses = True
         orchestrator._md_stories = []
         orchestrator._jira_issues = []
+        orchestrator._jira_issue_count = 0
         orchestrator._matches = {}
         return orchestrator
 
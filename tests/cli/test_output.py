@@ -255,6 +255,16 @@ class TestColorThemes:
         # Dark theme uses bright colors
         assert default_green != dark_green
 
+    def test_colors_follow_theme_after_switching_back(self):
+        """Test that cached theme lookups don't go stale across theme switches."""
+        set_theme(ThemeName.DEFAULT)
+        default_green = Colors.GREEN
+        set_theme(ThemeName.DARK)
+        assert get_theme().success == Colors.GREEN
+
+        set_theme(ThemeName.DEFAULT)
+        assert default_green == Colors.GREEN
+
     def test_colors_static_values_unchanged(self):
         """Test that RESET, BOLD, DIM are theme-independent."""
         set_theme(ThemeName.DEFAULT)
@@ -413,6 +423,23 @@ class TestConsoleMessages:
         assert "✓" in captured.out
         assert "It worked!" in captured.out
 
+    def test_message_colors_follow_theme_changes(self, capsys):
+        """Test that cached message prefixes are rebuilt after a theme change."""
+        console = Console(quiet=False, color=False)
+        console.color = True
+
+        try:
+            set_theme("default")
+            console.success("done")
+            set_theme("dark")
+            console.success("done")
+        finally:
+            set_theme("default")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == f"\033[32m  {Symbols.CHECK} done\033[0m"
+        assert lines[1] == f"\033[92m  {Symbols.CHECK} done\033[0m"
+
     def test_success_suppressed_in_quiet(self, capsys):
         """Test success is suppressed in quiet mode."""
         console = Console(quiet=True)
@@ -557,6 +584,33 @@ class TestConsoleTable:
         captured = capsys.readouterr()
         assert captured.out == ""
 
+    def test_table_written_in_one_call(self):
+        """Test that a table reaches stdout in a single write."""
+        console = Console(quiet=False, color=False)
+        stdout = MagicMock(wraps=StringIO())
+
+        with patch("sys.stdout", stdout):
+            console.table(["Name", "Value"], [["Key1", "Val1"], ["Key2", "Val2"]])
+
+        stdout.write.assert_called_once()
+        assert "Key2" in stdout.write.call_args.args[0]
+
+    @pytest.mark.parametrize("quiet", [False, True])
+    def test_sync_result_written_in_one_call(self, quiet):
+        """Test that the whole sync summary reaches stdout in a single write."""
+        from spectryn.application.sync import SyncResult
+
+        console = Console(quiet=quiet, color=False)
+        result = SyncResult(stories_matched=2, warnings=["w1"])
+        result.add_error("e1")
+        stdout = MagicMock(wraps=StringIO())
+
+        with patch("sys.stdout", stdout):
+            console.sync_result(result)
+
+        stdout.write.assert_called_once()
+        assert "e1" in stdout.write.call_args.args[0]
+
 
 class TestConsoleProgress:
     """Tests for Console progress methods."""
@@ -571,6 +625,19 @@ class TestConsoleProgress:
         # Progress bar outputs to same line with \r
         assert "50" in captured.out or "Halfway" in captured.out
 
+    def test_progress_skips_unchanged_lines_on_tty(self):
+        """Test that updates that don't change the visible bar aren't rewritten."""
+        console = Console(quiet=False, color=False)
+        stdout = MagicMock(wraps=StringIO())
+        stdout.isatty.return_value = True
+
+        with patch("sys.stdout", stdout):
+            for current in range(1001, 1004):
+                console.progress(current, 10_000, "Syncing")
+
+        stdout.write.assert_called_once()
+        assert "[" + "█" * 3 + "░" * 27 + "]" in stdout.write.call_args.args[0]
+
     def test_progress_suppressed_in_quiet(self, capsys):
         """Test progress is suppressed in quiet mode."""
         console = Console(quiet=True)
@@ -0,0 +1,13 @@
+"""
+Shared fixtures for TUI tests.
+"""
+
+import pytest
+
+from spectryn.cli.tui.data import TUIState, create_demo_state
+
+
+@pytest.fixture(scope="session")
+def demo_state() -> TUIState:
+    """Demo state shared by the session; tests using it must not modify it."""
+    return create_demo_state()
@@ -6,13 +6,17 @@ These tests focus on initialization and configuration.
 """
 
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
+from spectryn.cli.tui.app import SpectraTUI, run_tui
 from spectryn.cli.tui.data import TUIState, create_demo_state
 
 
+# Pure in-memory unit tests (select with -m fast)
+pytestmark = pytest.mark.fast
+
+
 class TestTUIStateInitialization:
     """Tests for TUI state initialization."""
 
@@ -42,28 +46,17 @@ class TestTUIStateInitialization:
 class TestRunTUIFunction:
     """Tests for run_tui function."""
 
-    def test_run_tui_without_textual(self) -> None:
+    def test_run_tui_without_textual(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test run_tui returns error when Textual not available."""
-        with patch("spectryn.cli.tui.app.TEXTUAL_AVAILABLE", False):
-            from spectryn.cli.tui.app import run_tui
+        monkeypatch.setattr("spectryn.cli.tui.app.TEXTUAL_AVAILABLE", False)
 
-            # Re-import to get patched version
-            result = run_tui(demo=True)
-            # When TEXTUAL_AVAILABLE is False, should return error code
-            if result != 0:
-                assert result == 1  # Error code when Textual not available
+        # Error code when Textual not available
+        assert run_tui(demo=True) == 1
 
     def test_run_tui_demo_mode_available(self) -> None:
         """Test that demo mode is supported."""
-        from spectryn.cli.tui.app import check_textual_available
-
-        if not check_textual_available():
-            pytest.skip("Textual not available")
-
         # Just verify the function can be called with demo=True
         # Actual running would require Textual's test harness
-        from spectryn.cli.tui.app import SpectraTUI
-
         app = SpectraTUI(demo=True)
         assert app.state is not None
         assert len(app.state.stories) > 0
@@ -72,32 +65,26 @@ class TestRunTUIFunction:
 class TestDemoState:
     """Tests for demo state creation."""
 
-    def test_create_demo_state_returns_populated_state(self) -> None:
+    def test_create_demo_state_returns_populated_state(self, demo_state: TUIState) -> None:
         """Test demo state has all required fields."""
-        state = create_demo_state()
-
-        assert state.epic_key is not None
-        assert state.epic is not None
-        assert len(state.stories) >= 2
-        assert state.selected_story_id is not None
+        assert demo_state.epic_key is not None
+        assert demo_state.epic is not None
+        assert len(demo_state.stories) >= 2
+        assert demo_state.selected_story_id is not None
 
-    def test_demo_state_stories_have_variety(self) -> None:
+    def test_demo_state_stories_have_variety(self, demo_state: TUIState) -> None:
         """Test demo stories have varied attributes."""
-        state = create_demo_state()
-
-        statuses = {s.status for s in state.stories}
-        priorities = {s.priority for s in state.stories}
+        statuses = {s.status for s in demo_state.stories}
+        priorities = {s.priority for s in demo_state.stories}
 
         assert len(statuses) >= 2, "Demo should have varied statuses"
         assert len(priorities) >= 2, "Demo should have varied priorities"
 
-    def test_demo_state_selected_story_exists(self) -> None:
+    def test_demo_state_selected_story_exists(self, demo_state: TUIState) -> None:
         """Test that selected story exists in stories list."""
-        state = create_demo_state()
-
-        story = state.get_selected_story()
+        story = demo_state.get_selected_story()
         assert story is not None
-        assert str(story.id) == state.selected_story_id
+        assert str(story.id) == demo_state.selected_story_id
 
 
 class TestTUIStateExtendedFields:
@@ -13,7 +13,6 @@ from spectryn.cli.tui.data import (
     SyncProgress,
     SyncState,
     TUIState,
-    create_demo_state,
 )
 from spectryn.core.domain.entities import UserStory
 from spectryn.core.domain.enums import Priority, Status
@@ -307,28 +306,22 @@ class TestTUIState:
 class TestCreateDemoState:
     """Tests for create_demo_state function."""
 
-    def test_creates_valid_state(self) -> None:
+    def test_creates_valid_state(self, demo_state: TUIState) -> None:
         """Test that demo state is created with valid data."""
-        state = create_demo_state()
+        assert demo_state.epic_key is not None
+        assert demo_state.epic is not None
+        assert len(demo_state.stories) > 0
+        assert demo_state.selected_story_id is not None
 
-        assert state.epic_key is not None
-        assert state.epic is not None
-        assert len(state.stories) > 0
-        assert state.selected_story_id is not None
-
-    def test_demo_stories_have_varied_status(self) -> None:
+    def test_demo_stories_have_varied_status(self, demo_state: TUIState) -> None:
         """Test that demo stories have varied statuses."""
-        state = create_demo_state()
-
-        statuses = {s.status for s in state.stories}
+        statuses = {s.status for s in demo_state.stories}
         # Should have at least 2 different statuses
         assert len(statuses) >= 2
 
-    def test_demo_stories_have_external_keys(self) -> None:
+    def test_demo_stories_have_external_keys(self, demo_state: TUIState) -> None:
         """Test that some demo stories have external keys."""
-        state = create_demo_state()
-
-        with_keys = [s for s in state.stories if s.external_key]
+        with_keys = [s for s in demo_state.stories if s.external_key]
         assert len(with_keys) >= 1
 
 
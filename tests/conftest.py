@@ -55,7 +55,7 @@ def markdown_parser() -> MarkdownParser:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_markdown() -> str:
     """
     Sample markdown content with two user stories.
@@ -353,6 +353,9 @@ def mock_tracker():
         issue_type="Story",
     )
 
+    # Light reads follow whatever get_issue is configured to return
+    tracker.get_issue_light.side_effect = tracker.get_issue
+
     # Default operations
     tracker.update_issue_description.return_value = True
     tracker.create_subtask.return_value = "TEST-456"
@@ -361,6 +364,12 @@ def mock_tracker():
     tracker.transition_issue.return_value = True
     tracker.get_issue_comments.return_value = []
     tracker.get_epic_children.return_value = []
+    # Empty bulk results make the orchestrator fall back to per-issue fetches
+    tracker.get_issues_bulk.return_value = {}
+    tracker.get_issue_comments_bulk.return_value = {}
+    tracker.create_subtasks_bulk.side_effect = lambda subtasks: [
+        tracker.create_subtask(**subtask) for subtask in subtasks
+    ]
 
     return tracker
 
@@ -434,12 +443,20 @@ def mock_tracker_with_children():
         return issues.get(key, IssueData(key=key, summary="Unknown", status="Open"))
 
     tracker.get_issue.side_effect = get_issue_side_effect
+    tracker.get_issue_light.side_effect = tracker.get_issue
     tracker.update_issue_description.return_value = True
     tracker.create_subtask.return_value = "TEST-99"
     tracker.add_comment.return_value = True
     tracker.get_issue_comments.return_value = []
     tracker.get_issue_status.return_value = "Open"
     tracker.transition_issue.return_value = True
+    tracker.get_issues_bulk.side_effect = lambda keys, light=False: {
+        key: get_issue_side_effect(key) for key in keys
+    }
+    tracker.get_issue_comments_bulk.side_effect = lambda keys: {key: [] for key in keys}
+    tracker.create_subtasks_bulk.side_effect = lambda subtasks: [
+        tracker.create_subtask(**subtask) for subtask in subtasks
+    ]
 
     return tracker
 
@@ -636,14 +653,21 @@ def mock_formatter():
 # =============================================================================
 
 
-@pytest.fixture
-def hook_manager():
-    """Create a fresh HookManager instance."""
+@pytest.fixture(scope="session")
+def _session_hook_manager():
+    """Create the HookManager shared by the session."""
     from spectryn.plugins import HookManager
 
     return HookManager()
 
 
+@pytest.fixture
+def hook_manager(_session_hook_manager):
+    """Provide a HookManager with no registered hooks."""
+    _session_hook_manager.clear()
+    return _session_hook_manager
+
+
 # =============================================================================
 # Test CLI Args Fixture
 # =============================================================================
@@ -328,6 +328,12 @@ class TestUserStory:
         assert story.matches_title("gui state management")
         assert not story.matches_title("Something else")
 
+    def test_normalize_external_title_matches_normalize_title(self):
+        story = UserStory(id=StoryId("US-001"), title="GUI State Management (future)")
+        assert UserStory.normalize_external_title("GUI - State  Management") == (
+            story.normalize_title()
+        )
+
     def test_find_subtask(self):
         story = UserStory(
             id=StoryId("US-001"),
@@ -616,3 +622,82 @@ class TestSubtaskAdvanced:
         """Test subtask default status is PLANNED."""
         st = Subtask(name="Test")
         assert st.status == Status.PLANNED
+
+
+class TestEventBusHistory:
+    """Tests for EventBus history."""
+
+    def test_history_keeps_most_recent_events(self):
+        """Test that history is bounded to the newest events."""
+        from spectryn.core.domain.events import EventBus, StoryMatched
+
+        bus = EventBus(history_limit=2)
+        for story_id in ("US-001", "US-002", "US-003"):
+            bus.publish(StoryMatched(story_id=StoryId(story_id)))
+
+        history = bus.get_history()
+        assert [str(e.story_id) for e in history] == ["US-002", "US-003"]
+        assert list(bus.iter_history()) == history
+
+        bus.clear_history()
+        assert bus.get_history() == []
+
+    def test_history_unbounded_by_default(self):
+        """Test that the default history keeps every published event."""
+        from spectryn.core.domain.events import EventBus, StoryMatched
+
+        bus = EventBus()
+        for _ in range(20_000):
+            bus.publish(StoryMatched())
+
+        assert len(bus.get_history()) == 20_000
+
+    def test_history_disabled_with_zero_limit(self):
+        """Test that a zero history limit still dispatches but records nothing."""
+        from spectryn.core.domain.events import EventBus, StoryMatched
+
+        bus = EventBus(history_limit=0)
+        received: list[StoryMatched] = []
+        bus.subscribe(StoryMatched, received.append)
+        bus.publish(StoryMatched())
+
+        assert len(received) == 1
+        assert bus.get_history() == []
+
+    def test_publish_dispatches_to_handlers_subscribed_later(self):
+        """Test that handlers added after a publish still receive events."""
+        from spectryn.core.domain.events import DomainEvent, EventBus, StoryMatched
+
+        bus = EventBus()
+        received: list[str] = []
+        bus.subscribe(StoryMatched, lambda e: received.append("specific"))
+        bus.publish(StoryMatched())
+        bus.subscribe(DomainEvent, lambda e: received.append("catch-all"))
+        bus.publish(StoryMatched())
+
+        assert received == ["specific", "specific", "catch-all"]
+
+
+class TestDomainEvents:
+    """Tests for domain event records."""
+
+    def test_events_are_slotted_and_immutable(self):
+        """Test that events carry no per-instance dict and can't be modified."""
+        import dataclasses
+
+        from spectryn.core.domain.events import SubtaskCreated
+
+        event = SubtaskCreated(parent_key="PROJ-1", subtask_key="PROJ-2")
+
+        assert not hasattr(event, "__dict__")
+        assert dataclasses.asdict(event)["subtask_key"] == "PROJ-2"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.subtask_key = "PROJ-3"  # type: ignore[misc]
+
+    def test_event_ids_are_unique(self):
+        """Test that events get distinct ids without per-event uuids."""
+        from spectryn.core.domain.events import StoryMatched
+
+        ids = {StoryMatched().event_id for _ in range(100)}
+
+        assert len(ids) == 100
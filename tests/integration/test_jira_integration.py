@@ -14,6 +14,7 @@ Note: Common fixtures are imported from conftest.py:
 - mock_create_issue_response
 """
 
+import gc
 import json
 from unittest.mock import Mock, patch
 
@@ -60,6 +61,7 @@ class TestJiraApiClientIntegration:
             mock_response = Mock()
             mock_response.ok = True
             mock_response.text = json.dumps(mock_myself_response)
+            mock_response.content = json.dumps(mock_myself_response).encode()
             mock_response.json.return_value = mock_myself_response
             mock_response.headers = {}
             mock_request.return_value = mock_response
@@ -83,6 +85,7 @@ class TestJiraApiClientIntegration:
             mock_response = Mock()
             mock_response.ok = True
             mock_response.text = json.dumps(mock_myself_response)
+            mock_response.content = json.dumps(mock_myself_response).encode()
             mock_response.json.return_value = mock_myself_response
             mock_response.headers = {}
             mock_request.return_value = mock_response
@@ -154,6 +157,31 @@ class TestJiraApiClientIntegration:
             with pytest.raises(PermissionError):
                 client.get("issue/SECRET-123")
 
+    def test_generic_error_truncates_body(self, jira_config):
+        """Test other error responses include at most 500 bytes of the body."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+
+        with patch.object(client._session, "request") as mock_request:
+            mock_response = Mock()
+            mock_response.ok = False
+            mock_response.status_code = 400
+            mock_response.content = b"<html>" + b"x" * 1_000_000
+            mock_response.headers = {}
+            mock_request.return_value = mock_response
+
+            with pytest.raises(IssueTrackerError) as exc_info:
+                client.get("issue/TEST-1")
+
+        message = str(exc_info.value)
+        assert "API error 400: <html>" in message
+        assert "x" * 494 in message
+        assert "x" * 495 not in message
+
     def test_dry_run_skips_post(self, jira_config):
         """Test dry_run mode skips POST requests (except search)."""
         client = JiraApiClient(
@@ -182,6 +210,7 @@ class TestJiraApiClientIntegration:
             mock_response = Mock()
             mock_response.ok = True
             mock_response.text = json.dumps(mock_epic_children_response)
+            mock_response.content = json.dumps(mock_epic_children_response).encode()
             mock_response.json.return_value = mock_epic_children_response
             mock_response.headers = {}
             mock_request.return_value = mock_response
@@ -191,6 +220,63 @@ class TestJiraApiClientIntegration:
             assert result["total"] == 2
             mock_request.assert_called_once()
 
+    def test_search_jql_all_fetches_remaining_pages_in_parallel(self, jira_config):
+        """Test that pages after the first are fetched by startAt window, in order."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+
+        def fake_search(jql, fields, max_results=100, start_at=0):
+            keys = range(start_at, min(start_at + max_results, 250))
+            return {"issues": [{"key": f"TEST-{k}"} for k in keys], "total": 250}
+
+        with patch.object(client, "search_jql", side_effect=fake_search) as mock_search:
+            issues = client.search_jql_all("parent = TEST-1", ["summary"], page_size=100)
+
+        assert [issue["key"] for issue in issues] == [f"TEST-{k}" for k in range(250)]
+        start_ats = sorted(c.kwargs.get("start_at", 0) for c in mock_search.call_args_list)
+        assert start_ats == [0, 100, 200]
+
+    def test_search_jql_all_follows_server_page_cap(self, jira_config):
+        """Test that windows follow a page size capped by the server."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+
+        def capped_search(jql, fields, max_results=100, start_at=0):
+            keys = range(start_at, min(start_at + min(max_results, 50), 120))
+            return {"issues": [{"key": f"TEST-{k}"} for k in keys], "total": 120}
+
+        with patch.object(client, "search_jql", side_effect=capped_search) as mock_search:
+            issues = client.search_jql_all("parent = TEST-1", ["summary"], page_size=100)
+
+        assert [issue["key"] for issue in issues] == [f"TEST-{k}" for k in range(120)]
+        start_ats = sorted(c.kwargs.get("start_at", 0) for c in mock_search.call_args_list)
+        assert start_ats == [0, 50, 100]
+
+    def test_search_jql_all_single_page(self, jira_config):
+        """Test that no extra requests are made when everything fits in one page."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+
+        with patch.object(
+            client, "search_jql", return_value={"issues": [{"key": "TEST-1"}], "total": 1}
+        ) as mock_search:
+            issues = client.search_jql_all("parent = TEST-1", ["summary"])
+
+        assert issues == [{"key": "TEST-1"}]
+        mock_search.assert_called_once()
+
     def test_connection_test_success(self, jira_config, mock_myself_response):
         """Test connection test returns True on success."""
         client = JiraApiClient(
@@ -204,6 +290,7 @@ class TestJiraApiClientIntegration:
             mock_response = Mock()
             mock_response.ok = True
             mock_response.text = json.dumps(mock_myself_response)
+            mock_response.content = json.dumps(mock_myself_response).encode()
             mock_response.json.return_value = mock_myself_response
             mock_response.headers = {}
             mock_request.return_value = mock_response
@@ -260,6 +347,7 @@ class TestRetryLogic:
             mock_success.ok = True
             mock_success.status_code = 200
             mock_success.text = json.dumps(mock_myself_response)
+            mock_success.content = json.dumps(mock_myself_response).encode()
             mock_success.json.return_value = mock_myself_response
             mock_success.headers = {}
 
@@ -291,6 +379,7 @@ class TestRetryLogic:
             mock_success.ok = True
             mock_success.status_code = 200
             mock_success.text = json.dumps(mock_myself_response)
+            mock_success.content = json.dumps(mock_myself_response).encode()
             mock_success.json.return_value = mock_myself_response
             mock_success.headers = {}
 
@@ -326,6 +415,7 @@ class TestRetryLogic:
             mock_success.ok = True
             mock_success.status_code = 200
             mock_success.text = json.dumps(mock_myself_response)
+            mock_success.content = json.dumps(mock_myself_response).encode()
             mock_success.json.return_value = mock_myself_response
             mock_success.headers = {}
 
@@ -335,6 +425,8 @@ class TestRetryLogic:
 
             assert result["accountId"] == "user-123-abc"
             assert mock_request.call_count == 2
+            # Other callers stay paused for the Retry-After delay the client slept
+            assert client.rate_limiter.try_acquire() is False
 
     def test_retry_on_503_service_unavailable(self, jira_config, mock_myself_response):
         """Test that 503 service unavailable triggers retry."""
@@ -358,6 +450,7 @@ class TestRetryLogic:
             mock_success.ok = True
             mock_success.status_code = 200
             mock_success.text = json.dumps(mock_myself_response)
+            mock_success.content = json.dumps(mock_myself_response).encode()
             mock_success.json.return_value = mock_myself_response
             mock_success.headers = {}
 
@@ -676,6 +769,20 @@ class TestJiraRateLimiter:
         # Rate should be reduced by 50%
         assert limiter.requests_per_second == original_rate * 0.5
 
+    def test_pause_holds_other_callers(self):
+        """Test that pause() holds every caller except one that ignores it."""
+        limiter = JiraRateLimiter(requests_per_second=1000.0, burst_size=5)
+
+        limiter.pause(1.0)
+
+        assert limiter.try_acquire() is False
+        assert limiter.acquire(timeout=0.05) is False
+        # The caller that paused has already waited out its own retry delay
+        assert limiter.acquire(timeout=0.05, ignore_pause=True) is True
+
+        limiter.reset()
+        assert limiter.try_acquire() is True
+
     def test_thread_safety(self):
         """Test that rate limiter is thread-safe."""
         import threading
@@ -762,6 +869,7 @@ class TestRateLimitingIntegration:
             mock_response.ok = True
             mock_response.status_code = 200
             mock_response.text = json.dumps(mock_myself_response)
+            mock_response.content = json.dumps(mock_myself_response).encode()
             mock_response.json.return_value = mock_myself_response
             mock_response.headers = {}
             mock_request.return_value = mock_response
@@ -801,6 +909,7 @@ class TestRateLimitingIntegration:
             mock_success.ok = True
             mock_success.status_code = 200
             mock_success.text = json.dumps(mock_myself_response)
+            mock_success.content = json.dumps(mock_myself_response).encode()
             mock_success.json.return_value = mock_myself_response
             mock_success.headers = {}
 
@@ -884,6 +993,101 @@ class TestConnectionPooling:
         # Should not raise
         client.close()
 
+    def test_session_shared_across_clients(self, jira_config):
+        """Test that clients for the same site and credentials share one session."""
+        first = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+        second = JiraApiClient(
+            base_url=jira_config.url + "/",
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+        other = JiraApiClient(
+            base_url=jira_config.url,
+            email="someone-else@example.com",
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+
+        try:
+            assert first._session is second._session
+            assert other._session is not first._session
+        finally:
+            first.close()
+            second.close()
+            other.close()
+
+    def test_shared_session_closed_by_last_client(self, jira_config):
+        """Test that the shared session stays open until its last client closes."""
+        # Use a dedicated site so sessions leaked by other tests don't interfere
+        base_url = "https://refcount-test.atlassian.net"
+        first = JiraApiClient(
+            base_url=base_url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+        second = JiraApiClient(
+            base_url=base_url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+        session = first._session
+
+        with patch.object(session, "close") as mock_close:
+            first.close()
+            first.close()  # Closing twice must not release the session again
+            mock_close.assert_not_called()
+
+            second.close()
+            mock_close.assert_called_once()
+
+        third = JiraApiClient(
+            base_url=base_url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+        assert third._session is not session
+        third.close()
+
+    def test_session_registry_hides_token_and_evicts(self, jira_config):
+        """Test that the registry key omits the token and unreferenced sessions are evicted."""
+        base_url = "https://registry.atlassian.net"
+        client = JiraApiClient(
+            base_url=base_url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+        keys = [key for key in JiraApiClient._SESSIONS if key[0] == base_url]
+        assert len(keys) == 1
+        assert jira_config.api_token not in str(keys[0])
+
+        client.close()
+        assert keys[0] not in JiraApiClient._SESSIONS
+        assert keys[0] not in JiraApiClient._SESSION_REFS
+
+        # A client dropped without close() releases its session when collected
+        client = JiraApiClient(
+            base_url=base_url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+        )
+        session = client._session
+        with patch.object(session, "close") as mock_close:
+            del client
+            gc.collect()
+            mock_close.assert_called_once()
+        assert keys[0] not in JiraApiClient._SESSIONS
+
     def test_context_manager(self, jira_config, mock_myself_response):
         """Test that client works as context manager."""
         with JiraApiClient(
@@ -899,6 +1103,7 @@ class TestConnectionPooling:
                 mock_response.ok = True
                 mock_response.status_code = 200
                 mock_response.text = json.dumps(mock_myself_response)
+                mock_response.content = json.dumps(mock_myself_response).encode()
                 mock_response.json.return_value = mock_myself_response
                 mock_response.headers = {}
                 mock_request.return_value = mock_response
@@ -923,6 +1128,7 @@ class TestConnectionPooling:
             mock_response.ok = True
             mock_response.status_code = 200
             mock_response.text = json.dumps(mock_myself_response)
+            mock_response.content = json.dumps(mock_myself_response).encode()
             mock_response.json.return_value = mock_myself_response
             mock_response.headers = {}
             mock_request.return_value = mock_response
@@ -948,6 +1154,7 @@ class TestConnectionPooling:
             mock_response.ok = True
             mock_response.status_code = 200
             mock_response.text = json.dumps(mock_myself_response)
+            mock_response.content = json.dumps(mock_myself_response).encode()
             mock_response.json.return_value = mock_myself_response
             mock_response.headers = {}
             mock_request.return_value = mock_response
@@ -965,6 +1172,204 @@ class TestConnectionPooling:
 # =============================================================================
 
 
+class TestConditionalRequests:
+    """Tests for ETag-based conditional GET requests."""
+
+    @staticmethod
+    def _response(status_code, body=b"", etag=None):
+        response = Mock()
+        response.ok = status_code < 400
+        response.status_code = status_code
+        response.content = body
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    def test_repeated_get_revalidates_with_etag(self, jira_config):
+        """Test that a 304 reply is served from the previously seen body."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+            requests_per_second=None,
+        )
+        body = json.dumps({"fields": {"status": {"name": "Open"}}}).encode()
+
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                self._response(200, body, etag='W/"v1"'),
+                self._response(304),
+            ]
+
+            first = client.get("issue/TEST-1", params={"fields": "status"})
+            second = client.get("issue/TEST-1", params={"fields": "status"})
+
+        assert first == second == {"fields": {"status": {"name": "Open"}}}
+        assert "headers" not in mock_request.call_args_list[0].kwargs
+        assert mock_request.call_args_list[1].kwargs["headers"]["If-None-Match"] == 'W/"v1"'
+
+    def test_etag_is_scoped_to_params(self, jira_config):
+        """Test that the ETag for one field projection isn't reused for another."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+            requests_per_second=None,
+        )
+
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                self._response(200, b'{"key": "TEST-1"}', etag='"v1"'),
+                self._response(200, b'{"key": "TEST-1"}'),
+            ]
+
+            client.get("issue/TEST-1", params={"fields": "status"})
+            client.get("issue/TEST-1", params={"fields": "summary"})
+
+        assert "headers" not in mock_request.call_args_list[1].kwargs
+
+    def test_etag_cache_is_bounded(self, jira_config):
+        """Test that the least recently used ETags are evicted."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+            requests_per_second=None,
+        )
+        client.DEFAULT_ETAG_CACHE_SIZE = 2
+
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                self._response(200, b"{}", etag=f'"v{i}"') for i in range(3)
+            ]
+            for i in range(3):
+                client.get(f"issue/TEST-{i}")
+
+        assert [key[0] for key in client._etag_cache] == ["issue/TEST-1", "issue/TEST-2"]
+
+
+class TestRawGet:
+    """Tests for the lightweight urllib3 GET path."""
+
+    @pytest.fixture
+    def client(self, jira_config):
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=False,
+            requests_per_second=None,
+        )
+        client._pool = Mock()
+        return client
+
+    @staticmethod
+    def _pool_response(status, data=b"", etag=None):
+        response = Mock()
+        response.status = status
+        response.data = data
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    def test_raw_get_parses_success(self, client):
+        """Test that a successful response is parsed without the requests session."""
+        client._pool.request.return_value = self._pool_response(
+            200, b'{"fields": {"status": {"name": "Open"}}}'
+        )
+
+        with patch.object(client._session, "request") as mock_session_request:
+            result = client.raw_get("issue/TEST-1", params={"fields": "status"})
+
+        assert result == {"fields": {"status": {"name": "Open"}}}
+        mock_session_request.assert_not_called()
+        call = client._pool.request.call_args
+        assert call.args == ("GET", f"{client.api_url}/issue/TEST-1")
+        assert call.kwargs["fields"] == {"fields": "status"}
+        assert call.kwargs["headers"]["authorization"].startswith("Basic ")
+
+    def test_raw_get_revalidates_with_etag(self, client):
+        """Test that a 304 reply is served from the previously seen body."""
+        client._pool.request.side_effect = [
+            self._pool_response(200, b'{"key": "TEST-1"}', etag='"v1"'),
+            self._pool_response(304),
+        ]
+
+        assert client.raw_get("issue/TEST-1") == {"key": "TEST-1"}
+        assert client.raw_get("issue/TEST-1") == {"key": "TEST-1"}
+        assert client._pool.request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    def test_raw_get_maps_error_status_without_resending(self, client):
+        """Test that error responses are mapped to typed errors from the pool's reply."""
+        client._pool.request.return_value = self._pool_response(404, b"Not found")
+
+        with patch.object(client, "get") as mock_get:
+            with pytest.raises(NotFoundError):
+                client.raw_get("issue/TEST-404")
+
+        mock_get.assert_not_called()
+        client._pool.request.assert_called_once()
+
+    def test_raw_get_backs_off_on_rate_limit(self, client):
+        """Test that a 429 reaches the rate limiter and is retried after its Retry-After."""
+        client._rate_limiter = Mock()
+        client.jitter = 0.0
+        client._pool.request.return_value = Mock(status=429, data=b"", headers={"Retry-After": "2"})
+
+        with (
+            patch.object(client, "get", return_value={"key": "TEST-1"}) as mock_get,
+            patch("time.sleep") as mock_sleep,
+        ):
+            assert client.raw_get("issue/TEST-1") == {"key": "TEST-1"}
+
+        (response,) = client._rate_limiter.update_from_response.call_args.args
+        assert response.status_code == 429
+        client._rate_limiter.pause.assert_called_once_with(2.0)
+        mock_sleep.assert_called_once_with(2.0)
+        mock_get.assert_called_once_with("issue/TEST-1", params=None)
+
+    def test_raw_get_uses_session_behind_proxy(self, client, monkeypatch):
+        """Test that a configured proxy routes raw GETs through the session."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        client._pool = None
+
+        with patch.object(client, "get", return_value={"key": "TEST-1"}) as mock_get:
+            assert client.raw_get("issue/TEST-1") == {"key": "TEST-1"}
+            assert client.raw_get("issue/TEST-1") == {"key": "TEST-1"}
+
+        assert mock_get.call_count == 2
+        assert client._pool is None
+
+    def test_raw_get_pool_uses_ca_bundle_override(self, client, monkeypatch, tmp_path):
+        """Test that the pool verifies TLS against the session's CA bundle override."""
+        bundle = tmp_path / "ca.pem"
+        bundle.write_text("")
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", str(bundle))
+        for name in ("HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        client._pool = None
+
+        with patch("urllib3.PoolManager") as mock_pool_manager:
+            mock_pool_manager.return_value.request.return_value = self._pool_response(200, b"{}")
+            assert client.raw_get("issue/TEST-1") == {}
+
+        kwargs = mock_pool_manager.call_args.kwargs
+        assert kwargs["cert_reqs"] == "CERT_REQUIRED"
+        assert kwargs["ca_certs"] == str(bundle)
+
+    def test_raw_get_falls_back_on_connection_error(self, client):
+        """Test that connection failures are retried through get()."""
+        import urllib3
+
+        client._pool.request.side_effect = urllib3.exceptions.NewConnectionError(None, "refused")
+
+        with patch.object(client, "get", return_value={"key": "TEST-1"}) as mock_get:
+            assert client.raw_get("issue/TEST-1") == {"key": "TEST-1"}
+
+        mock_get.assert_called_once()
+
+
 class TestJiraAdapterIntegration:
     """Integration tests for JiraAdapter with mocked client."""
 
@@ -1074,7 +1479,7 @@ class TestJiraAdapterIntegration:
 
     def test_get_issue_status(self, adapter):
         """Test get_issue_status extracts status name."""
-        with patch.object(adapter._client, "get") as mock_get:
+        with patch.object(adapter._client, "raw_get") as mock_get:
             mock_get.return_value = {"fields": {"status": {"name": "In Progress"}}}
 
             status = adapter.get_issue_status("TEST-123")
@@ -1253,7 +1658,7 @@ class TestErrorHandlingIntegration:
         """Test transition logs warning for unknown status."""
         adapter = JiraAdapter(config=jira_config, dry_run=False)
 
-        with patch.object(adapter._client, "get") as mock_get:
+        with patch.object(adapter._client, "raw_get") as mock_get:
             mock_get.return_value = {"fields": {"status": {"name": "Open"}}}
 
             result = adapter.transition_issue("TEST-123", "InvalidStatus")
@@ -159,6 +159,15 @@ class TestPlugin:
 
         assert errors == []
 
+    def test_validate_config_revalidation_sees_config_changes(self):
+        """Test that repeated validation reflects the current config."""
+        plugin = ConcretePlugin()
+        assert plugin.validate_config() == ["Missing required config: required_field"]
+
+        plugin.config["required_field"] = "value"
+
+        assert plugin.validate_config() == []
+
 
 class ConcreteParserPlugin(ParserPlugin):
     """Concrete parser plugin for testing."""
@@ -1,5 +1,7 @@
 """Tests for plugin hook system."""
 
+import pytest
+
 from spectryn.plugins import (
     Hook,
     HookContext,
@@ -7,6 +9,10 @@ from spectryn.plugins import (
 )
 
 
+# Pure in-memory unit tests (select with -m fast)
+pytestmark = pytest.mark.fast
+
+
 class TestHookContext:
     """Tests for HookContext."""
 
@@ -83,39 +89,45 @@ class TestHookManager:
 
         assert results == [42]
 
-    def test_trigger_priority_order(self, hook_manager):
-        order = []
-
-        hook_manager.register(
-            Hook("last", HookPoint.BEFORE_SYNC, lambda x: order.append("last"), priority=100)
-        )
-        hook_manager.register(
-            Hook("first", HookPoint.BEFORE_SYNC, lambda x: order.append("first"), priority=10)
-        )
-        hook_manager.register(
-            Hook("middle", HookPoint.BEFORE_SYNC, lambda x: order.append("middle"), priority=50)
-        )
-
-        hook_manager.trigger(HookPoint.BEFORE_SYNC)
-
-        assert order == ["first", "middle", "last"]
-
-    def test_trigger_cancel(self, hook_manager):
-        order = []
-
-        def cancel_hook(ctx):
-            order.append("cancel")
-            ctx.cancel()
-
-        hook_manager.register(Hook("cancel", HookPoint.BEFORE_SYNC, cancel_hook, priority=10))
-        hook_manager.register(
-            Hook("after", HookPoint.BEFORE_SYNC, lambda x: order.append("after"), priority=20)
-        )
-
-        ctx = hook_manager.trigger(HookPoint.BEFORE_SYNC)
-
-        assert ctx.cancelled
-        assert order == ["cancel"]  # "after" was not called
+    def test_trigger_priority_order_and_cancel(self, hook_manager):
+        def recorder(order, name, cancels):
+            def handler(ctx):
+                order.append(name)
+                if cancels:
+                    ctx.cancel()
+
+            return handler
+
+        # (hooks as (name, priority, cancels), expected call order, expected cancelled)
+        cases = [
+            (
+                [("last", 100, False), ("first", 10, False), ("middle", 50, False)],
+                ["first", "middle", "last"],
+                False,
+            ),
+            # "after" is not called once "cancel" cancels the operation
+            ([("cancel", 10, True), ("after", 20, False)], ["cancel"], True),
+        ]
+        for hooks, expected_order, expected_cancelled in cases:
+            hook_manager.clear(HookPoint.BEFORE_SYNC)
+            order = []
+            for name, priority, cancels in hooks:
+                handler = recorder(order, name, cancels)
+                hook_manager.register(Hook(name, HookPoint.BEFORE_SYNC, handler, priority=priority))
+
+            ctx = hook_manager.trigger(HookPoint.BEFORE_SYNC)
+
+            assert order == expected_order
+            assert ctx.cancelled is expected_cancelled
+
+    def test_equal_priority_keeps_registration_order(self, hook_manager):
+        for name in ("a", "b", "c"):
+            hook_manager.register(Hook(name, HookPoint.BEFORE_SYNC, lambda x: None))
+        hook_manager.register(Hook("early", HookPoint.BEFORE_SYNC, lambda x: None, priority=1))
+
+        names = [h.name for h in hook_manager.get_hooks(HookPoint.BEFORE_SYNC)]
+
+        assert names == ["early", "a", "b", "c"]
 
     def test_decorator(self, hook_manager):
         results = []
@@ -156,6 +168,23 @@ class TestHookManager:
         assert len(hook_manager.get_hooks(HookPoint.BEFORE_SYNC)) == 0
         assert len(hook_manager.get_hooks(HookPoint.BEFORE_MATCH)) == 1
 
+    def test_unregister_shared_name_removes_first_in_order(self, hook_manager):
+        hook_manager.register(Hook("dup", HookPoint.AFTER_SYNC, lambda x: x))
+        hook_manager.register(Hook("dup", HookPoint.BEFORE_SYNC, lambda x: x, priority=50))
+        hook_manager.register(Hook("dup", HookPoint.BEFORE_SYNC, lambda x: x, priority=10))
+
+        assert hook_manager.unregister("dup")
+
+        assert [h.priority for h in hook_manager.get_hooks(HookPoint.BEFORE_SYNC)] == [50]
+        assert len(hook_manager.get_hooks(HookPoint.AFTER_SYNC)) == 1
+
+    def test_unregister_after_clear(self, hook_manager):
+        hook_manager.register(Hook("sync", HookPoint.BEFORE_SYNC, lambda x: x))
+
+        hook_manager.clear(HookPoint.BEFORE_SYNC)
+
+        assert not hook_manager.unregister("sync")
+
     def test_clear_all(self, hook_manager):
         hook_manager.register(Hook("sync", HookPoint.BEFORE_SYNC, lambda x: x))
         hook_manager.register(Hook("match", HookPoint.BEFORE_MATCH, lambda x: x))